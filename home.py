@@ -1,4 +1,14 @@
 import streamlit as st
+from utils.profiling import profiler
+from utils.services import (
+    get_answer_log, get_concurrency_lab_pool, get_event_loop_service, get_factorial_service, get_fibonacci_service,
+    get_generator_sessions, get_lab_worker_pool, get_lesson, get_progress_store, get_search_index, get_session_store,
+    get_virtual_fs_registry, get_worker_pool,
+)
+from utils.ui import current_learner
+
+# Static lesson text and code, parsed once per server from content/home.md
+lesson = get_lesson("home")
 
 # Set up the page title
 st.set_page_config(page_title="Interactive Python Learning", layout="centered")
@@ -7,12 +17,53 @@ st.set_page_config(page_title="Interactive Python Learning", layout="centered")
 st.title("Welcome to the Interactive Python Learning Platform!")
 
 # Add a brief description or introduction
-st.markdown("""
-This platform will guide you through all the essential Python topics, 
-helping you learn step by step with interactive examples and exercises. 
-Click on a topic to explore.
-""")
+lesson.show("intro")
+
+# Search every lesson, section by section
+query = st.text_input("🔍 Search the lessons", placeholder="e.g. deque, yield, re.sub")
+if query:
+    hits = get_search_index().search(query)
+    if not hits:
+        st.info("No lesson mentions that yet.")
+    for hit in hits:
+        st.page_link(hit.path, label=f"{hit.page_title} › {hit.title}")
+        if hit.snippet:
+            st.caption(hit.snippet)
+
+# The learner's saved progress; the id in the URL brings it back after a refresh
+progress = get_progress_store().load(current_learner())
+try_its_done = sum(1 for item, done in progress.items() if item.startswith("try:") and done)
+quiz_answers = [correct for item, correct in progress.items() if item.startswith("quiz:")]
+st.subheader("📈 Your Progress")
+st.write(f"Try It sections done: **{try_its_done}**")
+st.write(f"Quiz questions answered correctly: **{sum(quiz_answers)}** of {len(quiz_answers)}")
 
+# Server status, for whoever runs the platform
+with st.expander("🖥️ Server status"):
+    st.write("**Learner sessions**")
+    st.json(get_session_store().stats())
+    st.write("**Code-execution workers**")
+    st.json(get_worker_pool().stats())
+    st.write("**Measurement workers**")
+    st.json(get_lab_worker_pool().stats())
+    st.write("**Concurrency lab worker**")
+    st.json(get_concurrency_lab_pool().stats())
+    st.write("**Quiz answers**")
+    st.json(get_answer_log().stats())
+    st.write("**Learner progress**")
+    st.json(get_progress_store().stats())
+    st.write("**Live generators**")
+    st.json(get_generator_sessions().stats())
+    st.write("**Learners' in-memory files**")
+    st.json(get_virtual_fs_registry().stats())
+    st.write("**Factorial results**")
+    st.json(get_factorial_service().stats())
+    st.write("**Fibonacci terms cache**")
+    st.json(get_fibonacci_service().stats())
+    st.write("**Background event loop**")
+    st.json(get_event_loop_service().stats())
+    st.write("**Interactive handlers, by total time**")
+    st.json(profiler.summary())
 
 # Footer
 st.markdown("""
@@ -1,166 +1,127 @@
 import streamlit as st
+from utils.comprehension_bench import CASES, SIZES
+from utils.multiplication import MultiplicationTable
+from utils.profiling import profiled
+from utils.services import get_benchmark_service, get_lesson
+from utils.ui import poll_jobs, show_grid_window, show_quiz, show_sequence_window, show_try_it
+from utils.workers import PoolBusy
+
+# Static lesson text and code, parsed once per server from content/12_comprehensions.md
+lesson = get_lesson("12_comprehensions")
 
 # Page Title
 st.title("Comprehensions 🎨")
-st.markdown("""
-Python comprehensions are a concise way to create lists, dictionaries, sets, and generators.  
-They make your code cleaner, more efficient, and easier to read. Let’s explore comprehensions interactively! 🚀
-""")
+lesson.show("intro")
 
 # Section 1: What Are Comprehensions?
-st.markdown("## 🔹 What Are Comprehensions?")
-st.write("""
-Comprehensions are constructs in Python that allow you to create new collections (like lists or dictionaries) in a single line of code.  
-They are compact, expressive, and often faster than loops.
-""")
-
-st.markdown("### Why Use Comprehensions?")
-st.write("""
-- **Compact Code**: Create collections in one line.
-- **Performance**: Comprehensions are optimized for Python’s internals.
-- **Readability**: They make intentions clear to readers.
-""")
+lesson.show("what-are-comprehensions")
 
 # Section 2: List Comprehensions
-st.markdown("## 🔹 List Comprehensions")
-st.write("""
-List comprehensions are a concise way to create lists. The syntax is:  
-`[expression for item in iterable if condition]`
-""")
-
-st.markdown("### Example:")
-st.code("""
-# Without list comprehension
-squares = []
-for i in range(10):
-    squares.append(i**2)
-
-# With list comprehension
-squares = [i**2 for i in range(10)]
-print(squares)  # Output: [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
-""")
+lesson.show("list-comprehensions")
 
 # Interactive Example: Generate a List of Squares
-st.markdown("### 🧪 Try It: Generate a List of Squares")
-n = st.number_input("Enter the range of numbers:", min_value=1, value=10)
+show_try_it(lesson, "try-generate-a-list-of-squares")
+# The list, dict and set below are built and written out whole, so their
+# size is capped; the generator example further down has its own n
+n = st.number_input("Enter the range of numbers:", min_value=1, max_value=1000, value=10)
 squares = [i**2 for i in range(n)]
 st.write(f"Squares: {squares}")
 
 # Section 3: Dictionary Comprehensions
-st.markdown("## 🔹 Dictionary Comprehensions")
-st.write("""
-Dictionary comprehensions are used to create dictionaries in a compact way. The syntax is:  
-`{key_expression: value_expression for item in iterable if condition}`
-""")
-
-st.markdown("### Example:")
-st.code("""
-# Without dictionary comprehension
-num_dict = {}
-for i in range(5):
-    num_dict[i] = i**2
-
-# With dictionary comprehension
-num_dict = {i: i**2 for i in range(5)}
-print(num_dict)  # Output: {0: 0, 1: 1, 2: 4, 3: 9, 4: 16}
-""")
+lesson.show("dictionary-comprehensions")
 
 # Interactive Example: Generate a Dictionary of Squares
-st.markdown("### 🧪 Try It: Create a Dictionary of Squares")
+show_try_it(lesson, "try-create-a-dictionary-of-squares")
 num_dict = {i: i**2 for i in range(n)}
 st.write(f"Number Dictionary: {num_dict}")
 
 # Section 4: Set Comprehensions
-st.markdown("## 🔹 Set Comprehensions")
-st.write("""
-Set comprehensions are used to create sets in a concise manner. The syntax is:  
-`{expression for item in iterable if condition}`
-""")
-
-st.markdown("### Example:")
-st.code("""
-# Without set comprehension
-unique_squares = set()
-for i in range(10):
-    unique_squares.add(i**2)
-
-# With set comprehension
-unique_squares = {i**2 for i in range(10)}
-print(unique_squares)  # Output: {0, 1, 4, 9, 16, 25, 36, 49, 64, 81}
-""")
+lesson.show("set-comprehensions")
 
 # Interactive Example: Generate a Set of Unique Squares
-st.markdown("### 🧪 Try It: Create a Set of Unique Squares")
+show_try_it(lesson, "try-create-a-set-of-unique-squares")
 unique_squares = {i**2 for i in range(n)}
 st.write(f"Unique Squares Set: {unique_squares}")
 
 # Section 5: Generator Expressions
-st.markdown("## 🔹 Generator Expressions")
-st.write("""
-Generator expressions are like comprehensions but for generating values lazily (one at a time).  
-They use `()` instead of `[]` or `{}`. The syntax is:  
-`(expression for item in iterable if condition)`
-""")
-
-st.markdown("### Example:")
-st.code("""
-# Without generator expression
-def generate_squares(n):
-    for i in range(n):
-        yield i**2
-
-# With generator expression
-squares_gen = (i**2 for i in range(10))
-print(list(squares_gen))  # Output: [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
-""")
+lesson.show("generator-expressions")
 
 # Interactive Example: Generate Squares Lazily
-st.markdown("### 🧪 Try It: Use a Generator Expression")
-squares_gen = (i**2 for i in range(n))
+show_try_it(lesson, "try-use-a-generator-expression")
+gen_n = st.number_input("Number of values to generate:", min_value=1, value=100_000)
 st.write("Generated Values:")
-for _ in range(n):
-    st.write(next(squares_gen))
+# Only one page of values is generated and shown at a time, however large n is
+show_sequence_window("squares_gen", lambda n: (i**2 for i in range(n)), gen_n, length=gen_n)
 
 # Section 6: Nested Comprehensions
-st.markdown("## 🔹 Nested Comprehensions")
-st.write("""
-Comprehensions can be nested for more complex operations.  
-For example, creating a multiplication table using nested comprehensions:
-""")
-st.code("""
-table = [[i * j for j in range(1, 6)] for i in range(1, 6)]
-print(table)  # Output: Multiplication table from 1 to 5
-""")
+lesson.show("nested-comprehensions")
 
 # Interactive Example: Multiplication Table
-st.markdown("### 🧪 Try It: Generate a Multiplication Table")
-table_size = st.number_input("Enter table size:", min_value=1, value=5)
-multiplication_table = [[i * j for j in range(1, table_size + 1)] for i in range(1, table_size + 1)]
+show_try_it(lesson, "try-generate-a-multiplication-table")
+table_size = st.number_input("Enter table size:", min_value=1, max_value=10_000, value=5)
+# Same numbers as [[i * j for j in ...] for i in ...], but only the block on
+# screen is computed, with NumPy, so even a 10,000 x 10,000 table is cheap
+multiplication_table = MultiplicationTable(table_size)
 st.write("Multiplication Table:")
-st.table(multiplication_table)
-
-# Section 7: Quiz
-st.markdown("## 🎮 Quiz: Test Your Knowledge!")
-quiz_question = st.radio(
-    "What does this list comprehension do?",
-    options=[
-        "[x for x in range(10) if x % 2 == 0]",
-        "{x: x**2 for x in range(5)}",
-        "(x**2 for x in range(5))"
-    ]
+show_grid_window("multiplication-table", multiplication_table)
+
+# Interactive Lab: time the examples above four ways, in worker processes
+show_try_it(lesson, "try-benchmark-loops-vs-comprehensions")
+bench_case = st.selectbox("Example to benchmark:", list(CASES))
+bench_sizes = st.multiselect(
+    "Sizes (n):" if bench_case != "multiplication_table" else "Table sizes (n x n):",
+    SIZES[bench_case], default=list(SIZES[bench_case][:4]),
 )
-st.code("""
-[expression for item in iterable if condition]
-""")
+bench_repeats = st.slider("Repeats:", min_value=3, max_value=20, value=5)
+if st.button("Run Benchmark"):
+    with profiled("12_comprehensions:Run Benchmark"):
+        # Finished measurements are cached by their parameters, so only new ones run
+        try:
+            st.session_state.comprehension_bench = (
+                bench_case,
+                [(n, get_benchmark_service().measure(bench_case, n, bench_repeats)) for n in sorted(bench_sizes)],
+            )
+        except PoolBusy as e:
+            st.error(f"Error: {e}")
+
+comprehension_bench = st.session_state.get("comprehension_bench")
+bench_jobs = [job for _, job in comprehension_bench[1]] if comprehension_bench else []
+
+@poll_jobs(*bench_jobs)
+def show_benchmark():
+    case, jobs = st.session_state.comprehension_bench
+    points = []
+    for n, job in jobs:
+        if job.done() and job.ok:
+            for version, timing in job.result.items():
+                points.append({"n": n, "Version": version, **{key: timing[key] * 1e6 for key in ("mean", "low", "high")}})
+        elif job.done():
+            st.error(f"n = {n:,}: {job.error}")
+    pending = sum(not job.done() for _, job in jobs)
+    if pending:
+        st.info(f"⏳ {pending} sizes still running...")
+    if points:
+        x = {"field": "n", "type": "quantitative", "scale": {"type": "log"}, "title": "n"}
+        st.vega_lite_chart({
+            "title": f"{case}: time per call (µs), mean and 95% confidence interval",
+            "data": {"values": points},
+            "encoding": {"x": x, "color": {"field": "Version", "type": "nominal"}},
+            "layer": [
+                {"mark": {"type": "line", "point": True},
+                 "encoding": {"y": {"field": "mean", "type": "quantitative", "scale": {"type": "log"}, "title": "µs per call"}}},
+                {"mark": "errorbar", "encoding": {"y": {"field": "low", "type": "quantitative"}, "y2": {"field": "high"}}},
+            ],
+        }, width="stretch")
+
+if comprehension_bench:
+    show_benchmark()
 
-if st.button("Submit Quiz Answer"):
-    if quiz_question == "[x for x in range(10) if x % 2 == 0]":
-        st.success("🎉 Correct! This generates a list of even numbers.")
-    else:
-        st.error("❌ Incorrect. Try to understand the syntax again!")
+# Section 7: Quiz
+lesson.show("quiz-test-your-knowledge")
+show_quiz("12_comprehensions")
 
 # Section 8: Summary Table
-st.markdown("## 📚 Summary")
+lesson.show("summary")
 summary_table = {
     "Type": ["List Comprehension", "Dictionary Comprehension", "Set Comprehension", "Generator Expression"],
     "Syntax": [
@@ -179,8 +140,4 @@ summary_table = {
 st.table(summary_table)
 
 # Footer
-st.markdown("""
----
-Made with ❤️ to help you master **Comprehensions in Python**.  
-Happy coding and keep exploring! 🚀  
-""")
+lesson.show("footer")
@@ -1,67 +1,37 @@
 import streamlit as st
+import functools
+from utils.big_numbers import Previewer, digit_count, preview
+from utils.memory_lab import EXAMPLES, MAX_N, VARIANTS, measure
+from utils.profiling import profiled
+from utils.services import get_fibonacci_service, get_lab_worker_pool, get_lesson
+from utils.ui import ADVANCE_SECONDS, poll_jobs, show_line_chart, show_live_iterator, show_quiz, show_try_it
+from utils.workers import JobBatch
+
+# Static lesson text and code, parsed once per server from content/13_iterators_and_generators.md
+lesson = get_lesson("13_iterators_and_generators")
 
 # Page Title
 st.title("Iterators and Generators🔄")
 
-st.markdown("""
-Iterators and generators are powerful tools in Python for managing sequences of data efficiently.  
-They allow you to process large datasets, create pipelines, and write memory-efficient code. Let’s explore! 🚀
-""")
+lesson.show("intro")
 
 # Section 1: Iterators
-st.markdown("## 🔹 What Are Iterators?")
-st.write("""
-An **iterator** is an object that allows you to traverse through all the elements in a collection, one at a time.  
-It must implement two methods:
-1. **`__iter__()`**: Returns the iterator object itself.
-2. **`__next__()`**: Returns the next element or raises `StopIteration` when there are no more elements.
-""")
-
-st.markdown("### Example:")
-st.code("""
-# Creating an iterator
-my_list = [1, 2, 3]
-iterator = iter(my_list)
-
-print(next(iterator))  # Output: 1
-print(next(iterator))  # Output: 2
-""")
+lesson.show("what-are-iterators")
 
 # Interactive Example: Create Your Iterator
-st.markdown("### 🧪 Try It: Use an Iterator")
+show_try_it(lesson, "try-use-an-iterator")
 my_list = st.text_input("Enter a list of items (comma-separated):", "1, 2, 3").split(", ")
-iterator = iter(my_list)
-
-if st.button("Get Next Item"):
-    try:
-        next_item = next(iterator)
-        st.write(f"Next item: `{next_item}`")
-    except StopIteration:
-        st.error("No more items in the iterator!")
+# The iterator lives on between clicks, so each one continues where the last stopped
+show_live_iterator(
+    "iterator", iter, my_list,
+    next_label="Get Next Item", value_label="Next item", exhausted_message="No more items in the iterator!",
+)
 
 # Section 2: Generators
-st.markdown("## 🔹 What Are Generators?")
-st.write("""
-Generators are a type of iterator, but they are simpler to implement.  
-Instead of returning values like a function, they use the **`yield`** keyword to produce a sequence of values.
-""")
-
-st.markdown("### Example:")
-st.code("""
-# Generator function
-def count_up_to(n):
-    count = 1
-    while count <= n:
-        yield count
-        count += 1
-
-gen = count_up_to(5)
-print(next(gen))  # Output: 1
-print(next(gen))  # Output: 2
-""")
+lesson.show("what-are-generators")
 
 # Interactive Example: Generate Numbers
-st.markdown("### 🧪 Try It: Generate Numbers")
+show_try_it(lesson, "try-generate-numbers")
 max_value = st.number_input("Enter the maximum number to generate:", value=5)
 
 def count_up_to(n):
@@ -70,40 +40,25 @@ def count_up_to(n):
         yield count
         count += 1
 
-gen = count_up_to(max_value)
-if st.button("Generate Next Number"):
-    try:
-        st.write(f"Generated Number: `{next(gen)}`")
-    except StopIteration:
-        st.error("Generator has no more values!")
+show_live_iterator(
+    "count_up_to", count_up_to, max_value,
+    next_label="Generate Next Number", value_label="Generated Number",
+    exhausted_message="Generator has no more values!",
+)
 
 # Section 3: Generator Expressions
-st.markdown("## 🔹 Generator Expressions")
-st.write("""
-Generator expressions are a concise way to create generators. They use parentheses `()` instead of square brackets `[]` for list comprehensions.
-""")
-
-st.markdown("### Example:")
-st.code("""
-# Generator Expression
-squares = (x**2 for x in range(5))
-print(next(squares))  # Output: 0
-print(next(squares))  # Output: 1
-""")
+lesson.show("generator-expressions")
 
 # Interactive Example: Squares Generator
-st.markdown("### 🧪 Try It: Generate Squares")
+show_try_it(lesson, "try-generate-squares")
 num = st.number_input("Enter a range for squares:", min_value=1, value=5)
-squares_gen = (x**2 for x in range(num))
-
-if st.button("Generate Next Square"):
-    try:
-        st.write(f"Next square: `{next(squares_gen)}`")
-    except StopIteration:
-        st.error("No more squares to generate!")
+show_live_iterator(
+    "squares", lambda num: (x**2 for x in range(num)), num,
+    next_label="Generate Next Square", value_label="Next square", exhausted_message="No more squares to generate!",
+)
 
 # Section 4: Differences Between Iterators and Generators
-st.markdown("## 🔹 Iterators vs. Generators")
+lesson.show("iterators-vs-generators")
 differences = {
     "Feature": ["Memory Usage", "Complexity", "Implementation"],
     "Iterators": ["More memory-intensive", "Requires implementing `__iter__()` and `__next__()`", "Explicit class or function"],
@@ -111,17 +66,60 @@ differences = {
 }
 st.table(differences)
 
+# Interactive Lab: the memory claims above, measured in worker processes
+show_try_it(lesson, "try-measure-lists-vs-generators")
+pool = get_lab_worker_pool()
+lab_example = st.selectbox("Example:", list(EXAMPLES))
+lab_sizes = [10**power for power in range(3, 9) if 10**power <= MAX_N[lab_example]]
+lab_max_n = st.select_slider(
+    "Largest N:", lab_sizes, value=min(10**6, lab_sizes[-1]), format_func=lambda n: f"10^{len(str(n)) - 1}"
+)
+st.caption("Tracing allocations slows Python down about ten times: N = 10^8 takes a few minutes.")
+if st.button("Run Measurements"):
+    with profiled("13_iterators_and_generators:Run Measurements"):
+        # Measurements run one at a time per session, and a new batch
+        # replaces this session's previous one instead of queueing behind it
+        if st.session_state.get("memory_lab"):
+            st.session_state.memory_lab[1].cancel()
+        lab_points = [(variant, n) for n in lab_sizes if n <= lab_max_n for variant in VARIANTS]
+        st.session_state.memory_lab = (lab_points, JobBatch(
+            functools.partial(pool.submit, measure), [(lab_example, variant, n) for variant, n in lab_points],
+        ))
+
+memory_lab = st.session_state.get("memory_lab")
+
+@poll_jobs(memory_lab and memory_lab[1])
+def show_memory_lab():
+    lab_points, batch = st.session_state.memory_lab
+    batch.top_up()
+    points = []
+    for (variant, n), job in zip(lab_points, batch.jobs):
+        if job is None:
+            continue
+        if job.done() and job.ok:
+            points.append({
+                "Version": variant, "N": n,
+                "Peak memory (MB)": max(job.result["peak_bytes"], 1) / 1e6,
+                "Wall time (s)": max(job.result["seconds"], 1e-6),
+            })
+        elif job.done():
+            st.error(f"{variant}, N = {n:,}: {job.error}")
+    pending = sum(job is None or not job.done() for job in batch.jobs)
+    if pending:
+        st.info(f"⏳ {pending} measurements still to come, one at a time...")
+    if points:
+        log = {"type": "log"}
+        show_line_chart(points, "N", "Peak memory (MB)", "Version", "Peak memory allocated (tracemalloc)", x_scale=log, y_scale=log)
+        show_line_chart(points, "N", "Wall time (s)", "Version", "Wall time", x_scale=log, y_scale=log)
+
+if memory_lab:
+    show_memory_lab()
+
 # Section 5: Use Cases for Generators
-st.markdown("## 🔹 When to Use Generators?")
-st.write("""
-Generators are ideal for:
-- Processing large datasets (e.g., reading large files).
-- Infinite sequences (e.g., Fibonacci series).
-- Pipelines that process data incrementally.
-""")
+lesson.show("when-to-use-generators")
 
 # Interactive Example: Fibonacci Generator
-st.markdown("### 🧪 Try It: Generate Fibonacci Numbers")
+show_try_it(lesson, "try-generate-fibonacci-numbers")
 fib_limit = st.number_input("Enter the number of Fibonacci numbers to generate:", min_value=1, value=10)
 
 def fibonacci(n):
@@ -130,40 +128,49 @@ def fibonacci(n):
         yield a
         a, b = b, a + b
 
-fib_gen = fibonacci(fib_limit)
+show_live_iterator(
+    "fibonacci", fibonacci, fib_limit,
+    next_label="Generate Next Fibonacci Number", value_label="Next Fibonacci number",
+    exhausted_message="No more Fibonacci numbers to generate!",
+    # Stepping one term at a time gets slow in the tens of thousands; the
+    # section below jumps straight to any term
+    format_value=preview, max_count=10_000,
+)
 
-if st.button("Generate Next Fibonacci Number"):
-    try:
-        st.write(f"Next Fibonacci number: `{next(fib_gen)}`")
-    except StopIteration:
-        st.error("No more Fibonacci numbers to generate!")
+# Interactive Example: any term with fast doubling, cached for every session
+show_try_it(lesson, "try-jump-to-any-fibonacci-number")
+fib_service = get_fibonacci_service()
+term_col, count_col = st.columns(2)
+fib_n = term_col.number_input("Term to compute (n):", min_value=0, max_value=fib_service.max_n, value=1_000_000)
+fib_count = count_col.number_input("Terms to list from n:", min_value=1, max_value=1000, value=20)
+compute_col, list_col = st.columns(2)
+if compute_col.button("Compute F(n)"):
+    with profiled("13_iterators_and_generators:Compute F(n)"):
+        term = fib_service.term(fib_n)
+        st.write(f"F({fib_n:,}) = `{preview(term.value)}`")
+        source = " (from the cache)" if term.cached else ""
+        st.caption(f"{digit_count(term.value):,} digits, computed in {term.seconds * 1000:.1f} ms{source}")
+if list_col.button("List Terms"):
+    with profiled("13_iterators_and_generators:List Terms"):
+        # Terms arrive in chunks, so the first ones show before the last are
+        # added up; listing stops after ADVANCE_SECONDS, however many were asked for
+        term_preview = Previewer()
+        listed = st.write_stream(
+            "".join(f"F({n:,}) = `{term_preview(value)}`  \n" for n, value in chunk)
+            for chunk in fib_service.terms(fib_n, fib_count, chunk_size=20, seconds=ADVANCE_SECONDS)
+        ).count("\n")
+        if listed < fib_count:
+            st.caption(f"Listed {listed:,} of {fib_count:,} terms in {ADVANCE_SECONDS:g} s; list from n = {fib_n + listed:,} for more.")
 
 # Section 6: Best Practices and Pitfalls
-st.markdown("## 🔹 Best Practices and Common Pitfalls")
-st.write("""
-- **Use Generators for Large Data**: They save memory by generating values on-the-fly.
-- **Handle StopIteration**: Ensure your code can handle the end of iteration gracefully.
-- **Avoid Reusing Generators**: Generators are exhausted after a single iteration.
-""")
+lesson.show("best-practices-and-common-pitfalls")
 
 # Section 7: Quiz
-st.markdown("## 🎮 Quiz: Test Your Knowledge!")
-quiz_question = st.radio(
-    "What is the difference between a function and a generator?",
-    [
-        "A function returns all values at once; a generator produces values one at a time using `yield`.",
-        "A function is faster than a generator.",
-        "Generators are not iterable."
-    ]
-)
-if st.button("Submit Quiz Answer"):
-    if quiz_question == "A function returns all values at once; a generator produces values one at a time using `yield`.":
-        st.success("🎉 Correct! Generators produce values lazily, making them memory-efficient.")
-    else:
-        st.error("❌ Incorrect. Generators use `yield` to produce values lazily.")
+lesson.show("quiz-test-your-knowledge")
+show_quiz("13_iterators_and_generators")
 
 # Section 8: Summary Table
-st.markdown("## 📚 Summary")
+lesson.show("summary")
 summary_table = {
     "Feature": ["Iterators", "Generators"],
     "Definition": [
@@ -178,8 +185,4 @@ summary_table = {
 st.table(summary_table)
 
 # Footer
-st.markdown("""
----
-Made with ❤️ to help you master **Iterators and Generators in Python**.  
-Keep exploring and building efficient code! 🚀
-""")
+lesson.show("footer")
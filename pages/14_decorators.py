@@ -1,55 +1,26 @@
 import streamlit as st
+import functools
+from utils.memo_lab import MAX_N, SIZES, STRATEGIES, measure
+from utils.profiling import profiled
+from utils.services import get_lesson, get_worker_pool
+from utils.ui import poll_jobs, show_line_chart, show_quiz, show_try_it
+from utils.workers import JobBatch
+
+# Static lesson text and code, parsed once per server from content/14_decorators.md
+lesson = get_lesson("14_decorators")
 
 # Page Title
 st.title("Understanding Decorators 🎨")
-st.markdown("""
-Decorators are a powerful and flexible way to modify the behavior of functions or classes in Python.  
-They are widely used in Python frameworks like Flask, Django, and more. Let’s dive in and make decorators fun and interactive! 🚀
-""")
+lesson.show("intro")
 
 # Section 1: Introduction to Decorators
-st.markdown("## 🔹 What Are Decorators?")
-st.write("""
-A **decorator** is a function that modifies another function or class.  
-They are often used to enhance functionality, such as logging, enforcing access control, or memoization.
-""")
-
-st.markdown("### Syntax:")
-st.code("""
-@decorator
-def function():
-    pass
-
-# Equivalent to:
-function = decorator(function)
-""")
+lesson.show("what-are-decorators")
 
 # Section 2: Function Decorators
-st.markdown("## 🔹 Function Decorators")
-st.write("""
-Function decorators take a function as input and return a modified or enhanced version of it.  
-They are widely used to add logging, authentication, timing, etc.
-""")
-
-st.markdown("### Example: A Logging Decorator")
-st.code("""
-def log_decorator(func):
-    def wrapper(*args, **kwargs):
-        print(f"Calling {func.__name__}")
-        result = func(*args, **kwargs)
-        print(f"{func.__name__} finished")
-        return result
-    return wrapper
-
-@log_decorator
-def greet(name):
-    print(f"Hello, {name}!")
-
-greet("Alice")
-""")
+lesson.show("function-decorators")
 
 # Interactive Example: Log Decorator
-st.markdown("### 🧪 Try It: Add Logging to a Function")
+show_try_it(lesson, "try-add-logging-to-a-function")
 name = st.text_input("Enter your name:", "Streamlit User")
 
 def log_decorator(func):
@@ -65,34 +36,72 @@ def greet(name):
     st.write(f"Hello, {name}!")
 
 if st.button("Run Greeting Function"):
-    greet(name)
+    with profiled("14_decorators:Run Greeting Function"):
+        greet(name)
+
+# Interactive Lab: memoization, measured in worker processes
+show_try_it(lesson, "try-memoize-a-slow-function")
+# The slowest measurement, fib(30) without a cache, takes about 2 s, so the
+# lab runs in the shared pool (with up to 10 s of CPU per job) rather than
+# behind the minutes-long measurements of the lab pool
+pool = get_worker_pool()
+memo_strategies = st.multiselect("Decorators to compare:", list(STRATEGIES), default=list(STRATEGIES))
+memo_max_n = st.select_slider("Largest n:", SIZES, value=30)
+if st.button("Run Memoization Lab"):
+    with profiled("14_decorators:Run Memoization Lab"):
+        # One measurement at a time per session; a new run cancels the last
+        if st.session_state.get("memo_lab"):
+            st.session_state.memo_lab[1].cancel()
+        memo_points = [
+            (strategy, n)
+            for strategy in memo_strategies
+            for n in SIZES if n <= min(memo_max_n, MAX_N.get(strategy, memo_max_n))
+        ]
+        st.session_state.memo_lab = (memo_points, JobBatch(
+            functools.partial(pool.submit, measure, cpu_seconds=10, timeout=20), memo_points,
+        ))
+
+memo_lab = st.session_state.get("memo_lab")
+
+@poll_jobs(memo_lab and memo_lab[1])
+def show_memo_lab():
+    memo_points, batch = st.session_state.memo_lab
+    batch.top_up()
+    points = []
+    for (strategy, n), job in zip(memo_points, batch.jobs):
+        if job is None:
+            continue
+        if job.done() and job.ok:
+            result = job.result
+            points.append({
+                "Decorator": strategy, "n": n,
+                "Calls": result["calls"],
+                "Hit ratio": result["hits"] / max(result["hits"] + result["misses"], 1),
+                "Memory held (KB)": max(result["held_bytes"], 1) / 1e3,
+                "Wall time (s)": max(result["seconds"], 1e-6),
+            })
+        elif job.done():
+            st.error(f"{strategy}, n = {n}: {job.error}")
+    pending = sum(job is None or not job.done() for job in batch.jobs)
+    if pending:
+        st.info(f"⏳ {pending} measurements still to come, one at a time...")
+    if points:
+        for field, title, y_scale in (
+            ("Calls", "Times the function body ran", {"type": "log"}),
+            ("Hit ratio", "Cache hit ratio", None),
+            ("Memory held (KB)", "Memory held by the cache (tracemalloc)", {"type": "log"}),
+            ("Wall time (s)", "Wall time", {"type": "log"}),
+        ):
+            show_line_chart(points, "n", field, "Decorator", title, x_scale={"type": "log"}, y_scale=y_scale)
+
+if memo_lab:
+    show_memo_lab()
 
 # Section 3: Class Decorators
-st.markdown("## 🔹 Class Decorators")
-st.write("""
-Class decorators modify or enhance the behavior of classes.  
-They are similar to function decorators but operate at the class level.
-""")
-
-st.markdown("### Example:")
-st.code("""
-def class_logger(cls):
-    class Wrapped(cls):
-        def __init__(self, *args, **kwargs):
-            print(f"Creating instance of {cls.__name__}")
-            super().__init__(*args, **kwargs)
-    return Wrapped
-
-@class_logger
-class Animal:
-    def __init__(self, name):
-        self.name = name
-
-dog = Animal("Buddy")
-""")
+lesson.show("class-decorators")
 
 # Interactive Example: Class Decorator
-st.markdown("### 🧪 Try It: Class Decorator")
+show_try_it(lesson, "try-class-decorator")
 class_logger_code = """
 def class_logger(cls):
     class Wrapped(cls):
@@ -113,39 +122,15 @@ class Animal:
 species = st.text_input("Enter the animal species:", "Dog")
 animal_name = st.text_input("Enter the animal name:", "Buddy")
 if st.button("Create Animal"):
-    animal = Animal(species, animal_name)
-    st.write(f"Created Animal: `{animal.species}` named `{animal.name}`.")
+    with profiled("14_decorators:Create Animal"):
+        animal = Animal(species, animal_name)
+        st.write(f"Created Animal: `{animal.species}` named `{animal.name}`.")
 
 # Section 4: Built-in Decorators (`@staticmethod`, `@classmethod`, `@property`)
-st.markdown("## 🔹 Built-in Decorators")
-st.write("""
-Python provides some built-in decorators for common tasks:
-- **`@staticmethod`**: Defines a method that doesn't access the class or instance.
-- **`@classmethod`**: Defines a method that operates on the class level.
-- **`@property`**: Defines a method that behaves like an attribute.
-""")
-
-st.markdown("### Example:")
-st.code("""
-class Circle:
-    def __init__(self, radius):
-        self.radius = radius
-
-    @property
-    def area(self):
-        return 3.14 * self.radius**2
-
-    @staticmethod
-    def describe():
-        return "This class represents a circle."
-
-    @classmethod
-    def from_diameter(cls, diameter):
-        return cls(diameter / 2)
-""")
+lesson.show("built-in-decorators")
 
 # Interactive Example: Special Decorators
-st.markdown("### 🧪 Try It: Work with Circle Class")
+show_try_it(lesson, "try-work-with-circle-class")
 class Circle:
     def __init__(self, radius):
         self.radius = radius
@@ -171,52 +156,14 @@ circle_from_diameter = Circle.from_diameter(diameter)
 st.write(f"Circle with Diameter `{diameter}` has Radius: `{circle_from_diameter.radius}`")
 
 # Section 5: Combining Decorators
-st.markdown("## 🔹 Combining Decorators")
-st.write("""
-You can stack multiple decorators on a single function. The decorators are applied in order, from the bottom up.
-""")
-
-st.markdown("### Example:")
-st.code("""
-def decorator_one(func):
-    def wrapper(*args, **kwargs):
-        print("Decorator One")
-        return func(*args, **kwargs)
-    return wrapper
-
-def decorator_two(func):
-    def wrapper(*args, **kwargs):
-        print("Decorator Two")
-        return func(*args, **kwargs)
-    return wrapper
-
-@decorator_one
-@decorator_two
-def greet(name):
-    print(f"Hello, {name}!")
-
-greet("Alice")
-""")
+lesson.show("combining-decorators")
 
 # Section 6: Quiz
-st.markdown("## 🎮 Quiz: Test Your Knowledge!")
-quiz_question = st.radio(
-    "What does the `@staticmethod` decorator do?",
-    [
-        "Converts a method into a static method.",
-        "Converts a method into a class method.",
-        "Makes a method behave like an attribute.",
-        "Adds logging to a method."
-    ]
-)
-if st.button("Submit Quiz Answer"):
-    if quiz_question == "Converts a method into a static method.":
-        st.success("🎉 Correct! `@staticmethod` defines a method that doesn’t access instance or class data.")
-    else:
-        st.error("❌ Incorrect. The correct answer is: 'Converts a method into a static method.'")
+lesson.show("quiz-test-your-knowledge")
+show_quiz("14_decorators")
 
 # Section 7: Summary
-st.markdown("## 📚 Summary")
+lesson.show("summary")
 summary_table = {
     "Decorator": ["Function Decorator", "Class Decorator", "@staticmethod", "@classmethod", "@property"],
     "Purpose": [
@@ -230,8 +177,4 @@ summary_table = {
 st.table(summary_table)
 
 # Footer
-st.markdown("""
----
-Made with ❤️ to help you master **Decorators in Python**.  
-Happy coding and exploring! 🚀
-""")
+lesson.show("footer")
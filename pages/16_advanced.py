@@ -1,59 +1,48 @@
 import streamlit as st
 from abc import ABC, abstractmethod
+import functools
 import threading
-import multiprocessing
-import time
+from utils.concurrency_lab import MODELS, TASK_COUNTS, WORKER_COUNTS, WORKLOADS
+from utils.demos import process_task
+from utils.event_loop import EventLoopBusy
+from utils.profiling import profiled
+from utils.services import (
+    get_concurrency_lab_service, get_event_loop_service, get_lesson, get_virtual_fs, get_worker_pool,
+)
+from utils.ui import poll_jobs, show_line_chart, show_try_it
+from utils.vfs import QuotaExceeded
+from utils.workers import JobBatch, PoolBusy
+
+# Static lesson text and code, parsed once per server from content/16_advanced.md
+lesson = get_lesson("16_advanced")
 
 # Page Title
 st.title("Explore Advanced Python Topics 🚀")
-st.markdown("""
-Python is a powerful language with advanced features that make it versatile and efficient.  
-This guide will help you master advanced concepts interactively! 💡
-""")
+lesson.show("intro")
 
 # Section 1: Context Managers and the `with` Statement
-st.markdown("## 🔹 Context Managers and the `with` Statement")
-st.write("""
-Context managers handle resource management efficiently, such as opening files or database connections.  
-The `with` statement ensures resources are cleaned up properly.
-""")
-
-st.markdown("### Example:")
-st.code("""
-with open("file.txt", "w") as f:
-    f.write("Hello, World!")
-# File is automatically closed after the block
-""")
+lesson.show("context-managers-and-the-with-statement")
 
 # Interactive Example: Write to a File
-st.markdown("### 🧪 Try It: Write to a File Using `with`")
+show_try_it(lesson, "try-write-to-a-file-using-with")
 filename = st.text_input("Enter a filename:", "example.txt")
 content = st.text_area("Enter content to write:", "Hello, Streamlit!")
 if st.button("Write to File"):
-    with open(filename, "w") as file:
-        file.write(content)
-    st.success(f"Content written to `{filename}`!")
+    with profiled("16_advanced:Write to File"):
+        # Written to this session's own in-memory files, not the server's disk
+        try:
+            with get_virtual_fs().open(filename, "w") as file:
+                file.write(content)
+        except (QuotaExceeded, ValueError) as error:
+            st.error(f"Couldn't write the file: {error}")
+        else:
+            st.success(f"Content written to `{filename}`!")
 
 # Section 2: Function Argument Unpacking (*args, **kwargs)
-st.markdown("## 🔹 Function Argument Unpacking")
-st.write("""
-- **`*args`**: Allows a function to accept any number of positional arguments.
-- **`**kwargs`**: Allows a function to accept any number of keyword arguments.
-""")
-
-st.markdown("### Example:")
-st.code("""
-def greet(*args, **kwargs):
-    for name in args:
-        print(f"Hello, {name}!")
-    for key, value in kwargs.items():
-        print(f"{key}: {value}")
-
-greet("Alice", "Bob", age=30, city="New York")
-""")
+lesson.show("function-argument-unpacking")
 
 # Interactive Example: Argument Unpacking
-st.markdown("### 🧪 Try It: Use `*args` and `**kwargs`")
+show_try_it(lesson, "try-use-args-and-kwargs")
 positional_args = st.text_input("Enter names (comma-separated):", "Alice, Bob")
 keyword_args = st.text_input("Enter key-value pairs (e.g., age=30, city=NY):", "age=30, city=NY")
 
@@ -63,38 +52,18 @@ def greet(*args, **kwargs):
     return greeting, details
 
 if st.button("Run Function"):
-    names = positional_args.split(", ")
-    kwargs = dict(pair.split("=") for pair in keyword_args.split(", "))
-    greetings, details = greet(*names, **kwargs)
-    st.write("Greetings:", greetings)
-    st.write("Details:", details)
+    with profiled("16_advanced:Run Function"):
+        names = positional_args.split(", ")
+        kwargs = dict(pair.split("=") for pair in keyword_args.split(", "))
+        greetings, details = greet(*names, **kwargs)
+        st.write("Greetings:", greetings)
+        st.write("Details:", details)
 
 # Section 3: Multiple Inheritance and MRO
-st.markdown("## 🔹 Multiple Inheritance and MRO")
-st.write("""
-Multiple inheritance allows a class to inherit from multiple parent classes.  
-Python uses the **Method Resolution Order (MRO)** to determine the order in which methods are resolved.
-""")
-
-st.markdown("### Example:")
-st.code("""
-class A:
-    def greet(self):
-        print("Hello from A")
-
-class B:
-    def greet(self):
-        print("Hello from B")
-
-class C(A, B):
-    pass
-
-c = C()
-c.greet()  # Output: "Hello from A" (based on MRO)
-""")
+lesson.show("multiple-inheritance-and-mro")
 
 # Interactive Example: MRO
-st.markdown("### 🧪 Try It: Understand MRO")
+show_try_it(lesson, "try-understand-mro")
 class A:
     def greet(self):
         return "Hello from A"
@@ -107,25 +76,17 @@ class C(A, B):
     pass
 
 if st.button("Get MRO for Class C"):
-    mro = C.mro()
-    st.write("MRO:", [cls.__name__ for cls in mro])
-    instance = C()
-    st.write("C's `greet()` Output:", instance.greet())
+    with profiled("16_advanced:Get MRO for Class C"):
+        mro = C.mro()
+        st.write("MRO:", [cls.__name__ for cls in mro])
+        instance = C()
+        st.write("C's `greet()` Output:", instance.greet())
 
 # Section 4: Type Hinting
-st.markdown("## 🔹 Type Hinting")
-st.write("""
-Type hinting improves code readability and helps tools like linters and IDEs catch type-related errors.
-""")
-
-st.markdown("### Example:")
-st.code("""
-def add(a: int, b: int) -> int:
-    return a + b
-""")
+lesson.show("type-hinting")
 
 # Interactive Example: Use Type Hinting
-st.markdown("### 🧪 Try It: Add Numbers with Type Hints")
+show_try_it(lesson, "try-add-numbers-with-type-hints")
 num1 = st.number_input("Enter first number:", value=5)
 num2 = st.number_input("Enter second number:", value=10)
 
@@ -133,30 +94,14 @@ def add(a: int, b: int) -> int:
     return a + b
 
 if st.button("Add Numbers"):
-    st.write(f"Sum: {add(num1, num2)}")
+    with profiled("16_advanced:Add Numbers"):
+        st.write(f"Sum: {add(num1, num2)}")
 
 # Section 5: Abstract Base Classes (ABC)
-st.markdown("## 🔹 Abstract Base Classes (ABC)")
-st.write("""
-Abstract base classes define a blueprint for derived classes, ensuring certain methods are implemented.
-""")
-
-st.markdown("### Example:")
-st.code("""
-from abc import ABC, abstractmethod
-
-class Animal(ABC):
-    @abstractmethod
-    def speak(self):
-        pass
-
-class Dog(Animal):
-    def speak(self):
-        return "Woof!"
-""")
+lesson.show("abstract-base-classes-abc")
 
 # Interactive Example: ABC
-st.markdown("### 🧪 Try It: Create an Abstract Class")
+show_try_it(lesson, "try-create-an-abstract-class")
 class Animal(ABC):
     @abstractmethod
     def speak(self):
@@ -170,51 +115,141 @@ cat = Cat()
 st.write(f"Cat says: {cat.speak()}")
 
 # Section 6: Multithreading and Multiprocessing
-st.markdown("## 🔹 Multithreading and Multiprocessing")
-st.write("""
-- **Multithreading**: Runs multiple threads in the same process (limited by the GIL).
-- **Multiprocessing**: Spawns separate processes to bypass the GIL for parallelism.
-""")
-
-st.markdown("### Example: Multithreading")
-st.code("""
-import threading
-
-def task():
-    print("Running task in thread")
-
-thread = threading.Thread(target=task)
-thread.start()
-""")
+lesson.show("multithreading-and-multiprocessing")
+
+# Interactive Lab: the same tasks five ways, for a range of worker counts
+show_try_it(lesson, "try-compare-threads-processes-and-asyncio")
+concurrency_lab = get_concurrency_lab_service()
+workload_col, workers_col, tasks_col = st.columns(3)
+lab_workload = workload_col.selectbox("Workload:", list(WORKLOADS))
+lab_max_workers = workers_col.select_slider("Up to this many workers:", WORKER_COUNTS, value=8)
+lab_tasks = tasks_col.select_slider("Tasks:", TASK_COUNTS, value=64)
+if st.button("Run Concurrency Lab"):
+    with profiled("16_advanced:Run Concurrency Lab"):
+        # Each run is cached by its parameters, so only new ones are submitted,
+        # one at a time per session; a new click cancels this session's last batch
+        if st.session_state.get("concurrency_runs"):
+            st.session_state.concurrency_runs[1].cancel()
+        lab_runs = [("Sequential", 1)] + [
+            (model, workers)
+            for model in MODELS if model != "Sequential"
+            for workers in WORKER_COUNTS if workers <= lab_max_workers
+        ]
+        st.session_state.concurrency_runs = (lab_runs, JobBatch(
+            functools.partial(concurrency_lab.measure, lab_workload),
+            [(model, workers, lab_tasks) for model, workers in lab_runs],
+        ))
+
+concurrency_runs = st.session_state.get("concurrency_runs")
+
+@poll_jobs(concurrency_runs and concurrency_runs[1])
+def show_concurrency_lab():
+    lab_runs, batch = st.session_state.concurrency_runs
+    batch.top_up()
+    baseline = batch.jobs[0]
+    points = []
+    for (model, workers), job in zip(lab_runs, batch.jobs):
+        if job is None:
+            continue
+        if job.done() and not job.ok:
+            st.error(f"{model}, {workers} workers: {job.error}")
+        elif job.done() and baseline is not None and baseline.done() and baseline.ok:
+            points.append({
+                "Model": model, "Workers": workers,
+                "Throughput (tasks/s)": job.result["throughput"],
+                "Speedup": baseline.result["seconds"] / job.result["seconds"],
+            })
+    pending = sum(job is None or not job.done() for job in batch.jobs)
+    if pending:
+        st.info(f"⏳ {pending} runs still to come, one at a time...")
+    if points:
+        workers_scale = {"type": "log", "base": 2}
+        show_line_chart(points, "Workers", "Throughput (tasks/s)", "Model", "Throughput", x_scale=workers_scale)
+        show_line_chart(
+            points, "Workers", "Speedup", "Model", "Speedup over running the tasks one after another",
+            x_scale=workers_scale,
+        )
+        cpus = baseline.result["cpus"]
+        st.caption(f"This server has {cpus} CPU(s), so processes can speed up CPU-bound work at most {cpus}x.")
+
+if concurrency_runs:
+    show_concurrency_lab()
 
 # Interactive Example: Multiprocessing
-st.markdown("### 🧪 Try It: Run a Multiprocessing Task")
-st.code("""
-import multiprocessing
-
-def task():
-    print("Running task in process")
-
-process = multiprocessing.Process(target=task)
-process.start()
-""")
-# Function to simulate a task
-def process_task(output):
-    output.put("Task running in a process!")
-    time.sleep(2)
-    output.put("Task completed!")
+show_try_it(lesson, "try-run-a-multiprocessing-task")
+# The task (see `utils/demos.py`) runs in a shared pool of reusable worker
+# processes, so the page returns straight away and shows each `output.put`
+# message as it arrives instead of waiting on `process.join()`.
+pool = get_worker_pool()
+
 # Button and process management
 if st.button("Start Multiprocessing"):
-    output = multiprocessing.Queue()
-    process = multiprocessing.Process(target=process_task, args=(output,))
-    process.start()
-    process.join()  # Ensure process finishes before proceeding
-    while not output.empty():
-        st.write(output.get())
+    with profiled("16_advanced:Start Multiprocessing"):
+        try:
+            st.session_state.process_job = pool.submit(process_task, stream=True)
+        except PoolBusy as e:
+            st.error(f"Error: {e}")
+
+process_job = st.session_state.get("process_job")
+
+@poll_jobs(process_job)
+def show_process_output():
+    job = st.session_state.process_job
+    for message in job.messages:
+        st.write(message)
+    if not job.done():
+        st.info(f"⏳ Running for {job.latency:.1f}s...")
+    elif not job.ok:
+        st.error(f"Error: {job.error}")
+
+if process_job:
+    show_process_output()
+
+# Section 7: asyncio
+lesson.show("asyncio")
+
+# Interactive Example: asyncio fan-out, on the server's background event loop
+show_try_it(lesson, "try-fan-out-with-asyncio")
+count_col, wait_col = st.columns(2)
+fan_out_count = count_col.number_input("Number of waits:", min_value=1, max_value=10_000, value=1_000, step=100)
+longest_wait = wait_col.slider("Longest wait (seconds):", min_value=0.1, max_value=5.0, value=1.0)
+if st.button("Start Waiting"):
+    with profiled("16_advanced:Start Waiting"):
+        try:
+            # Returns straight away; the waits run on the loop while the page polls
+            st.session_state.fan_out = get_event_loop_service().fan_out(fan_out_count, longest_wait)
+        except EventLoopBusy as e:
+            st.error(f"Error: {e}")
+
+fan_out = st.session_state.get("fan_out")
+
+@poll_jobs(fan_out)
+def show_fan_out():
+    fan_out = st.session_state.fan_out
+    completed_at = fan_out.completed_at[:]
+    st.progress(len(completed_at) / fan_out.total, text=f"{len(completed_at):,} of {fan_out.total:,} waits done")
+    if completed_at:
+        # At most about 200 points, however many waits there are
+        step = max(1, len(completed_at) // 200)
+        points = [{"Seconds": seconds, "Completed": number} for number, seconds in enumerate(completed_at, 1)][::step]
+        st.vega_lite_chart({
+            "title": "Waits completed over time",
+            "data": {"values": points},
+            "mark": "line",
+            "encoding": {
+                "x": {"field": "Seconds", "type": "quantitative"},
+                "y": {"field": "Completed", "type": "quantitative"},
+            },
+        }, width="stretch")
+    if fan_out.done():
+        speedup = fan_out.sequential_seconds / fan_out.wall_seconds
+        st.write(
+            f"All waits finished in **{fan_out.wall_seconds:.2f} s**. One after another they would have taken "
+            f"**{fan_out.sequential_seconds:,.1f} s**, the sum of the waits: {speedup:,.0f}x longer."
+        )
+
+if fan_out:
+    show_fan_out()
 
 # Footer
-st.markdown("""
----
-Made with ❤️ to help you master **Advanced Python Topics**.  
-Keep learning and pushing your Python skills to the next level! 🚀
-""")
+lesson.show("footer")
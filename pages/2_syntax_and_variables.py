@@ -1,18 +1,19 @@
 import streamlit as st
 import pandas as pd
-import random
+from utils.services import get_lesson
+from utils.ui import show_quiz
+
+# Static lesson text and code, parsed once per server from content/2_syntax_and_variables.md
+lesson = get_lesson("2_syntax_and_variables")
 
 # Page Title
 st.title("Syntax & Variables 🚀")
 
 # Introduction
-st.markdown("""
-Welcome to a fun and interactive way to learn Python's syntax and data types!  
-Dive into the details, play quizzes, and explore with examples. 🎉
-""")
+lesson.show("intro")
 
 # Input for Name and Age
-st.markdown("### Let's Start with Variables")
+lesson.show("let-s-start-with-variables")
 name = st.text_input("What's your name?", "John Doe")
 age = st.number_input("What's your age?", min_value=0, value=20)
 
@@ -28,7 +29,7 @@ variables_table = pd.DataFrame({
 st.table(variables_table)
 
 # Data Types Overview
-st.markdown("## Python Data Types Overview")
+lesson.show("python-data-types-overview")
 data_types_table = pd.DataFrame({
     "Data Type": ["Integer (int)", "Float (float)", "String (str)", "List", "Tuple", "Set", "Dictionary (dict)", "Boolean (bool)"],
     "Type": ["Primitive", "Primitive", "Primitive", "Non-Primitive", "Non-Primitive", "Non-Primitive", "Non-Primitive", "Primitive"],
@@ -38,55 +39,13 @@ data_types_table = pd.DataFrame({
 st.dataframe(data_types_table)
 
 # Let's Play: Guess the Data Type
-st.markdown("### 🎮 Let's Play: Guess the Data Type!")
-
-# Quiz Data
-quiz_data = [
-    ("42", "Integer (int)"),
-    ("3.14", "Float (float)"),
-    ('"Hello"', "String (str)"),
-    ("[1, 2, 3]", "List"),
-    ("(1, 2, 3)", "Tuple"),
-    ("{1, 2, 3}", "Set"),
-    ("{'key': 'value'}", "Dictionary (dict)"),
-    ("True", "Boolean (bool)")
-]
-
-# Initialize the quiz state in session_state
-if "quiz_question" not in st.session_state:
-    st.session_state.quiz_question = random.choice(quiz_data)
-if "feedback" not in st.session_state:
-    st.session_state.feedback = ""
-
-quiz_question = st.session_state.quiz_question
-
-# Display the question
-st.write(f"**Question:** What is the data type of this value?")
-st.code(quiz_question[0])
-
-# Answer Input
-user_answer = st.selectbox(
-    "Choose your answer:",
-    ["Integer (int)", "Float (float)", "String (str)", "List", "Tuple", "Set", "Dictionary (dict)", "Boolean (bool)"]
-)
-
-# Handle Answer Submission
-if st.button("Submit Answer"):
-    if user_answer == quiz_question[1]:
-        st.session_state.feedback = "🎉 Correct! Great job!"
-    else:
-        st.session_state.feedback = f"❌ Incorrect. The correct answer is: {quiz_question[1]}"
-    
-    # Load a new question
-    st.session_state.quiz_question = random.choice(quiz_data)
-    st.rerun()
+lesson.show("let-s-play-guess-the-data-type")
 
-# Show feedback if available
-if st.session_state.feedback:
-    st.write(st.session_state.feedback)
+# Questions are drawn from the shared question bank
+show_quiz("2_syntax_and_variables", selectbox=True)
 
 # Explore Data Types in Detail
-st.markdown("## 🔍 Explore Data Types in Detail")
+lesson.show("explore-data-types-in-detail")
 selected_data_type = st.selectbox(
     "Choose a data type to explore:",
     ["int", "float", "str", "list", "tuple", "set", "dict", "bool"]
@@ -206,8 +165,7 @@ if selected_data_type in data_type_details:
     st.code(details["Example Code"])
 
 # Summary Table
-st.markdown("## 📊 Summary of Data Types")
-st.write("Here's a summary table of all the data types we've explored:")
+lesson.show("summary-of-data-types")
 st.dataframe(data_types_table)
 
 # Footer
@@ -1,30 +1,37 @@
 import streamlit as st
-import pandas as pd
+from utils.profiling import profiled
+from utils.sandbox import call_expression, call_function
+from utils.services import get_factorial_service, get_lesson, get_worker_pool
+from utils.ui import poll_jobs, show_try_it
+from utils.workers import PoolBusy
+
+# Static lesson text and code, parsed once per server from content/6_functions.md
+lesson = get_lesson("6_functions")
 
 # Page Title
 st.title("All About Python Functions 🛠️")
 
-st.markdown("""
-Functions in Python are reusable blocks of code that make your programs modular and efficient.  
-They allow you to write clean, DRY (Don't Repeat Yourself) code! Let’s explore them in depth. 🚀  
-""")
+lesson.show("intro")
 
 # Section 1: Defining Functions
-st.markdown("## 🔹 Defining Functions")
-st.write("""
-In Python, a function is defined using the `def` keyword.  
-Functions can take inputs (arguments), perform operations, and return results.
-""")
-
-st.markdown("### Syntax:")
-st.code("""
-def function_name(parameters):
-    # Code block
-    return value
-""")
+lesson.show("defining-functions")
+
+# Learner code never runs in the server process: it goes to a shared pool of
+# sandboxed worker processes with CPU, memory and wall-clock limits.
+pool = get_worker_pool()
+
+def show_job_result(job, label):
+    if not job.done():
+        stats = pool.stats()
+        st.info(f"⏳ Running... ({stats['queue_depth']} jobs waiting, {stats['busy']}/{stats['workers']} workers busy)")
+    elif job.ok:
+        st.write(f"{label}: `{job.result}`")
+        st.caption(f"Finished in {job.latency * 1000:.0f} ms")
+    else:
+        st.error(f"Error: {job.error}")
 
 # Interactive Example: Define a Function
-st.markdown("### 🧪 Try It: Define Your Own Function")
+show_try_it(lesson, "try-define-your-own-function")
 
 # Input widgets for function details
 function_name = st.text_input("Name of your function:", "my_function")
@@ -33,146 +40,114 @@ operation = st.text_area("Operation inside the function:", "return f'Hello, {nam
 
 # Button to run the function
 if st.button("Run Your Function"):
-    try:
+    with profiled("6_functions:Run Your Function"):
         # Dynamically create the function using the input
         function_code = f"def {function_name}({argument_name}):\n    {operation}"
-        
-        # Use exec() to define the function dynamically in the local context
-        exec(function_code)
+        try:
+            # The code runs in a sandboxed worker process, tested with "Streamlit"
+            st.session_state.function_job = pool.submit(call_function, function_code, function_name, ("Streamlit",))
+            st.session_state.function_label = f"{function_name}('Streamlit')"
+        except PoolBusy as e:
+            st.error(f"Error: {e}")
 
-        # Test the dynamically created function with a sample argument
-        result = locals()[function_name]("Streamlit")  # Test with "Streamlit"
+# Display the result of the function once the worker is done
+function_job = st.session_state.get("function_job")
 
-        # Display the result of the function
-        st.write(f"Result of `{function_name}('Streamlit')`: {result}")
+@poll_jobs(function_job)
+def show_function_result():
+    show_job_result(st.session_state.function_job, f"Result of `{st.session_state.function_label}`")
 
-    except Exception as e:
-        st.error(f"Error: {str(e)}")
+if function_job:
+    show_function_result()
 
 # Section 2: Arguments and Return Values
-st.markdown("## 🔹 Arguments and Return Values")
-st.write("""
-Functions can:
-1. Take arguments as input.
-2. Return values using the `return` keyword.
-""")
-
-st.markdown("### Example:")
-st.code("""
-def add_numbers(a, b):
-    return a + b
-
-result = add_numbers(3, 5)
-print(result)  # Output: 8
-""")
+lesson.show("arguments-and-return-values")
 
 # Interactive Example: Add Two Numbers
-st.markdown("### 🧪 Try It: Add Two Numbers")
+show_try_it(lesson, "try-add-two-numbers")
 num1 = st.number_input("Enter the first number:", value=0)
 num2 = st.number_input("Enter the second number:", value=0)
 if st.button("Add Numbers"):
-    st.write(f"The sum of {num1} and {num2} is: {num1 + num2}")
+    with profiled("6_functions:Add Numbers"):
+        st.write(f"The sum of {num1} and {num2} is: {num1 + num2}")
 
 # Section 3: Lambda Functions
-st.markdown("## 🔹 Lambda Functions")
-st.write("""
-Lambda functions are anonymous functions defined with the `lambda` keyword.  
-They are often used for small, single-line operations.
-""")
-
-st.markdown("### Example:")
-st.code("""
-# Lambda function to add two numbers
-add = lambda x, y: x + y
-result = add(3, 5)
-print(result)  # Output: 8
-""")
+lesson.show("lambda-functions")
 
 # Interactive Example: Lambda Function
-st.markdown("### 🧪 Try It: Create a Lambda Function")
+show_try_it(lesson, "try-create-a-lambda-function")
 lambda_expression = st.text_area("Write your lambda function:", "lambda x, y: x + y")
 x_value = st.number_input("Enter the first value (x):", value=1)
 y_value = st.number_input("Enter the second value (y):", value=2)
 if st.button("Run Lambda Function"):
-    try:
-        result = eval(lambda_expression)(x_value, y_value)
-        st.write(f"Result: `{result}`")
-    except Exception as e:
-        st.error(f"Error: {e}")
+    with profiled("6_functions:Run Lambda Function"):
+        try:
+            st.session_state.lambda_job = pool.submit(call_expression, lambda_expression, (x_value, y_value))
+        except PoolBusy as e:
+            st.error(f"Error: {e}")
+
+lambda_job = st.session_state.get("lambda_job")
+
+@poll_jobs(lambda_job)
+def show_lambda_result():
+    show_job_result(st.session_state.lambda_job, "Result")
+
+if lambda_job:
+    show_lambda_result()
 
 # Section 4: Recursion
-st.markdown("## 🔹 Recursion")
-st.write("""
-A function can call itself, which is called recursion.  
-Recursion is useful for problems like factorials, Fibonacci numbers, and traversing trees.
-""")
-
-st.markdown("### Example:")
-st.code("""
-def factorial(n):
-    if n == 0:
-        return 1
-    return n * factorial(n - 1)
-
-result = factorial(5)
-print(result)  # Output: 120
-""")
+lesson.show("recursion")
 
 # Interactive Example: Factorial Using Recursion
-st.markdown("### 🧪 Try It: Calculate Factorial")
-factorial_input = st.number_input("Enter a number:", min_value=0, value=5)
-
-def factorial(n):
-    if n == 0:
-        return 1
-    return n * factorial(n - 1)
+show_try_it(lesson, "try-calculate-factorial")
+factorial_service = get_factorial_service()
+factorial_input = st.number_input("Enter a number:", min_value=0, max_value=factorial_service.max_n, value=5)
 
 if st.button("Calculate Factorial"):
-    st.write(f"The factorial of {factorial_input} is: {factorial(factorial_input)}")
+    with profiled("6_functions:Calculate Factorial"):
+        # The recursive version above stops at Python's recursion limit (about
+        # 1,000 calls deep); the service has no such limit, runs in a worker
+        # with a CPU-time cap, and remembers the numbers it has already done
+        try:
+            st.session_state.factorial_job = factorial_service.compute(factorial_input)
+        except PoolBusy as e:
+            st.error(f"Error: {e}")
+
+factorial_job = st.session_state.get("factorial_job")
+
+@poll_jobs(factorial_job)
+def show_factorial_result():
+    job = st.session_state.factorial_job
+    if not job.done():
+        st.info("⏳ Calculating...")
+    elif job.ok:
+        summary = job.result
+        st.write(f"The factorial of {summary['n']:,} is: `{summary['preview']}`")
+        st.caption(f"{summary['digits']:,} digits, calculated in {summary['seconds'] * 1000:.1f} ms")
+    else:
+        st.error(f"Error: {job.error}")
+
+if factorial_job:
+    show_factorial_result()
 
 # Section 5: Default Arguments
-st.markdown("## 🔹 Default Arguments")
-st.write("""
-Default arguments allow you to specify a default value for a parameter.  
-If no value is provided during the function call, the default is used.
-""")
-
-st.markdown("### Example:")
-st.code("""
-def greet(name="World"):
-    return f"Hello, {name}!"
-
-print(greet())         # Output: Hello, World!
-print(greet("Python")) # Output: Hello, Python!
-""")
+lesson.show("default-arguments")
 
 # Interactive Example: Default Arguments
-st.markdown("### 🧪 Try It: Use Default Arguments")
+show_try_it(lesson, "try-use-default-arguments")
 default_name = st.text_input("Enter the default name:", "World")
 custom_name = st.text_input("Enter a custom name (optional):", "")
 if st.button("Greet"):
-    def greet(name=default_name):
-        return f"Hello, {name}!"
-    st.write(greet(custom_name if custom_name else default_name))
+    with profiled("6_functions:Greet"):
+        def greet(name=default_name):
+            return f"Hello, {name}!"
+        st.write(greet(custom_name if custom_name else default_name))
 
 # Section 6: Variable-length Arguments (*args and **kwargs)
-st.markdown("## 🔹 Variable-length Arguments (`*args`, `**kwargs`)")
-st.write("""
-- **`*args`**: Allows a function to accept any number of positional arguments.
-- **`**kwargs`**: Allows a function to accept any number of keyword arguments.
-""")
-
-st.markdown("### Example:")
-st.code("""
-def dynamic_function(*args, **kwargs):
-    print("Positional arguments:", args)
-    print("Keyword arguments:", kwargs)
-
-dynamic_function(1, 2, 3, name="Python", version=3.9)
-""")
+lesson.show("variable-length-arguments-args-kwargs")
 
 # Interactive Example: Variable-length Arguments
-st.markdown("### 🧪 Try It: Use `*args` and `**kwargs`")
+show_try_it(lesson, "try-use-args-and-kwargs")
 args_input = st.text_input("Enter positional arguments (comma-separated):", "1, 2, 3")
 kwargs_input = st.text_input("Enter keyword arguments (key=value, comma-separated):", "name=Python, version=3.9")
 
@@ -181,32 +156,13 @@ def dynamic_function(*args, **kwargs):
     st.write("Keyword arguments:", kwargs)
 
 if st.button("Run `*args` and `**kwargs`"):
-    args = tuple(map(str.strip, args_input.split(",")))
-    kwargs = dict(pair.split("=") for pair in kwargs_input.split(","))
-    dynamic_function(*args, **kwargs)
+    with profiled("6_functions:Run *args and **kwargs"):
+        args = tuple(map(str.strip, args_input.split(",")))
+        kwargs = dict(pair.split("=") for pair in kwargs_input.split(","))
+        dynamic_function(*args, **kwargs)
 
 # Section 7: Summary Table
-st.markdown("## 📚 Summary")
-summary_table = pd.DataFrame({
-    "Topic": [
-        "Defining Functions", "Arguments and Return Values", 
-        "Lambda Functions", "Recursion", 
-        "Default Arguments", "*args and **kwargs"
-    ],
-    "Description": [
-        "Create reusable code blocks using `def`.",
-        "Functions can take inputs and return outputs.",
-        "Anonymous one-liner functions using `lambda`.",
-        "Functions that call themselves for repetitive tasks.",
-        "Set default values for parameters in functions.",
-        "Handle dynamic numbers of arguments and keyword arguments."
-    ]
-})
-st.table(summary_table)
+lesson.show("summary")
 
 # Footer
-st.markdown("""
----
-Made with ❤️ to help you become a Python functions master!  
-Keep learning and experimenting! 🚀
-""")
+lesson.show("footer")
@@ -1,65 +1,73 @@
 import streamlit as st
-import os
 from pathlib import Path
 from datetime import datetime
+from utils.directory import SORT_KEYS
+from utils.profiling import profiled
+from utils.services import get_directory_cache, get_lesson, get_session_state, get_virtual_fs
+from utils.text_scan import scan_text
+from utils.ui import show_quiz, show_try_it
+from utils.vfs import QuotaExceeded
+
+DIRECTORY_PAGE_SIZE = 50
+
+# Static lesson text and code, parsed once per server from content/8_file_handling.md
+lesson = get_lesson("8_file_handling")
+
+# The examples write to this session's own in-memory files, not the server's disk
+fs = get_virtual_fs()
 
 # Page Title
 st.title("File Handling📝")
 
-st.markdown("""
-File handling is an essential part of Python programming. It allows you to read, write, and manage files effectively.  
-Let’s explore **file handling** concepts in detail with interactive examples and fun tasks! 🚀  
-""")
+lesson.show("intro")
 
 # Section 1: Basics of File Handling
-st.markdown("## 🔹 Basics of File Handling")
-st.write("""
-File handling in Python is done using built-in functions like `open()`, `read()`, `write()`, and `close()`.  
-Python provides easy ways to work with files using different file modes:
-- **`r`**: Read-only mode
-- **`w`**: Write-only mode (overwrites existing content)
-- **`a`**: Append mode (adds new content to the file)
-- **`r+`**: Read and write mode
-""")
+lesson.show("basics-of-file-handling")
 
 # Section 2: Reading Files
-st.markdown("## 🔹 Reading Files")
-st.write("""
-Reading a file is one of the most common tasks. Let's see the functions used for reading:
-- **`read()`**: Reads the entire file content.
-- **`readline()`**: Reads a single line from the file.
-- **`readlines()`**: Reads all lines and returns them as a list.
-""")
+lesson.show("reading-files")
 
 # Interactive Example: Reading a File
-st.markdown("### 🧪 Try It: Read a File")
+show_try_it(lesson, "try-read-a-file")
 file_to_read = st.file_uploader("Upload a text file to read", type=["txt"])
 if file_to_read is not None:
-    file_content = file_to_read.read().decode("utf-8")
-    st.text_area("File Content:", file_content, height=200)
+    # Read once per upload, in chunks: only a bounded preview is kept and shown
+    state = get_session_state()
+    summary_key = f"upload:{file_to_read.file_id}"
+    if summary_key not in state:
+        with profiled("8_file_handling:Read uploaded file"):
+            file_to_read.seek(0)
+            state[summary_key] = scan_text(file_to_read)
+    summary = state[summary_key]
+    st.text_area("File Content:", summary.preview, height=200)
+    if summary.truncated:
+        st.caption(f"Showing the first {len(summary.preview):,} characters of the file.")
 
     st.markdown("#### Read Methods:")
-    st.write(f"File size: `{len(file_content)} bytes`")
-    st.write(f"First line: `{file_content.splitlines()[0]}` (using `readline()`)")
+    st.write(f"File size: `{summary.size} bytes`")
+    st.write(f"Line count: `{summary.lines}` (iterating over the file)")
+    if summary.head:
+        st.write(f"First line: `{summary.head[0]}` (using `readline()`)")
+        st.write(f"Last line: `{summary.tail[-1]}` (using `readlines()[-1]`)")
 
 # Section 3: Writing to Files
-st.markdown("## 🔹 Writing to Files")
-st.write("""
-Writing to files is done using:
-- **`write()`**: Writes a single string to the file.
-- **`writelines()`**: Writes a list of strings to the file.
-""")
+lesson.show("writing-to-files")
 
 # Interactive Example: Writing to a File
-st.markdown("### 🧪 Try It: Write to a File")
+show_try_it(lesson, "try-write-to-a-file")
 user_text = st.text_area("Write something to a file:")
 if st.button("Save to File"):
-    with open("user_file.txt", "w") as f:
-        f.write(user_text)
-    st.success("Your text has been saved to `user_file.txt`!")
+    with profiled("8_file_handling:Save to File"):
+        try:
+            with fs.open("user_file.txt", "w") as f:
+                f.write(user_text)
+        except QuotaExceeded as error:
+            st.error(f"Couldn't save the file: {error.strerror}")
+        else:
+            st.success("Your text has been saved to `user_file.txt`!")
 
 # Section 4: File Modes
-st.markdown("## 🔹 File Modes")
+lesson.show("file-modes")
 file_modes = {
     "r": "Read (default). Opens the file for reading.",
     "w": "Write. Creates a new file or overwrites an existing file.",
@@ -69,110 +77,77 @@ file_modes = {
 st.table(file_modes)
 
 # Section 5: Context Managers (`with` Statement)
-st.markdown("## 🔹 Context Managers (`with` Statement)")
-st.write("""
-Using the **`with`** statement ensures that the file is properly closed after the operation.  
-This is considered the best practice for file handling.
-""")
-
-st.markdown("### Example:")
-st.code("""
-with open("example.txt", "r") as f:
-    content = f.read()
-print(content)  # File is automatically closed after the block
-""")
+lesson.show("context-managers-with-statement")
 
 # Section 6: Working with Directories
-st.markdown("## 🔹 Working with Directories")
-st.write("""
-Python provides modules like `os` and `pathlib` to work with directories.  
-You can create, delete, and list files and directories easily.
-""")
+lesson.show("working-with-directories")
 
 # Subsection: List Files in a Directory
-st.markdown("### 📂 List Files in a Directory")
+lesson.show("list-files-in-a-directory")
 dir_path = st.text_input("Enter a directory path to list files:", value=str(Path.cwd()))
-if os.path.isdir(dir_path):
-    files = os.listdir(dir_path)
-    st.write(f"Files in `{dir_path}`:")
-    st.write(files)
-else:
+try:
+    with profiled("8_file_handling:List directory"):
+        listing = get_directory_cache().listing(dir_path)
+except OSError:
     st.error("Invalid directory path!")
+else:
+    # Only one page of the listing is looked up and sent to the browser
+    sort_col, order_col, page_col = st.columns(3)
+    sort_key = sort_col.selectbox("Sort by:", SORT_KEYS, format_func=str.capitalize)
+    descending = order_col.selectbox("Order:", ["Ascending", "Descending"]) == "Descending"
+    page_count = max(1, -(-len(listing) // DIRECTORY_PAGE_SIZE))
+    page_number = page_col.number_input(f"Page (of {page_count}):", min_value=1, max_value=page_count, value=1)
+    st.write(f"Files in `{listing.path}` ({len(listing)} entries):")
+    st.dataframe(
+        [
+            {
+                "Name": entry.name + ("/" if entry.is_dir else ""),
+                "Size (bytes)": entry.size,
+                "Modified": datetime.fromtimestamp(entry.modified).strftime("%Y-%m-%d %H:%M"),
+            }
+            for entry in listing.page(page_number - 1, DIRECTORY_PAGE_SIZE, sort_key, descending)
+        ],
+        hide_index=True,
+    )
 
 # Subsection: Create and Delete Files
-st.markdown("### 🛠️ Create and Delete Files")
+lesson.show("create-and-delete-files")
 file_name = st.text_input("Enter a file name to create:", value="new_file.txt")
-if st.button("Create File"):
-    with open(file_name, "w") as f:
-        f.write("This is a new file created using Python.")
-    st.success(f"File `{file_name}` created successfully!")
-if st.button("Delete File"):
-    if os.path.exists(file_name):
-        os.remove(file_name)
-        st.success(f"File `{file_name}` deleted successfully!")
-    else:
-        st.error("File does not exist!")
+try:
+    if st.button("Create File"):
+        with profiled("8_file_handling:Create File"):
+            with fs.open(file_name, "w") as f:
+                f.write("This is a new file created using Python.")
+            st.success(f"File `{file_name}` created successfully!")
+    if st.button("Delete File"):
+        with profiled("8_file_handling:Delete File"):
+            if fs.exists(file_name):
+                fs.remove(file_name)
+                st.success(f"File `{file_name}` deleted successfully!")
+            else:
+                st.error("File does not exist!")
+except QuotaExceeded as error:
+    st.error(f"Couldn't create the file: {error.strerror}")
+except ValueError as error:
+    st.error(str(error))
+st.caption(f"Your files: {', '.join(f'`{name}`' for name in fs.listdir()) or 'none yet'}")
 
 # Subsection: Using `pathlib`
-st.markdown("### 🛠️ Using `pathlib`")
-st.write("`pathlib` is an object-oriented module for working with file paths.")
-st.code("""
-from pathlib import Path
-
-path = Path("example.txt")
-print(path.exists())  # Check if the file exists
-""")
-example_path = Path("example.txt")
-st.write(f"Does `example.txt` exist? `{example_path.exists()}`")
+lesson.show("using-pathlib")
+st.write(f"Does `example.txt` exist? `{fs.exists('example.txt')}`")
 
 # Section 7: Working with Timestamps
-st.markdown("## 🔹 File Timestamps")
-st.write("Use the `datetime` module to work with file timestamps.")
-st.code("""
-from datetime import datetime
-import os
-
-file_time = os.path.getmtime("example.txt")
-print(datetime.fromtimestamp(file_time))
-""")
-if example_path.exists():
-    timestamp = datetime.fromtimestamp(example_path.stat().st_mtime)
+lesson.show("file-timestamps")
+if fs.exists("example.txt"):
+    timestamp = datetime.fromtimestamp(fs.stat("example.txt").st_mtime)
     st.write(f"Last modified time of `example.txt`: `{timestamp}`")
 
 # Section 8: Quiz
-st.markdown("## 🎮 Quiz: Test Your Knowledge")
-quiz_question = st.radio(
-    "What does the following code do?",
-    options=[
-        "Reads all lines of the file as a list.",
-        "Writes a list of strings to the file.",
-        "Reads the first line of the file."
-    ]
-)
-st.code("""
-with open("example.txt", "r") as f:
-    lines = f.readlines()
-""")
-
-if st.button("Submit Quiz Answer"):
-    if quiz_question == "Reads all lines of the file as a list.":
-        st.success("🎉 Correct! `readlines()` reads all lines of the file into a list.")
-    else:
-        st.error("❌ Incorrect. The correct answer is: 'Reads all lines of the file as a list.'")
+lesson.show("quiz-test-your-knowledge")
+show_quiz("8_file_handling")
 
 # Section 9: Summary
-st.markdown("## 📚 Summary")
-st.write("""
-1. **Reading Files**: Use `read()`, `readline()`, or `readlines()` to read file content.
-2. **Writing Files**: Use `write()` or `writelines()` to write to files.
-3. **File Modes**: Choose the appropriate mode (`r`, `w`, `a`, etc.) based on your task.
-4. **Context Managers**: Use the `with` statement for safe and clean file handling.
-5. **Working with Directories**: Use `os` or `pathlib` to interact with directories and files.
-""")
+lesson.show("summary")
 
 # Footer
-st.markdown("""
----
-Made with ❤️ to help you master **File Handling in Python**.  
-Happy File Management! 🚀  
-""")
+lesson.show("footer")
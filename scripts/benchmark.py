@@ -0,0 +1,232 @@
+"""
+Headless render benchmark for every page.
+
+    python scripts/benchmark.py                             # writes bench_results.json
+    python scripts/benchmark.py --compare old_results.json  # and reports the changes
+
+Each page is driven with Streamlit's AppTest through a short scenario of
+typical interactions (see SCENARIOS). For every rerun it records the wall
+time, the number of elements sent, the size of the messages sent to the
+browser, and the peak RSS of the process. Pages run in separate
+interpreters so that their memory numbers don't mix.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is not reported there
+    resource = None
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# (action, widget label, value) steps run after the first load of a page.
+# "click" presses a button, "set" changes any input widget with that label.
+SCENARIOS = {
+    "home.py": [("set", "🔍 Search the lessons", "re.sub")],
+    "pages/1_introduction_to_python.py": [("click", "Submit Answer", None)],
+    "pages/2_syntax_and_variables.py": [("set", "What's your age?", 30), ("click", "Submit Answer", None)],
+    "pages/3_conditional_statements.py": [("set", "Enter your score (0-100):", 85), ("click", "Submit Answer", None)],
+    "pages/4_loops.py": [
+        ("click", "Generate Table", None),
+        ("set", "Enter a number for the multiplication table:", 12),
+        ("click", "Play FizzBuzz", None),
+    ],
+    "pages/5_strings.py": [("set", "Enter your string:", "Benchmarking strings"), ("set", "Repetition count:", 5)],
+    "pages/6_functions.py": [
+        ("click", "Add Numbers", None),
+        ("set", "Enter a number:", 50),
+        ("click", "Calculate Factorial", None),
+    ],
+    "pages/7_modules_and_packages.py": [("click", "Generate Random Number", None)],
+    "pages/8_file_handling.py": [("click", "Submit Answer", None)],
+    "pages/9_error_handling.py": [("set", "Enter the denominator:", 0), ("click", "Raise Custom Error", None)],
+    "pages/10_oop.py": [("click", "Deposit", None), ("click", "Withdraw", None)],
+    "pages/11_data_structures.py": [("click", "Add to Phonebook", None)],
+    "pages/12_comprehensions.py": [("set", "Enter the range of numbers:", 50), ("set", "Enter table size:", 10)],
+    "pages/13_iterators_and_generators.py": [
+        ("click", "Get Next Item", None),
+        ("click", "Generate Next Number", None),
+        ("click", "Generate Next Fibonacci Number", None),
+    ],
+    "pages/14_decorators.py": [("click", "Run Greeting Function", None), ("click", "Create Animal", None)],
+    "pages/15_regex.py": [
+        ("set", "Enter a regex pattern:", r"\b\w{3}\b"),
+        ("set", "Enter a regex pattern to replace:", r"[0-9]"),
+    ],
+    "pages/16_advanced.py": [
+        ("click", "Get MRO for Class C", None),
+        ("click", "Add Numbers", None),
+        ("click", "Run Function", None),
+    ],
+}
+
+INPUT_WIDGETS = ("text_input", "text_area", "number_input", "slider", "selectbox", "radio")
+
+
+def app_files():
+    return ["home.py"] + sorted(str(path.relative_to(ROOT)) for path in (ROOT / "pages").glob("*.py"))
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def record_messages():
+    # AppTest only keeps the parsed element tree, so hold on to the raw
+    # messages of the last run to measure what would go to the browser.
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    last_run = []
+    forward_msgs = LocalScriptRunner.forward_msgs
+
+    def recording_forward_msgs(self):
+        messages = forward_msgs(self)
+        last_run[:] = messages
+        return messages
+
+    LocalScriptRunner.forward_msgs = recording_forward_msgs
+    return last_run
+
+
+def find_widget(app, action, label):
+    kinds = ("button",) if action == "click" else INPUT_WIDGETS
+    for kind in kinds:
+        for widget in getattr(app, kind):
+            if widget.label == label:
+                return widget
+    return None
+
+
+def run_page(file):
+    import os
+
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    messages = record_messages()
+    app = AppTest.from_file(str(ROOT / file), default_timeout=60)
+    steps = [("load", None, None)] + SCENARIOS.get(file, []) + [("rerun", None, None)]
+    results = []
+    for action, label, value in steps:
+        name = action if label is None else f"{action} {label!r}"
+        if action in ("click", "set"):
+            widget = find_widget(app, action, label)
+            if widget is None:
+                results.append({"step": name, "skipped": "widget not found"})
+                continue
+            if action == "click":
+                widget.click()
+            else:
+                widget.set_value(value)
+        start = time.perf_counter()
+        app.run()
+        elapsed = (time.perf_counter() - start) * 1000
+        deltas = [message for message in messages if message.WhichOneof("type") == "delta"]
+        results.append({
+            "step": name,
+            "wall_ms": round(elapsed, 2),
+            "elements": sum(1 for message in deltas if message.delta.WhichOneof("type") == "new_element"),
+            "payload_bytes": sum(message.ByteSize() for message in messages),
+            "peak_rss_kb": peak_rss_kb(),
+            "exceptions": len(app.exception),
+        })
+    return results
+
+
+def benchmark_page(file):
+    output = subprocess.run(
+        [sys.executable, __file__, "--page", file],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def page_totals(steps):
+    measured = [step for step in steps if "wall_ms" in step]
+    return {
+        "wall_ms": sum(step["wall_ms"] for step in measured),
+        "payload_bytes": sum(step["payload_bytes"] for step in measured),
+        "peak_rss_kb": max((step["peak_rss_kb"] or 0 for step in measured), default=0),
+    }
+
+
+def compare(old, new, threshold):
+    regressions = []
+    print(f"{'page':40} {'wall time':>22} {'payload':>26} {'peak RSS':>22}")
+    for file, steps in new["pages"].items():
+        if file not in old["pages"]:
+            continue
+        before, after = page_totals(old["pages"][file]), page_totals(steps)
+        columns = []
+        for metric in ("wall_ms", "payload_bytes", "peak_rss_kb"):
+            change = (after[metric] - before[metric]) / before[metric] if before[metric] else 0
+            if change > threshold:
+                regressions.append(f"{file} {metric} {change:+.0%}")
+            columns.append(f"{before[metric]:>9.0f} -> {after[metric]:<9.0f}{change:+5.0%}")
+        print(f"{file:40} " + " ".join(columns))
+    if regressions:
+        print(f"\nRegressions over {threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="bench_results.json", help="where to write the results (default: bench_results.json)")
+    parser.add_argument("--compare", metavar="FILE", help="earlier results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative increase reported as a regression (default: 0.25)")
+    parser.add_argument("--page", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.page:
+        print(json.dumps(run_page(args.page)))
+        return 0
+
+    import streamlit
+
+    results = {
+        "revision": git_revision(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "pages": {},
+    }
+    for file in app_files():
+        results["pages"][file] = benchmark_page(file)
+        totals = page_totals(results["pages"][file])
+        print(f"{file:40} {totals['wall_ms']:8.1f} ms {totals['payload_bytes']:>9} bytes {totals['peak_rss_kb']:>8} KB")
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        print()
+        old = json.loads(Path(args.compare).read_text())
+        if compare(old, results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""
+Exports the static part of every page to plain HTML.
+
+    python scripts/export_static.py                                   # writes site/
+    python scripts/export_static.py --live-url https://learn.example.org
+
+Reading a lesson doesn't need a Streamlit session: the text and code come
+from content/*.md, and the page only decides their order. This script reads
+that order from each page's source without running it. Lesson sections and
+constant titles and Markdown become HTML; every run of interactive code
+(widgets, quizzes, anything that depends on input) becomes a link to the
+same page in the live app. The result can be served by any static file
+server, and only readers who want to try something open a session.
+"""
+
+import argparse
+import ast
+import html
+import re
+import shutil
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.content import load_lessons  # noqa: E402
+
+# Calls to these render constant content and are exported as they are
+STATIC_CALLS = {"title", "header", "subheader", "markdown", "caption", "code", "divider"}
+# Calls to these don't render anything
+SILENT_CALLS = {"set_page_config", "get_lesson", "lazy_import"}
+
+STYLE = """
+body { font-family: "Source Sans Pro", system-ui, sans-serif; margin: 0; display: flex; color: #31333f; line-height: 1.6; }
+nav { width: 16rem; padding: 2rem 1rem; background: #f0f2f6; min-height: 100vh; flex-shrink: 0; }
+nav a { display: block; color: inherit; text-decoration: none; padding: 0.2rem 0.5rem; border-radius: 0.4rem; }
+nav a.current { background: #e0e3ea; font-weight: 600; }
+main { max-width: 46rem; padding: 2rem 3rem; }
+pre { background: #f0f2f6; padding: 1rem; border-radius: 0.5rem; overflow-x: auto; }
+code { font-family: "Source Code Pro", monospace; font-size: 0.9em; }
+table { border-collapse: collapse; } th, td { border: 1px solid #d6d6d9; padding: 0.3rem 0.6rem; }
+.live { border: 1px solid #ff4b4b; border-radius: 0.5rem; padding: 0.6rem 1rem; margin: 1rem 0; }
+.live a { color: #ff4b4b; font-weight: 600; }
+"""
+
+
+# --- Which parts of a page are static -------------------------------------
+
+def _calls(node):
+    return [child for child in ast.walk(node) if isinstance(child, ast.Call)]
+
+
+def _call_name(call):
+    func = call.func
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        return func.value.id, func.attr
+    if isinstance(func, ast.Name):
+        return None, func.id
+    return None, None
+
+
+def _constant_args(call):
+    return all(isinstance(arg, ast.Constant) for arg in call.args) and all(
+        isinstance(keyword.value, ast.Constant) for keyword in call.keywords
+    )
+
+
+def page_outline(source):
+    # The page as a list of ("section", id), ("element", kind, args),
+    # ("interactive",) steps, in the order the page renders them
+    module = ast.parse(source)
+    local_functions = {node.name for node in module.body if isinstance(node, (ast.FunctionDef, ast.ClassDef))}
+    outline = []
+
+    def interactive():
+        if not outline or outline[-1] != ("interactive",):
+            outline.append(("interactive",))
+
+    for statement in module.body:
+        if isinstance(statement, (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.ClassDef)):
+            continue
+        if isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call):
+            call = statement.value
+            owner, name = _call_name(call)
+            if owner == "lesson" and name == "show":
+                outline.append(("section", call.args[0].value))
+                continue
+            if name == "show_try_it":
+                outline.append(("section", call.args[1].value))
+                interactive()
+                continue
+            if owner == "st" and name in STATIC_CALLS and _constant_args(call):
+                outline.append(("element", name, [arg.value for arg in call.args]))
+                continue
+        renders = False
+        for call in _calls(statement):
+            owner, name = _call_name(call)
+            if name is None or name in SILENT_CALLS:
+                continue
+            if owner in ("st", "lesson") or (owner is None and (name in local_functions or name.startswith("show_"))):
+                renders = True
+        if renders:
+            interactive()
+    return outline
+
+
+# --- A small Markdown renderer, enough for the lessons --------------------
+
+_INLINE = [
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])"), r"<em>\1</em>"),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)"), r'<a href="\2">\1</a>'),
+]
+
+
+def _inline(text):
+    # Code spans are set aside first, so emphasis may wrap them
+    spans = []
+
+    def keep(match):
+        spans.append(f"<code>{html.escape(match.group(1))}</code>")
+        return f"\0{len(spans) - 1}\0"
+
+    text = html.escape(re.sub(r"`([^`]+)`", keep, text), quote=False)
+    for pattern, replacement in _INLINE:
+        text = pattern.sub(replacement, text)
+    return re.sub(r"\0(\d+)\0", lambda match: spans[int(match.group(1))], text)
+
+
+def _table(rows):
+    cells = [[cell.strip() for cell in row.strip().strip("|").split("|")] for row in rows]
+    head, body = cells[0], cells[2:]
+    out = ["<table><thead><tr>", *(f"<th>{_inline(cell)}</th>" for cell in head), "</tr></thead><tbody>"]
+    for row in body:
+        out += ["<tr>", *(f"<td>{_inline(cell)}</td>" for cell in row), "</tr>"]
+    out.append("</tbody></table>")
+    return "".join(out)
+
+
+def _list(items):
+    # items: (indent, ordered, text); nested lists are indented by two or more spaces
+    out = []
+    stack = []
+    for indent, ordered, text in items:
+        while stack and indent < stack[-1][0]:
+            out.append(f"</li></{stack.pop()[1]}>")
+        if not stack or indent > stack[-1][0]:
+            tag = "ol" if ordered else "ul"
+            stack.append((indent, tag))
+            out.append(f"<{tag}><li>")
+        else:
+            out.append("</li><li>")
+        out.append(_inline(text))
+    while stack:
+        out.append(f"</li></{stack.pop()[1]}>")
+    return "".join(out)
+
+
+_LIST_ITEM = re.compile(r"^(\s*)(?:([-*])|(\d+)\.)\s+(.*)$")
+
+
+def markdown_to_html(text):
+    out = []
+    paragraph = []
+    lines = text.splitlines()
+    index = 0
+
+    def end_paragraph():
+        if paragraph:
+            # Two trailing spaces are a line break inside the paragraph
+            text = "".join(_inline(line.strip()) + ("<br>" if line.endswith("  ") else " ") for line in paragraph)
+            out.append(f"<p>{text.removesuffix('<br>').strip()}</p>")
+            paragraph.clear()
+
+    while index < len(lines):
+        line = lines[index]
+        stripped = line.strip()
+        heading = re.match(r"^(#{1,6})\s+(.*)$", stripped)
+        if not stripped:
+            end_paragraph()
+        elif heading:
+            end_paragraph()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        elif re.fullmatch(r"-{3,}|\*{3,}", stripped):
+            end_paragraph()
+            out.append("<hr>")
+        elif stripped.startswith("|"):
+            end_paragraph()
+            rows = []
+            while index < len(lines) and lines[index].strip().startswith("|"):
+                rows.append(lines[index])
+                index += 1
+            out.append(_table(rows))
+            continue
+        elif _LIST_ITEM.match(line):
+            end_paragraph()
+            items = []
+            while index < len(lines) and _LIST_ITEM.match(lines[index]):
+                indent, bullet, number, item = _LIST_ITEM.match(lines[index]).groups()
+                items.append((len(indent), number is not None, item))
+                index += 1
+            out.append(_list(items))
+            continue
+        elif stripped.startswith(">"):
+            end_paragraph()
+            out.append(f"<blockquote>{_inline(stripped.lstrip('> '))}</blockquote>")
+        else:
+            paragraph.append(line)
+        index += 1
+    end_paragraph()
+    return "\n".join(out)
+
+
+# --- Pages ----------------------------------------------------------------
+
+def page_files():
+    return [ROOT / "home.py"] + sorted((ROOT / "pages").glob("*.py"), key=lambda path: int(path.stem.split("_")[0]))
+
+
+def live_path(file):
+    # The URL path Streamlit serves a page under: its file name without the number
+    return "" if file.name == "home.py" else re.sub(r"^\d+_", "", file.stem)
+
+
+def output_name(file):
+    return "index.html" if file.name == "home.py" else f"{file.stem}.html"
+
+
+def page_title(outline, file):
+    for step in outline:
+        if step[0] == "element" and step[1] == "title":
+            return step[2][0]
+    return file.stem
+
+
+def render_page(file, outline, lessons, live_url):
+    page = "home" if file.name == "home.py" else file.stem
+    lesson = lessons[page]
+    live_link = f"{live_url.rstrip('/')}/{live_path(file)}"
+    body = []
+    for step in outline:
+        if step[0] == "section":
+            for block in lesson.sections[step[1]]:
+                if block.kind == "code":
+                    body.append(f'<pre><code class="language-python">{html.escape(block.text)}</code></pre>')
+                else:
+                    body.append(markdown_to_html(block.text))
+        elif step[0] == "element":
+            kind, args = step[1], step[2]
+            if kind == "title":
+                body.append(f"<h1>{_inline(args[0])}</h1>")
+            elif kind == "header":
+                body.append(f"<h2>{_inline(args[0])}</h2>")
+            elif kind == "subheader":
+                body.append(f"<h3>{_inline(args[0])}</h3>")
+            elif kind == "code":
+                body.append(f"<pre><code>{html.escape(args[0])}</code></pre>")
+            elif kind == "caption":
+                body.append(f"<p><small>{_inline(args[0])}</small></p>")
+            elif kind == "divider":
+                body.append("<hr>")
+            else:
+                body.append(markdown_to_html(args[0]))
+        else:
+            body.append(f'<div class="live">🧪 This part is interactive. <a href="{html.escape(live_link)}">Try it in the live app →</a></div>')
+    return "\n".join(body)
+
+
+def render_site(live_url, output):
+    lessons = load_lessons()
+    pages = [(file, page_outline(file.read_text(encoding="utf-8"))) for file in page_files()]
+    titles = {file: page_title(outline, file) for file, outline in pages}
+    output.mkdir(parents=True, exist_ok=True)
+    (output / "style.css").write_text(STYLE.lstrip(), encoding="utf-8")
+    for file, outline in pages:
+        links = "\n".join(
+            f'<a href="{output_name(other)}"{" class=current" if other == file else ""}>{html.escape(titles[other])}</a>'
+            for other, _ in pages
+        )
+        document = (
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+            f"<title>{html.escape(titles[file])}</title>\n"
+            '<link rel="stylesheet" href="style.css">\n</head>\n<body>\n'
+            f"<nav>\n{links}\n</nav>\n<main>\n{render_page(file, outline, lessons, live_url)}\n</main>\n"
+            "</body>\n</html>\n"
+        )
+        (output / output_name(file)).write_text(document, encoding="utf-8")
+    return [output / output_name(file) for file, _ in pages]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="site", help="directory to write the pages to (default: site)")
+    parser.add_argument("--live-url", default="http://localhost:8501", help="where the live app runs (default: http://localhost:8501)")
+    parser.add_argument("--clean", action="store_true", help="empty the output directory first")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    if args.clean and output.exists():
+        shutil.rmtree(output)
+    written = render_site(args.live_url, output)
+    total = sum(path.stat().st_size for path in written)
+    print(f"Wrote {len(written)} pages ({total / 1024:.0f} KB) to {output}/")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
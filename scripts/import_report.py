@@ -0,0 +1,106 @@
+"""
+Reports what each page costs to start in a fresh server process, and fails
+when a page goes over its budget.
+
+    python scripts/import_report.py
+
+Every page runs once with Streamlit's AppTest in its own interpreter.
+Streamlit itself is imported first and not counted, since a server always
+has it loaded. The report shows the time of that first run and the heavy
+libraries it pulled in. The exit status is 1 if any page is over budget.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Libraries worth calling out when a page imports them at startup
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "altair", "pydeck", "PIL", "matplotlib")
+
+# First-run budget in milliseconds: the slowest of three runs on a 1-CPU
+# machine, plus about 30%, rounded up to 100 ms. Streamlit imports pandas
+# and pyarrow for any table or dataframe, and to inspect a list or dict
+# given to `st.write`, which is what the pages over a second spend it on.
+# A page not listed here gets the default.
+DEFAULT_BUDGET_MS = 500
+BUDGETS_MS = {
+    "home.py": 600,
+    "pages/1_introduction_to_python.py": 500,
+    "pages/2_syntax_and_variables.py": 1200,
+    "pages/3_conditional_statements.py": 600,
+    "pages/4_loops.py": 500,
+    "pages/5_strings.py": 500,
+    "pages/6_functions.py": 600,
+    "pages/7_modules_and_packages.py": 400,
+    "pages/8_file_handling.py": 1200,
+    "pages/9_error_handling.py": 1300,
+    "pages/10_oop.py": 1300,
+    "pages/11_data_structures.py": 1200,
+    "pages/12_comprehensions.py": 1200,
+    "pages/13_iterators_and_generators.py": 1300,
+    "pages/14_decorators.py": 1400,
+    "pages/15_regex.py": 1300,
+    "pages/16_advanced.py": 600,
+}
+
+
+def app_files():
+    return ["home.py"] + sorted(str(path.relative_to(ROOT)) for path in (ROOT / "pages").glob("*.py"))
+
+
+def first_run(file):
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    before = set(sys.modules)
+    start = time.perf_counter()
+    AppTest.from_file(str(ROOT / file), default_timeout=60).run()
+    elapsed = (time.perf_counter() - start) * 1000
+    new = {name.partition(".")[0] for name in set(sys.modules) - before}
+    return {"ms": elapsed, "heavy": sorted(new.intersection(HEAVY_MODULES))}
+
+
+def measure(file):
+    output = subprocess.run(
+        [sys.executable, __file__, "--page", file],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.page:
+        print(json.dumps(first_run(args.page)))
+        return 0
+
+    over_budget = []
+    print(f"{'page':45} {'first run':>10} {'budget':>8}  heavy imports")
+    for file in app_files():
+        result = measure(file)
+        budget = BUDGETS_MS.get(file, DEFAULT_BUDGET_MS)
+        flag = ""
+        if result["ms"] > budget:
+            over_budget.append(file)
+            flag = "  <-- over budget"
+        heavy = ", ".join(result["heavy"]) or "-"
+        print(f"{file:45} {result['ms']:8.0f}ms {budget:6}ms  {heavy}{flag}")
+
+    if over_budget:
+        print(f"\n{len(over_budget)} page(s) over budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Throughput of the learner progress store (utils/progress.py).
+
+    python scripts/progress_benchmark.py
+    python scripts/progress_benchmark.py --threads 16 --events 50000
+
+Several threads, standing in for concurrent sessions, record progress
+events for many learners. The report shows how many events per second
+`record()` accepts, its latency as a click would see it, and how long the
+background writer then needs to get everything on disk. For comparison the
+same events are written one transaction per event, the way a store without
+write-behind would.
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.progress import ProgressStore, _SCHEMA, _UPSERT, _connect  # noqa: E402
+
+
+def events(count, learners, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        learner = f"learner-{rng.randrange(learners)}"
+        if rng.random() < 0.5:
+            yield learner, f"quiz:q{rng.randrange(20)}", rng.random() < 0.7
+        else:
+            yield learner, f"try:page-{rng.randrange(16)}:try-{rng.randrange(6)}", True
+
+
+def run_threads(threads, target):
+    workers = [threading.Thread(target=target, args=(number,)) for number in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_store(path, threads, per_thread, learners):
+    store = ProgressStore(path)
+    latencies = [[] for _ in range(threads)]
+
+    def session(number):
+        for learner, item, value in events(per_thread, learners, number):
+            start = time.perf_counter()
+            store.record(learner, item, value)
+            latencies[number].append(time.perf_counter() - start)
+
+    elapsed = run_threads(threads, session)
+    start = time.perf_counter()
+    store.flush()
+    drain = time.perf_counter() - start
+    stats = store.stats()
+    store.close()
+
+    samples = sorted(sample for samples in latencies for sample in samples)
+    return {
+        "elapsed": elapsed,
+        "drain": drain,
+        "p50_us": statistics.median(samples) * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+        "rows": stats["rows_written"],
+        "flushes": stats["flushes"],
+    }
+
+
+def bench_write_through(path, threads, per_thread, learners):
+    connection = _connect(path)
+    connection.execute(_SCHEMA)
+    connection.commit()
+    lock = threading.Lock()
+
+    def session(number):
+        for learner, item, value in events(per_thread, learners, number):
+            with lock, connection:
+                connection.execute(_UPSERT, (learner, item, str(value).lower(), time.time()))
+
+    return run_threads(threads, session)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8, help="concurrent sessions (default: 8)")
+    parser.add_argument("--events", type=int, default=40000, help="events in total (default: 40000)")
+    parser.add_argument("--learners", type=int, default=2000, help="distinct learners (default: 2000)")
+    args = parser.parse_args()
+    per_thread = args.events // args.threads
+    total = per_thread * args.threads
+
+    with tempfile.TemporaryDirectory() as directory:
+        result = bench_store(Path(directory) / "write_behind.sqlite3", args.threads, per_thread, args.learners)
+        baseline = bench_write_through(Path(directory) / "write_through.sqlite3", args.threads, per_thread, args.learners)
+        with sqlite3.connect(Path(directory) / "write_behind.sqlite3") as connection:
+            stored = connection.execute("SELECT COUNT(*) FROM progress").fetchone()[0]
+
+    print(f"{total} events from {args.threads} threads, {args.learners} learners")
+    print(f"write-behind:  {total / result['elapsed']:10.0f} events/s accepted, "
+          f"record() p50 {result['p50_us']:.1f} µs, p99 {result['p99_us']:.1f} µs")
+    print(f"               {total / (result['elapsed'] + result['drain']):10.0f} events/s on disk, "
+          f"{result['rows']} rows in {result['flushes']} flushes, {stored} distinct rows stored")
+    print(f"write-through: {total / baseline:10.0f} events/s, one transaction per event")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Measures how long a plain rerun of each page takes, using Streamlit's AppTest.
+
+    python scripts/rerun_timing.py                   # this working tree
+    python scripts/rerun_timing.py --compare HEAD~1  # and a git revision, side by side
+
+Every page is run once to warm up, then rerun `--runs` times; the median
+rerun time is reported. Each tree is measured in its own interpreter so
+that imported modules and caches don't leak from one to the other.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def app_files(root):
+    return ["home.py"] + sorted(str(path.relative_to(root)) for path in (root / "pages").glob("*.py"))
+
+
+def time_reruns(root, runs):
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(root)
+    sys.path.insert(0, str(root))
+    timings = {}
+    for file in app_files(root):
+        app = AppTest.from_file(str(root / file), default_timeout=30).run()
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            app.run()
+            samples.append((time.perf_counter() - start) * 1000)
+        timings[file] = statistics.median(samples)
+    return timings
+
+
+def measure(root, runs):
+    output = subprocess.run(
+        [sys.executable, __file__, "--tree", str(root), "--runs", str(runs), "--json"],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def export_revision(revision, destination):
+    archive = subprocess.run(["git", "archive", revision], cwd=ROOT, check=True, capture_output=True).stdout
+    subprocess.run(["tar", "-x", "-C", destination], input=archive, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="reruns per page (default: 20)")
+    parser.add_argument("--compare", metavar="REV", help="also measure this git revision")
+    parser.add_argument("--tree", help=argparse.SUPPRESS)
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.tree:
+        timings = time_reruns(Path(args.tree), args.runs)
+        print(json.dumps(timings))
+        return
+
+    current = measure(ROOT, args.runs)
+    if not args.compare:
+        for file, ms in current.items():
+            print(f"{file:45} {ms:8.2f} ms")
+        print(f"{'total':45} {sum(current.values()):8.2f} ms")
+        return
+
+    with tempfile.TemporaryDirectory() as tree:
+        export_revision(args.compare, tree)
+        base = measure(Path(tree), args.runs)
+    print(f"{'page':45} {args.compare:>10} {'current':>10} {'change':>8}")
+    for file, ms in current.items():
+        if file in base:
+            print(f"{file:45} {base[file]:8.2f}ms {ms:8.2f}ms {(ms - base[file]) / base[file]:+8.1%}")
+    total_base = sum(base[file] for file in current if file in base)
+    total = sum(ms for file, ms in current.items() if file in base)
+    print(f"{'total':45} {total_base:8.2f}ms {total:8.2f}ms {(total - total_base) / total_base:+8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Very large integers: computing them quickly and showing them briefly.
+
+Python's integers have no size limit, but printing one is another matter:
+converting an int of more than 4,300 digits to text raises `ValueError`,
+and a 200,000-digit number is useless on a page anyway. `digit_count()`
+and `preview()` describe a number by its length and its first and last
+digits without ever building its full decimal string, and a `Previewer`
+does the same faster for a run of numbers of similar size.
+
+`FibonacciService` computes any term with fast doubling, which needs
+O(log n) multiplications instead of n additions, and keeps the terms it
+has computed in a process-wide cache bounded by their total size.
+
+`FactorialService` computes n! in a `utils.workers` process, so a large n
+is stopped by the worker's CPU limit instead of holding up the server,
+and keeps the summaries of the results it has computed.
+"""
+
+import functools
+import math
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from utils.workers import JobCache
+
+_LOG10_2 = math.log10(2)
+
+Term = namedtuple("Term", ["n", "value", "seconds", "cached"])
+
+
+@functools.lru_cache(maxsize=16)
+def _power_of_ten(exponent):
+    return 10**exponent
+
+
+def _digit_count(value, power_of_ten):
+    value = abs(value)
+    if value == 0:
+        return 1
+    # The estimate from the bit length is exact or one short
+    digits = int((value.bit_length() - 1) * _LOG10_2) + 1
+    return digits + 1 if value >= power_of_ten(digits) else digits
+
+
+def _preview(value, edge, power_of_ten):
+    digits = _digit_count(value, power_of_ten)
+    if digits <= 2 * edge + 3:
+        return str(value)
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    head = value // power_of_ten(digits - edge)
+    tail = value % 10**edge
+    return f"{sign}{head}…{tail:0{edge}d} ({digits:,} digits)"
+
+
+def digit_count(value):
+    # Number of decimal digits of abs(value)
+    return _digit_count(value, _power_of_ten)
+
+
+def preview(value, edge=20):
+    # The number itself when short, else its first and last `edge` digits
+    return _preview(value, edge, _power_of_ten)
+
+
+class Previewer:
+    # preview() for a run of numbers of similar size, such as consecutive
+    # terms. 10**k costs as much as a big multiplication, but neighbouring
+    # numbers have nearly the same number of digits, so each power is
+    # stepped from the last one this previewer computed.
+    def __init__(self, edge=20):
+        self.edge = edge
+        self._last = (0, 1)  # (exponent, 10**exponent)
+
+    def __call__(self, value):
+        return _preview(value, self.edge, self._power_of_ten)
+
+    def _power_of_ten(self, exponent):
+        last_exponent, last = self._last
+        step = exponent - last_exponent
+        if 0 <= step <= 64:
+            power = last * 10**step
+        elif -64 <= step < 0:
+            power = last // 10**-step
+        else:
+            power = _power_of_ten(exponent)
+        self._last = (exponent, power)
+        return power
+
+
+class BoundedCache:
+    # Least recently used values first out once their total size in bytes
+    # goes over `max_bytes`; `size` gives the size of one value
+    def __init__(self, max_bytes, size):
+        self.max_bytes = max_bytes
+        self._size = size
+        self._values = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._values.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        size = self._size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._values.pop(key, None)
+            if old is not None:
+                self._bytes -= self._size(old)
+            self._values[key] = value
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, oldest = self._values.popitem(last=False)
+                self._bytes -= self._size(oldest)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._values),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _int_bytes(value):
+    return (value.bit_length() + 7) // 8
+
+
+def fibonacci_pair(n):
+    # (F(n), F(n + 1)) by fast doubling:
+    #   F(2k) = F(k) * (2 * F(k + 1) - F(k))
+    #   F(2k + 1) = F(k)^2 + F(k + 1)^2
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a, b
+
+
+class FibonacciService:
+    def __init__(self, max_n=2_000_000, max_bytes=64 * 1024 * 1024):
+        # F(2,000,000) has 418,000 digits and takes a fraction of a second;
+        # each doubling of n roughly triples the time from there
+        self.max_n = max_n
+        self._pairs = BoundedCache(max_bytes, lambda pair: _int_bytes(pair[0]) + _int_bytes(pair[1]))
+
+    def term(self, n):
+        # F(n), with how long it took and whether it came from the cache
+        start = time.perf_counter()
+        pair, cached = self._pair(n)
+        return Term(n, pair[0], time.perf_counter() - start, cached)
+
+    def terms(self, start, count, chunk_size=100, seconds=None):
+        # F(start) .. F(start + count - 1) as lists of at most `chunk_size`
+        # (n, value) pairs. Only the first two terms need fast doubling; the
+        # rest are one addition each. Stops early once `seconds` have passed,
+        # counting the time the caller spends on each chunk.
+        deadline = None if seconds is None else time.monotonic() + seconds
+        (a, b), _ = self._pair(start)
+        n = start
+        end = start + count
+        while n < end and (deadline is None or time.monotonic() < deadline):
+            chunk = []
+            for n in range(n, min(end, n + chunk_size)):
+                chunk.append((n, a))
+                a, b = b, a + b
+            n += 1
+            yield chunk
+
+    def stats(self):
+        return {"max_n": self.max_n, **self._pairs.stats()}
+
+    def _pair(self, n):
+        if not 0 <= n <= self.max_n:
+            raise ValueError(f"n must be between 0 and {self.max_n:,}")
+        pair = self._pairs.get(n)
+        if pair is not None:
+            return pair, True
+        pair = fibonacci_pair(n)
+        self._pairs.put(n, pair)
+        return pair, False
+
+
+def factorial_summary(n, edge=20):
+    # Runs in a worker. math.factorial multiplies by binary splitting
+    # (products of halves of the range, so the big multiplications are
+    # between numbers of similar size) with no recursion limit to hit.
+    # Only the summary goes back: 200,000! alone is 400 KB.
+    start = time.perf_counter()
+    value = math.factorial(n)
+    seconds = time.perf_counter() - start
+    return {"n": n, "digits": digit_count(value), "preview": preview(value, edge), "seconds": seconds}
+
+
+class FactorialService:
+    def __init__(self, pool, max_n=200_000, cpu_seconds=4, max_results=256):
+        # 200,000! and its preview take about 1.5 s of CPU, well under the
+        # limit, so every n allowed finishes; 1,000,000! would take 15 s
+        self.max_n = max_n
+        self._jobs = JobCache(pool, factorial_summary, max_results, cpu_seconds=cpu_seconds, timeout=cpu_seconds + 5)
+
+    def compute(self, n):
+        # The job whose result is factorial_summary(n); see JobCache
+        if not 0 <= n <= self.max_n:
+            raise ValueError(f"n must be between 0 and {self.max_n:,}")
+        return self._jobs.get(n)
+
+    def stats(self):
+        return {"max_n": self.max_n, "cached_results": self._jobs.finished()}
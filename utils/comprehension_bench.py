@@ -0,0 +1,167 @@
+"""
+The benchmark lab on the comprehensions page: for-loop vs comprehension vs
+`map` vs NumPy, timed with `timeit`.
+
+Each case is one of the page's own examples, written four ways. A
+measurement runs in a `utils.workers` process: every version is timed
+`repeats` times, and the mean per call is reported with a 95% confidence
+interval. `BenchmarkService` keeps finished measurements by their
+parameters, so asking again for the same case, size and repeats costs
+nothing.
+"""
+
+import math
+import statistics
+import timeit
+
+from utils.lazy import lazy_import
+from utils.workers import JobCache
+
+# Only the workers that run a measurement need NumPy
+np = lazy_import("numpy")
+
+
+def squares_loop(n):
+    squares = []
+    for i in range(n):
+        squares.append(i**2)
+    return squares
+
+
+def squares_comprehension(n):
+    return [i**2 for i in range(n)]
+
+
+def squares_map(n):
+    return list(map(lambda i: i**2, range(n)))
+
+
+def squares_numpy(n):
+    return np.arange(n) ** 2
+
+
+def num_dict_loop(n):
+    num_dict = {}
+    for i in range(n):
+        num_dict[i] = i**2
+    return num_dict
+
+
+def num_dict_comprehension(n):
+    return {i: i**2 for i in range(n)}
+
+
+def num_dict_map(n):
+    return dict(map(lambda i: (i, i**2), range(n)))
+
+
+def num_dict_numpy(n):
+    keys = np.arange(n)
+    return dict(zip(keys.tolist(), (keys**2).tolist()))
+
+
+def unique_squares_loop(n):
+    unique_squares = set()
+    for i in range(n):
+        unique_squares.add(i**2)
+    return unique_squares
+
+
+def unique_squares_comprehension(n):
+    return {i**2 for i in range(n)}
+
+
+def unique_squares_map(n):
+    return set(map(lambda i: i**2, range(n)))
+
+
+def unique_squares_numpy(n):
+    return np.unique(np.arange(n) ** 2)
+
+
+def table_loop(n):
+    table = []
+    for i in range(1, n + 1):
+        row = []
+        for j in range(1, n + 1):
+            row.append(i * j)
+        table.append(row)
+    return table
+
+
+def table_comprehension(n):
+    return [[i * j for j in range(1, n + 1)] for i in range(1, n + 1)]
+
+
+def table_map(n):
+    numbers = range(1, n + 1)
+    return list(map(lambda i: list(map(i.__mul__, numbers)), numbers))
+
+
+def table_numpy(n):
+    numbers = np.arange(1, n + 1)
+    return numbers[:, None] * numbers
+
+
+# Case -> version -> function of n. For the multiplication table, n is the
+# side of the table, so it holds n * n numbers.
+CASES = {
+    "squares": {
+        "for loop": squares_loop, "comprehension": squares_comprehension,
+        "map": squares_map, "NumPy": squares_numpy,
+    },
+    "num_dict": {
+        "for loop": num_dict_loop, "comprehension": num_dict_comprehension,
+        "map": num_dict_map, "NumPy": num_dict_numpy,
+    },
+    "unique_squares": {
+        "for loop": unique_squares_loop, "comprehension": unique_squares_comprehension,
+        "map": unique_squares_map, "NumPy": unique_squares_numpy,
+    },
+    "multiplication_table": {
+        "for loop": table_loop, "comprehension": table_comprehension,
+        "map": table_map, "NumPy": table_numpy,
+    },
+}
+SIZES = {
+    "squares": (10, 100, 1_000, 10_000, 100_000, 1_000_000),
+    "num_dict": (10, 100, 1_000, 10_000, 100_000, 1_000_000),
+    "unique_squares": (10, 100, 1_000, 10_000, 100_000, 1_000_000),
+    "multiplication_table": (10, 30, 100, 300, 1_000),
+}
+
+# Two-sided 95% quantiles of Student's t distribution, by degrees of freedom
+_T_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+         10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042}
+
+
+def t_95(degrees):
+    return _T_95[max(key for key in _T_95 if key <= degrees)] if degrees < 30 else 1.96
+
+
+def benchmark(case, n, repeats=5, sample_seconds=0.05):
+    # Mean seconds per call of every version, with a 95% confidence interval
+    results = {}
+    for version, function in CASES[case].items():
+        timer = timeit.Timer(lambda: function(n))
+        # A first call outside the timing, so the lazy `import numpy` and other
+        # one-off costs don't count. Then autorange() times enough calls to
+        # take 0.2 s, and each sample gets enough calls to take about
+        # sample_seconds.
+        function(n)
+        calls, seconds = timer.autorange()
+        number = max(1, min(1_000_000, int(sample_seconds * calls / max(seconds, 1e-9))))
+        samples = [total / number for total in timer.repeat(repeats, number)]
+        mean = statistics.fmean(samples)
+        spread = t_95(repeats - 1) * statistics.stdev(samples) / math.sqrt(repeats) if repeats > 1 else 0.0
+        results[version] = {"mean": mean, "low": max(mean - spread, 0.0), "high": mean + spread, "calls": number}
+    return results
+
+
+class BenchmarkService:
+    def __init__(self, pool, max_results=256):
+        self._jobs = JobCache(pool, benchmark, max_results)
+
+    def measure(self, case, n, repeats=5):
+        # The job whose result is benchmark(case, n, repeats); see JobCache
+        return self._jobs.get(case, n, repeats)
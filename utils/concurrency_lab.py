@@ -0,0 +1,131 @@
+"""
+The concurrency lab on the advanced page: the same tasks run sequentially,
+with `threading`, a `ThreadPoolExecutor`, a `ProcessPoolExecutor` and
+`asyncio`, for a range of worker counts.
+
+A CPU-bound task is pure Python arithmetic, so threads take turns holding
+the GIL and only processes can run several at once. An I/O-bound task
+mostly waits (a sleep stands in for a network call), so threads and
+asyncio overlap the waits almost perfectly. Every run happens in a
+`utils.workers` process; `ConcurrencyLabService` keeps the results by
+their parameters, so looking at the same chart again costs nothing.
+"""
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from utils.workers import JobCache
+
+CPU_TASK_SIZE = 100_000  # about 5 ms of arithmetic
+IO_TASK_SECONDS = 0.02
+
+
+def cpu_task(_=None):
+    return sum(i * i for i in range(CPU_TASK_SIZE))
+
+
+def io_task(_=None):
+    time.sleep(IO_TASK_SECONDS)
+
+
+async def cpu_task_async():
+    # Nothing to await: the event loop can't run anything else meanwhile
+    return cpu_task()
+
+
+async def io_task_async():
+    await asyncio.sleep(IO_TASK_SECONDS)
+
+
+WORKLOADS = {"CPU-bound": (cpu_task, cpu_task_async), "I/O-bound": (io_task, io_task_async)}
+
+
+def run_sequential(task, _, workers, tasks):
+    for number in range(tasks):
+        task(number)
+
+
+def run_threading(task, _, workers, tasks):
+    numbers = queue.SimpleQueue()
+    for number in range(tasks):
+        numbers.put(number)
+
+    def work():
+        while True:
+            try:
+                number = numbers.get_nowait()
+            except queue.Empty:
+                return
+            task(number)
+
+    threads = [threading.Thread(target=work) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_thread_pool(task, _, workers, tasks):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(task, range(tasks)))
+
+
+def run_process_pool(task, _, workers, tasks):
+    # Processes are started before the clock starts, see measure()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_noop, range(workers)))
+        start = time.perf_counter()
+        list(executor.map(task, range(tasks), chunksize=max(1, tasks // (workers * 4))))
+        return time.perf_counter() - start
+
+
+def run_asyncio(_, task_async, workers, tasks):
+    async def main():
+        # At most `workers` tasks in flight, like the pools
+        limit = asyncio.Semaphore(workers)
+
+        async def limited():
+            async with limit:
+                await task_async()
+
+        await asyncio.gather(*(limited() for _ in range(tasks)))
+
+    asyncio.run(main())
+
+
+def _noop(_):
+    return None
+
+
+MODELS = {
+    "Sequential": run_sequential,
+    "threading": run_threading,
+    "ThreadPoolExecutor": run_thread_pool,
+    "ProcessPoolExecutor": run_process_pool,
+    "asyncio": run_asyncio,
+}
+WORKER_COUNTS = (1, 2, 4, 8, 16, 32)
+TASK_COUNTS = (16, 64, 256)
+
+
+def measure(workload, model, workers, tasks):
+    # Wall time of `tasks` tasks, without the time to start a process pool
+    task, task_async = WORKLOADS[workload]
+    start = time.perf_counter()
+    seconds = MODELS[model](task, task_async, workers, tasks)
+    if seconds is None:
+        seconds = time.perf_counter() - start
+    return {"seconds": seconds, "throughput": tasks / seconds, "cpus": os.cpu_count()}
+
+
+class ConcurrencyLabService:
+    def __init__(self, pool, max_results=512):
+        self._jobs = JobCache(pool, measure, max_results)
+
+    def measure(self, workload, model, workers, tasks):
+        # The job whose result is measure(workload, model, workers, tasks); see JobCache
+        return self._jobs.get(workload, model, workers, tasks)
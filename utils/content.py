@@ -0,0 +1,75 @@
+"""
+The static text and code of every lesson, kept in `content/<page>.md`.
+
+Each file is a list of named sections, and each section is a list of
+Markdown or code blocks:
+
+    <!-- section: defining-functions -->
+    <!-- markdown -->
+    ## 🔹 Defining Functions
+    <!-- code -->
+    def function_name(parameters):
+        ...
+
+The files are parsed once per server process (see `utils.services`) and
+pages render a section with `lesson.show("defining-functions")`.
+"""
+
+import re
+from pathlib import Path
+
+import streamlit as st
+
+CONTENT_DIR = Path(__file__).resolve().parent.parent / "content"
+
+_MARKER = re.compile(r"^<!-- (?:section: ([\w-]+)|(markdown|code)) -->$", re.MULTILINE)
+
+
+class Block:
+    __slots__ = ("kind", "text")
+
+    def __init__(self, kind, text):
+        self.kind = kind
+        self.text = text
+
+    def render(self):
+        if self.kind == "code":
+            st.code(self.text)
+        else:
+            st.markdown(self.text)
+
+
+class Lesson:
+    def __init__(self, page, sections):
+        self.page = page
+        # Section id -> tuple of blocks, in the order they appear on the page
+        self.sections = sections
+
+    def show(self, section):
+        for block in self.sections[section]:
+            block.render()
+
+
+def parse_lesson(page, text):
+    sections = {}
+    section = None
+    markers = list(_MARKER.finditer(text))
+    for number, marker in enumerate(markers):
+        section_id, kind = marker.groups()
+        if section_id:
+            if section_id in sections:
+                raise ValueError(f"{page}: duplicate section {section_id!r}")
+            section = sections[section_id] = []
+            continue
+        if section is None:
+            raise ValueError(f"{page}: block before the first section marker")
+        end = markers[number + 1].start() if number + 1 < len(markers) else len(text)
+        section.append(Block(kind, text[marker.end():end].strip("\n")))
+    return Lesson(page, {key: tuple(blocks) for key, blocks in sections.items()})
+
+
+def load_lessons(content_dir=CONTENT_DIR):
+    return {
+        path.stem: parse_lesson(path.stem, path.read_text(encoding="utf-8"))
+        for path in sorted(Path(content_dir).glob("*.md"))
+    }
@@ -0,0 +1,14 @@
+"""
+Example tasks the lesson pages run in `utils.workers` processes.
+
+They live here rather than in the pages because a worker has to be able to
+import them.
+"""
+
+import time
+
+
+def process_task(output):
+    output.put("Task running in a process!")
+    time.sleep(2)
+    output.put("Task completed!")
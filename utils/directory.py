@@ -0,0 +1,103 @@
+"""
+Paged, sorted directory listings for the directory browser.
+
+A directory is read with `os.scandir`, which yields entries lazily and
+knows from the directory itself whether an entry is a directory. Sizes and
+modification times are only looked up when they are shown or sorted on.
+A listing is cached for a few seconds and only while the directory's own
+modification time is unchanged, so paging through a directory with
+500,000 entries reads it once.
+"""
+
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+
+SORT_KEYS = ("name", "size", "modified")
+
+
+class Entry:
+    __slots__ = ("name", "is_dir", "_entry", "_stat")
+
+    def __init__(self, entry):
+        self.name = entry.name
+        try:
+            self.is_dir = entry.is_dir()
+        except OSError:
+            self.is_dir = False
+        self._entry = entry
+        self._stat = None
+
+    def _lstat(self):
+        if self._stat is None:
+            try:
+                self._stat = self._entry.stat(follow_symlinks=False)
+            except OSError:
+                self._stat = os.stat_result((stat.S_IFREG, 0, 0, 0, 0, 0, 0, 0, 0, 0))
+        return self._stat
+
+    @property
+    def size(self):
+        return 0 if self.is_dir else self._lstat().st_size
+
+    @property
+    def modified(self):
+        return self._lstat().st_mtime
+
+
+class Listing:
+    def __init__(self, path, mtime, entries):
+        self.path = path
+        self.mtime = mtime
+        self.loaded = time.monotonic()
+        self.entries = entries  # in directory order
+        self._sorted = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def sorted(self, key="name", descending=False):
+        if key not in SORT_KEYS:
+            raise ValueError(f"can't sort on {key!r}")
+        with self._lock:
+            entries = self._sorted.get((key, descending))
+            if entries is None:
+                if key == "name":
+                    # Directories first, like most file browsers
+                    order = lambda entry: (not entry.is_dir, entry.name.lower())
+                else:
+                    order = lambda entry: getattr(entry, key)
+                entries = self._sorted[key, descending] = sorted(self.entries, key=order, reverse=descending)
+        return entries
+
+    def page(self, number, size=50, key="name", descending=False):
+        return self.sorted(key, descending)[number * size:(number + 1) * size]
+
+
+class DirectoryCache:
+    def __init__(self, ttl=5.0, max_directories=32):
+        self.ttl = ttl
+        self.max_directories = max_directories
+        self._listings = OrderedDict()
+        self._lock = threading.Lock()
+
+    def listing(self, path):
+        # Raises OSError (e.g. NotADirectoryError) if the path can't be listed
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime
+        with self._lock:
+            listing = self._listings.get(path)
+            if listing is not None and listing.mtime == mtime and time.monotonic() - listing.loaded < self.ttl:
+                self._listings.move_to_end(path)
+                return listing
+        with os.scandir(path) as entries:
+            listing = Listing(path, mtime, [Entry(entry) for entry in entries])
+        with self._lock:
+            self._listings[path] = listing
+            self._listings.move_to_end(path)
+            while len(self._listings) > self.max_directories:
+                self._listings.popitem(last=False)
+        return listing
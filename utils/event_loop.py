@@ -0,0 +1,111 @@
+"""
+One asyncio event loop per server, running in a background thread.
+
+A Streamlit script runs synchronously from top to bottom, so calling
+`asyncio.run()` in a page blocks that session until every coroutine is
+done. `EventLoopService` keeps a loop running in its own thread instead:
+pages submit coroutines to it and get a `concurrent.futures.Future` back
+straight away, then poll for progress from a fragment like any other job.
+
+`fan_out()` is the lesson's example: thousands of simulated I/O waits,
+awaited concurrently, recording when each one completes.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+
+class EventLoopBusy(RuntimeError):
+    pass
+
+
+class FanOut:
+    def __init__(self, delays):
+        self.delays = delays
+        self.total = len(delays)
+        self.completed_at = []  # seconds after the start; appended to by the loop thread only
+        self.started = None
+        self.finished = None
+
+    @property
+    def completed(self):
+        return len(self.completed_at)
+
+    def done(self):
+        return self.finished is not None
+
+    @property
+    def wall_seconds(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def sequential_seconds(self):
+        # Awaited one after another, the waits would simply add up
+        return sum(self.delays)
+
+
+async def run_fan_out(fan_out):
+    fan_out.started = time.perf_counter()
+
+    async def wait(delay):
+        await asyncio.sleep(delay)  # stands in for a network call or a database query
+        fan_out.completed_at.append(time.perf_counter() - fan_out.started)
+
+    try:
+        await asyncio.gather(*(wait(delay) for delay in fan_out.delays))
+    finally:
+        fan_out.finished = time.perf_counter()
+
+
+class EventLoopService:
+    def __init__(self, max_running=50):
+        self.max_running = max_running
+        self.loop = asyncio.new_event_loop()
+        self._running = set()
+        self._submitted = 0
+        self._lock = threading.Lock()
+        thread = threading.Thread(target=self._run, name="event-loop", daemon=True)
+        thread.start()
+
+    def submit(self, coroutine):
+        # Schedules the coroutine on the loop and returns a Future for its result.
+        # Raises EventLoopBusy when `max_running` coroutines are already running.
+        with self._lock:
+            if len(self._running) >= self.max_running:
+                coroutine.close()
+                raise EventLoopBusy(f"{len(self._running)} tasks already running; try again in a moment.")
+            future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+            self._running.add(future)
+            self._submitted += 1
+        future.add_done_callback(self._finished)
+        return future
+
+    def fan_out(self, count, longest_wait, seed=None):
+        # Starts `count` waits of up to `longest_wait` seconds each, all at once
+        generator = random.Random(seed)
+        fan_out = FanOut([generator.uniform(0, longest_wait) for _ in range(count)])
+        self.submit(run_fan_out(fan_out))
+        return fan_out
+
+    def stats(self):
+        with self._lock:
+            return {
+                "running": len(self._running),
+                "max_running": self.max_running,
+                "submitted": self._submitted,
+            }
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _finished(self, future):
+        with self._lock:
+            self._running.discard(future)
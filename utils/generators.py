@@ -0,0 +1,139 @@
+"""
+Live iterators and generators that survive reruns, one set per session.
+
+A Streamlit script runs from the top on every click, so a generator created
+in the page starts over each time. `GeneratorSessions` keeps the live
+object between reruns instead, keyed by session and a name, and starts a
+fresh one only when the inputs it was created from change.
+
+Live generators can't be pickled, so they can't go in the session store.
+Their footprint is estimated from what they hold instead (a generator's
+local variables, or the sequence an iterator walks over). When the server
+goes over its budget, the iterators used the longest ago are dropped
+first; so are those idle for longer than `idle_seconds`.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+
+from utils.session_store import current_session_id
+
+
+def footprint(iterator):
+    # A shallow estimate of the memory an iterator keeps alive
+    size = sys.getsizeof(iterator)
+    frame = getattr(iterator, "gi_frame", None)
+    if frame is not None:
+        return size + sum(sys.getsizeof(value) for value in frame.f_locals.values())
+    try:
+        reduced = iterator.__reduce__()
+    except TypeError:
+        return size
+    for argument in reduced[1] if len(reduced) > 1 else ():
+        size += sys.getsizeof(argument)
+    return size
+
+
+class LiveIterator:
+    def __init__(self, iterator, inputs):
+        self.iterator = iterator
+        self.inputs = inputs
+        self.position = 0  # values taken so far
+        self.exhausted = False
+        self.size = footprint(iterator)
+        self.last_used = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, count=1):
+        # The next `count` values; fewer if the iterator runs out
+        with self._lock:
+            values = list(islice(self.iterator, count))
+            self._moved(len(values), count)
+            return values
+
+    def advance(self, count, seconds=None, chunk_size=100):
+        # Skips up to `count` values, stopping early once `seconds` have
+        # passed. Returns how many were skipped and the last of them (None
+        # if there were none).
+        deadline = None if seconds is None else time.monotonic() + seconds
+        skipped = 0
+        last = None
+        while skipped < count and not self.exhausted:
+            wanted = min(chunk_size, count - skipped)
+            with self._lock:
+                taken = 0
+                for taken, last in enumerate(islice(self.iterator, wanted), 1):
+                    pass
+                self._moved(taken, wanted)
+            skipped += taken
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+        return skipped, last
+
+    def stream(self, count, chunk_size=100):
+        # The next `count` values, as lists of at most `chunk_size`
+        while count > 0 and not self.exhausted:
+            chunk = self.take(min(chunk_size, count))
+            count -= len(chunk)
+            if chunk:
+                yield chunk
+
+    def _moved(self, taken, wanted):
+        self.position += taken
+        self.exhausted = self.exhausted or taken < wanted
+        self.last_used = time.monotonic()
+        # A generator's locals change as it runs (fibonacci's numbers grow)
+        self.size = footprint(self.iterator)
+
+
+class GeneratorSessions:
+    def __init__(self, budget_bytes=32 * 1024 * 1024, idle_seconds=30 * 60):
+        self.budget_bytes = budget_bytes
+        self.idle_seconds = idle_seconds
+        self._live = OrderedDict()  # (session id, name) -> LiveIterator, least recently used first
+        self._evicted = 0
+        self._lock = threading.Lock()
+
+    def get(self, name, factory, *inputs, session_id=None):
+        # The session's live iterator called `name`, made with factory(*inputs)
+        # the first time and whenever the inputs change
+        key = (session_id or current_session_id(), name)
+        with self._lock:
+            live = self._live.get(key)
+            if live is None or live.inputs != inputs:
+                live = self._live[key] = LiveIterator(iter(factory(*inputs)), inputs)
+            live.last_used = time.monotonic()
+            self._live.move_to_end(key)
+            self._evict()
+        return live
+
+    def reset(self, name, session_id=None):
+        with self._lock:
+            self._live.pop((session_id or current_session_id(), name), None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "live_iterators": len(self._live),
+                "sessions": len({session_id for session_id, _ in self._live}),
+                "estimated_bytes": sum(live.size for live in self._live.values()),
+                "budget_bytes": self.budget_bytes,
+                "evicted": self._evicted,
+            }
+
+    def _evict(self):
+        cutoff = time.monotonic() - self.idle_seconds
+        while self._live:
+            oldest = next(iter(self._live.values()))
+            if oldest.last_used >= cutoff:
+                break
+            self._live.popitem(last=False)
+            self._evicted += 1
+        total = sum(live.size for live in self._live.values())
+        while total > self.budget_bytes and len(self._live) > 1:
+            _, oldest = self._live.popitem(last=False)
+            total -= oldest.size
+            self._evicted += 1
@@ -0,0 +1,34 @@
+"""
+Deferred imports for heavy libraries.
+
+`pd = lazy_import("pandas")` costs nothing until the page first touches
+`pd.<something>`, so a page only pays for pandas in the sections that
+actually build a DataFrame.
+"""
+
+import importlib
+
+
+class LazyModule:
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        # Only called for attributes not found on the proxy itself.
+        # `import_module` is thread-safe, so concurrent sessions are fine.
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded yet"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
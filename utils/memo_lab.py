@@ -0,0 +1,98 @@
+"""
+The memoization lab on the decorators page: one slow recursive function,
+decorated four ways.
+
+Naive recursive Fibonacci calls itself about 1.6^n times, recomputing the
+same terms over and over, so it shows off caching better than anything.
+Each measurement builds a fresh decorated copy in a `utils.workers`
+process, runs it once for the wall time, and again under `tracemalloc`
+for the memory its cache holds afterwards.
+"""
+
+import functools
+import time
+import tracemalloc
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def ttl_cache(maxsize=128, ttl=60.0):
+    # Like functools.lru_cache, but entries also expire `ttl` seconds after
+    # they were stored. Keyword arguments aren't supported, to keep it short.
+    def decorator(func):
+        entries = OrderedDict()  # args -> (expires at, result), least recently used first
+        stats = {"hits": 0, "misses": 0}
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            entry = entries.get(args)
+            if entry is not None and entry[0] > now:
+                stats["hits"] += 1
+                entries.move_to_end(args)
+                return entry[1]
+            stats["misses"] += 1
+            result = func(*args)
+            entries[args] = (now + ttl, result)
+            entries.move_to_end(args)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+            return result
+
+        wrapper.cache_info = lambda: CacheInfo(stats["hits"], stats["misses"], maxsize, len(entries))
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+
+def no_cache(func):
+    return func
+
+
+STRATEGIES = {
+    "No cache": no_cache,
+    "lru_cache(maxsize=32)": functools.lru_cache(maxsize=32),
+    "cache": functools.cache,
+    "ttl_cache(maxsize=32, ttl=60)": ttl_cache(maxsize=32, ttl=60),
+}
+SIZES = (5, 10, 15, 20, 25, 30, 100, 200, 400)
+# Without a cache, fib(30) already makes 2.7 million calls. Cached, the
+# recursion is still n calls deep (2n frames through ttl_cache's wrapper),
+# so 400 stays under the recursion limit.
+MAX_N = {"No cache": 30}
+
+
+def make_fib(strategy):
+    # A fresh fib decorated with `strategy`, and a counter of the times its
+    # body actually ran. The recursive calls go through the decorator too.
+    calls = [0]
+
+    @STRATEGIES[strategy]
+    def fib(n):
+        calls[0] += 1
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    return fib, calls
+
+
+def measure(strategy, n):
+    fib, calls = make_fib(strategy)
+    start = time.perf_counter()
+    fib(n)
+    seconds = time.perf_counter() - start
+    if hasattr(fib, "cache_info"):
+        hits, misses = fib.cache_info()[:2]
+    else:
+        hits, misses = 0, calls[0]
+
+    tracemalloc.start()
+    try:
+        # A fresh copy, so the cache is filled while tracing is on
+        fib, _ = make_fib(strategy)
+        before, _ = tracemalloc.get_traced_memory()
+        fib(n)
+        held, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": seconds, "calls": calls[0], "hits": hits, "misses": misses, "held_bytes": max(held - before, 0)}
@@ -0,0 +1,72 @@
+"""
+The memory lab on the iterators page: lists vs generators, measured.
+
+Each measurement runs in a `utils.workers` process, so a list of 10^8
+numbers can run out of memory without touching the server. It is run
+twice: once plainly for the wall time, then under `tracemalloc` for the
+peak allocation, since tracing slows Python down several times.
+"""
+
+import time
+import tracemalloc
+
+
+def count_up_to(n):
+    count = 1
+    while count <= n:
+        yield count
+        count += 1
+
+
+def fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        yield a
+        a, b = b, a + b
+
+
+def squares(n):
+    return (x**2 for x in range(n))
+
+
+EXAMPLES = {"count_up_to": count_up_to, "fibonacci": fibonacci, "squares": squares}
+# Fibonacci numbers grow so fast that 10^5 of them would take ~0.5 GB as a list
+MAX_N = {"count_up_to": 10**8, "fibonacci": 10**4, "squares": 10**8}
+
+
+# Every variant computes the same thing: the sum of the halves of the even values
+def as_lists(source):
+    values = [value for value in source]
+    evens = [value for value in values if value % 2 == 0]
+    halves = [value // 2 for value in evens]
+    return sum(halves)
+
+
+def as_generator(source):
+    return sum(value // 2 for value in source if value % 2 == 0)
+
+
+def as_pipeline(source):
+    evens = (value for value in source if value % 2 == 0)
+    halves = (value // 2 for value in evens)
+    return sum(halves)
+
+
+VARIANTS = {"List": as_lists, "Generator": as_generator, "Generator pipeline": as_pipeline}
+
+
+def measure(example, variant, n):
+    make_source = EXAMPLES[example]
+    run = VARIANTS[variant]
+
+    start = time.perf_counter()
+    run(make_source(n))
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        run(make_source(n))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": seconds, "peak_bytes": peak}
@@ -0,0 +1,32 @@
+"""
+Multiplication tables of any size, computed one window at a time.
+
+A 10,000 x 10,000 table has 10^8 cells; as Python lists of lists that is
+gigabytes. `MultiplicationTable` never builds the whole grid: `window()`
+computes just the requested block with NumPy broadcasting (a column of
+row numbers times a row of column numbers), so browsing costs only what
+is on screen.
+"""
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+class MultiplicationTable:
+    def __init__(self, rows, columns=None):
+        self.rows = rows
+        self.columns = rows if columns is None else columns
+
+    @property
+    def shape(self):
+        return (self.rows, self.columns)
+
+    def window(self, first_row, first_column, height, width):
+        # Rows and columns are numbered from 1, like the table itself.
+        # Returns (row numbers, column numbers, products) for the block.
+        last_row = min(self.rows, first_row + height - 1)
+        last_column = min(self.columns, first_column + width - 1)
+        row_numbers = np.arange(first_row, last_row + 1, dtype=np.int64)
+        column_numbers = np.arange(first_column, last_column + 1, dtype=np.int64)
+        return row_numbers, column_numbers, row_numbers[:, None] * column_numbers
@@ -0,0 +1,185 @@
+"""
+Call counts and latency histograms for the app's interactive handlers.
+
+`profiled("4_loops:Generate Table")` works both as a decorator and as a
+`with` block, since most handlers are just the body of an `if st.button(...)`:
+
+    if st.button("Generate Table"):
+        with profiled("4_loops:Generate Table"):
+            ...
+
+Each thread records into its own buffer, so recording takes no lock: two
+clock readings, a dict lookup and a bisect. A background thread merges
+the buffers every `interval` seconds and writes them to a text file in
+the Prometheus exposition format, which any Prometheus-compatible scraper
+(or the node exporter's textfile collector) can pick up.
+"""
+
+import atexit
+import bisect
+import functools
+import os
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "metrics.prom"
+
+# Upper bounds of the latency buckets, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Series:
+    __slots__ = ("count", "errors", "total", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # the last one is +Inf
+
+    def merge(self, other):
+        self.count += other.count
+        self.errors += other.errors
+        self.total += other.total
+        for index, value in enumerate(other.buckets):
+            self.buckets[index] += value
+
+
+class Profiler:
+    def __init__(self, path=DEFAULT_PATH, interval=15.0):
+        self.path = Path(path)
+        self.interval = interval
+        self._local = threading.local()
+        self._buffers = []  # (thread, {name: _Series}); only the owning thread writes to a buffer
+        self._retired = {}  # series of threads that have finished
+        self._lock = threading.Lock()  # for the list of buffers, not for recording
+        self._exporter = None
+
+    def record(self, name, seconds, failed=False):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = {}
+            with self._lock:
+                self._buffers.append((threading.current_thread(), buffer))
+                if self._exporter is None:
+                    self._start_exporter()
+        series = buffer.get(name)
+        if series is None:
+            series = buffer[name] = _Series()
+        series.count += 1
+        series.errors += failed
+        series.total += seconds
+        series.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+    def snapshot(self):
+        # All series merged. Buffers of finished threads are folded into
+        # `_retired` and dropped: Streamlit starts a new thread per rerun.
+        merged = {}
+        with self._lock:
+            alive = []
+            for thread, buffer in self._buffers:
+                if thread.is_alive():
+                    alive.append((thread, buffer))
+                else:
+                    for name, series in buffer.items():
+                        self._retired.setdefault(name, _Series()).merge(series)
+            self._buffers = alive
+            for name, series in self._retired.items():
+                merged.setdefault(name, _Series()).merge(series)
+            for _, buffer in alive:
+                # A live thread may add a series while we copy; take a list first
+                for name, series in list(buffer.items()):
+                    merged.setdefault(name, _Series()).merge(series)
+        return merged
+
+    def summary(self):
+        # Handlers by total time spent, for the server status panel
+        rows = [
+            {"handler": name, "calls": series.count, "errors": series.errors,
+             "total_s": round(series.total, 3), "mean_ms": round(series.total / series.count * 1000, 2)}
+            for name, series in self.snapshot().items() if series.count
+        ]
+        return sorted(rows, key=lambda row: row["total_s"], reverse=True)
+
+    def render(self):
+        lines = [
+            "# HELP handler_duration_seconds Time spent in interactive handlers.",
+            "# TYPE handler_duration_seconds histogram",
+        ]
+        errors = [
+            "# HELP handler_errors_total Interactive handler calls that raised an exception.",
+            "# TYPE handler_errors_total counter",
+        ]
+        for name, series in sorted(self.snapshot().items()):
+            label = _escape(name)
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ("+Inf",), series.buckets):
+                cumulative += count
+                lines.append(f'handler_duration_seconds_bucket{{handler="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'handler_duration_seconds_sum{{handler="{label}"}} {series.total:.6f}')
+            lines.append(f'handler_duration_seconds_count{{handler="{label}"}} {series.count}')
+            errors.append(f'handler_errors_total{{handler="{label}"}} {series.errors}')
+        return "\n".join(lines + errors) + "\n"
+
+    def export(self):
+        # Written to a temporary file and renamed, so a scraper never reads half a file
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_text(self.render())
+        os.replace(temporary, self.path)
+
+    def _start_exporter(self):
+        self._exporter = threading.Thread(target=self._export_forever, name="profiler-export", daemon=True)
+        self._exporter.start()
+        atexit.register(self._export_quietly)
+
+    def _export_forever(self):
+        while True:
+            time.sleep(self.interval)
+            self._export_quietly()
+
+    def _export_quietly(self):
+        try:
+            self.export()
+        except OSError:
+            # Metrics are best effort; the next interval tries again
+            pass
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# One profiler per server process, so `profiled` can be used anywhere
+profiler = Profiler()
+
+# Start times of the `profiled` blocks each thread is inside, innermost last
+_starts = threading.local()
+
+
+class profiled:
+    def __init__(self, name):
+        self.name = name
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
+
+    def __enter__(self):
+        # The stack is per thread, so one `profiled` can be entered by several
+        # threads at once (as a decorator) or recursively
+        stack = getattr(_starts, "stack", None)
+        if stack is None:
+            stack = _starts.stack = []
+        stack.append(time.perf_counter())
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        seconds = time.perf_counter() - _starts.stack.pop()
+        # st.rerun() and st.stop() work by raising BaseExceptions; they aren't errors
+        profiler.record(self.name, seconds, failed=exc_type is not None and issubclass(exc_type, Exception))
+        return False
@@ -0,0 +1,159 @@
+"""
+Learner progress that survives a page refresh, stored in SQLite.
+
+Writes never wait on disk: `record()` updates an in-memory cache and queues
+the value, and a background thread writes the queued values in batches, one
+transaction per batch. Several writes to the same item between two flushes
+are coalesced into one. Reads come from the cache and only touch the
+database the first time a learner is seen by this server process.
+
+The database runs in WAL mode, so reads are never blocked by the writer.
+"""
+
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "progress.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    learner TEXT NOT NULL,
+    item TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (learner, item)
+)
+"""
+
+_UPSERT = """
+INSERT INTO progress (learner, item, value, updated) VALUES (?, ?, ?, ?)
+ON CONFLICT (learner, item) DO UPDATE SET value = excluded.value, updated = excluded.updated
+"""
+
+
+def _connect(path):
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class ProgressStore:
+    def __init__(self, path=DEFAULT_PATH, flush_interval=0.5, batch_size=5000, cached_learners=10000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.cached_learners = cached_learners
+
+        self._reader = _connect(self.path)
+        self._reader.execute(_SCHEMA)
+        self._reader.commit()
+        self._read_lock = threading.Lock()
+
+        self._cache = OrderedDict()  # learner -> {item: value}, least recently used first
+        self._pending = {}  # (learner, item) -> (json value, timestamp)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flushed = threading.Condition()
+        self._flushes = 0
+        self._recorded = 0  # records accepted so far
+        self._durable = 0  # of those, how many are on disk
+        self._written = 0
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def get(self, learner, item, default=None):
+        return self.load(learner).get(item, default)
+
+    def load(self, learner):
+        # The learner's progress as a dict; treat it as read-only
+        with self._lock:
+            progress = self._cache.get(learner)
+            if progress is not None:
+                self._cache.move_to_end(learner)
+                return progress
+        with self._read_lock:
+            rows = self._reader.execute("SELECT item, value FROM progress WHERE learner = ?", (learner,)).fetchall()
+        loaded = {item: json.loads(value) for item, value in rows}
+        with self._lock:
+            # Anything recorded while we were reading wins over the stored value
+            for (pending_learner, item), (value, _) in self._pending.items():
+                if pending_learner == learner:
+                    loaded[item] = json.loads(value)
+            progress = self._cache.setdefault(learner, loaded)
+            self._trim_cache()
+        return progress
+
+    def record(self, learner, item, value):
+        encoded = json.dumps(value)
+        progress = self.load(learner)
+        with self._lock:
+            progress[item] = value
+            self._pending[learner, item] = (encoded, time.time())
+            self._recorded += 1
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def flush(self, timeout=10):
+        # Blocks until everything recorded so far is on disk
+        with self._lock:
+            target = self._recorded
+        with self._flushed:
+            self._wake.set()
+            self._flushed.wait_for(lambda: self._durable >= target, timeout)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        self._writer.join(timeout=5)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "cached_learners": len(self._cache),
+                "pending_writes": len(self._pending),
+                "rows_written": self._written,
+                "flushes": self._flushes,
+            }
+
+    def _trim_cache(self):
+        # Only learners without unflushed writes may leave the cache
+        while len(self._cache) > self.cached_learners:
+            learner = next(iter(self._cache))
+            if any(pending_learner == learner for pending_learner, _ in self._pending):
+                break
+            self._cache.popitem(last=False)
+
+    def _write_loop(self):
+        connection = _connect(self.path)
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                recorded = self._recorded
+            if batch:
+                with connection:
+                    connection.executemany(
+                        _UPSERT,
+                        ((learner, item, value, updated) for (learner, item), (value, updated) in batch.items()),
+                    )
+            with self._flushed:
+                self._flushes += bool(batch)
+                self._durable = recorded
+                self._written += len(batch)
+                self._flushed.notify_all()
+            if self._closed:
+                connection.close()
+                return
@@ -0,0 +1,123 @@
+"""
+The question bank behind every page's quiz.
+
+All questions live in `content/quizzes.json`. The bank is loaded once per
+server process and indexed by topic (the page's file name) and by
+difficulty, so drawing a question is a `random.choice` on a prebuilt tuple
+no matter how many questions there are.
+"""
+
+import json
+import random
+import threading
+from collections import Counter, defaultdict
+
+from utils.content import CONTENT_DIR
+
+QUIZ_FILE = CONTENT_DIR / "quizzes.json"
+
+
+class Question:
+    __slots__ = ("id", "topic", "difficulty", "question", "code", "options", "answer", "correct", "incorrect")
+
+    def __init__(self, id, topic, difficulty, question, options, answer, correct, code=None, incorrect=None):
+        if answer not in options:
+            raise ValueError(f"Question {id!r}: the answer {answer!r} is not one of its options")
+        self.id = id
+        self.topic = topic
+        self.difficulty = difficulty
+        self.question = question
+        self.code = code
+        self.options = tuple(options)
+        self.answer = answer
+        self.correct = correct
+        self.incorrect = incorrect or f"❌ Incorrect. The correct answer is: '{answer}'."
+
+
+class QuestionBank:
+    def __init__(self, questions):
+        self.questions = tuple(questions)
+        self._by_id = {}
+        by_topic = defaultdict(list)
+        for question in self.questions:
+            if question.id in self._by_id:
+                raise ValueError(f"Duplicate question id {question.id!r}")
+            self._by_id[question.id] = question
+            by_topic[question.topic, None].append(question)
+            by_topic[question.topic, question.difficulty].append(question)
+        self._by_topic = {key: tuple(questions) for key, questions in by_topic.items()}
+
+    def __contains__(self, question_id):
+        return question_id in self._by_id
+
+    def __getitem__(self, question_id):
+        return self._by_id[question_id]
+
+    def __len__(self):
+        return len(self.questions)
+
+    def for_topic(self, topic, difficulty=None):
+        return self._by_topic.get((topic, difficulty), ())
+
+    def draw(self, topic, difficulty=None, exclude=None):
+        candidates = self.for_topic(topic, difficulty)
+        if not candidates:
+            raise KeyError(f"No questions for topic {topic!r} (difficulty {difficulty!r})")
+        question = random.choice(candidates)
+        # One retry is enough to avoid repeats without scanning the topic
+        if question.id == exclude and len(candidates) > 1:
+            question = random.choice(candidates)
+        return question
+
+
+def load_question_bank(path=QUIZ_FILE):
+    with open(path, encoding="utf-8") as file:
+        return QuestionBank(Question(**question) for question in json.load(file))
+
+
+class AnswerLog:
+    # Answers are appended to a pending batch under a short lock and folded
+    # into the per-question counters once `batch_size` of them have piled up.
+    def __init__(self, batch_size=100):
+        self.batch_size = batch_size
+        self._pending = []
+        self._attempts = Counter()
+        self._correct = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, question_id, correct):
+        with self._lock:
+            self._pending.append((question_id, correct))
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+        self._apply(batch)
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, []
+        self._apply(batch)
+
+    def stats(self):
+        self.flush()
+        with self._lock:
+            attempts = sum(self._attempts.values())
+            correct = sum(self._correct.values())
+            return {
+                "answers": attempts,
+                "correct": correct,
+                "questions_answered": len(self._attempts),
+                "hardest": [
+                    question_id
+                    for question_id, _ in sorted(
+                        self._attempts.items(), key=lambda item: self._correct[item[0]] / item[1],
+                    )[:5]
+                ],
+            }
+
+    def _apply(self, batch):
+        attempts = Counter(question_id for question_id, _ in batch)
+        correct = Counter(question_id for question_id, is_correct in batch if is_correct)
+        with self._lock:
+            self._attempts.update(attempts)
+            self._correct.update(correct)
@@ -0,0 +1,109 @@
+"""
+Runs regular expressions from the regex page with a time budget.
+
+Matching happens in a `utils.workers` process, so a catastrophic-backtracking
+pattern such as `(a+)+$` is killed when its budget runs out instead of freezing
+the server. Compiled patterns are kept in a bounded LRU (in the server for
+validation, and in each worker for matching), and results are cached by their
+inputs so a rerun only does work for the section whose inputs changed.
+"""
+
+import functools
+import re
+import threading
+from collections import OrderedDict
+
+from utils.workers import PoolBusy
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern, flags=0):
+    return re.compile(pattern, flags)
+
+
+def run_regex(operation, pattern, flags, text, replacement):
+    # Executed in the worker process
+    compiled = compile_pattern(pattern, flags)
+    if operation == "findall":
+        return compiled.findall(text)
+    if operation == "sub":
+        return compiled.sub(replacement, text)
+    if operation == "search":
+        match = compiled.search(text)
+        return None if match is None else [match.group(0), *match.groups()]
+    raise ValueError(f"Unknown regex operation: {operation}")
+
+
+class RegexResult:
+    def __init__(self, value=None, error=None, elapsed_ms=None):
+        self.value = value
+        self.error = error
+        self.elapsed_ms = elapsed_ms
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class RegexService:
+    def __init__(self, pool, budget_ms=250, max_results=512):
+        self.pool = pool
+        self.budget_ms = budget_ms
+        self.max_results = max_results
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def findall(self, pattern, text, flags=0):
+        return self._run("findall", pattern, flags, text)
+
+    def sub(self, pattern, replacement, text, flags=0):
+        return self._run("sub", pattern, flags, text, replacement)
+
+    def search(self, pattern, text, flags=0):
+        # The value is `[group(0), group(1), ...]`, or None when nothing matched
+        return self._run("search", pattern, flags, text)
+
+    def _run(self, operation, pattern, flags, text, replacement=None):
+        key = (operation, pattern, flags, text, replacement)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        try:
+            # Compiling is cheap, so bad patterns are reported without a round
+            # trip to a worker. Besides re.error, a huge repeat count such as
+            # a{4294967296} overflows and deep nesting hits the recursion limit.
+            compile_pattern(pattern, flags)
+        except (re.error, OverflowError, RecursionError) as e:
+            result = RegexResult(error=f"Invalid pattern: {e}")
+        else:
+            try:
+                job = self.pool.submit(
+                    run_regex, operation, pattern, flags, text, replacement,
+                    cpu_seconds=1, timeout=self.budget_ms / 1000,
+                )
+            except PoolBusy as e:
+                return RegexResult(error=str(e))
+            # Waiting is bounded: the worker is killed once the budget is spent.
+            # The extra allowance only covers time spent queued behind others.
+            if not job.wait(self.budget_ms / 1000 + 5):
+                # Nobody will read the result, so don't let it take a worker later
+                job.cancel()
+                return RegexResult(error="The regex service is busy; try again in a moment.")
+            if job.status == "timeout":
+                result = RegexResult(error=f"Timed out after {self.budget_ms} ms")
+            elif job.ok:
+                result = RegexResult(job.result, elapsed_ms=(job.finished_at - job.started_at) * 1000)
+            elif job.status == "error":
+                # An exception raised by the matching itself, the same every time
+                result = RegexResult(error=job.error)
+            else:
+                # A killed or cancelled worker may do better next time; not cached
+                return RegexResult(error=job.error)
+
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+        return result
@@ -0,0 +1,18 @@
+"""
+Runs learner-written code inside a worker from `utils.workers.WorkerPool`.
+
+These functions are executed in the worker process, never in the Streamlit
+server, so a `while True` or a giant list only costs that one worker.
+"""
+
+
+def call_function(source, name, args):
+    # Define whatever `source` defines in a fresh namespace, then call `name`
+    namespace = {}
+    exec(source, namespace)
+    return namespace[name](*args)
+
+
+def call_expression(expression, args):
+    # Evaluate an expression that produces a callable (e.g. a lambda) and call it
+    return eval(expression, {})(*args)
@@ -0,0 +1,195 @@
+"""
+Full-text search over every lesson, section by section.
+
+The index maps each term to the sections that contain it, with a
+precomputed TF-IDF weight, so a query only sums a few short posting lists.
+Terms are identifiers and dotted names as they appear in text and code
+(`re.sub` is one term, and `re` and `sub` are terms too).
+
+The index is saved to `data/search_index.json`. On start-up, and at most
+once a second after that, the lesson and page files are checked: only those
+whose modification time changed are parsed again.
+"""
+
+import json
+import math
+import re
+import threading
+import time
+from pathlib import Path
+
+from utils.content import CONTENT_DIR, parse_lesson
+
+ROOT = CONTENT_DIR.parent
+DEFAULT_INDEX_PATH = ROOT / "data" / "search_index.json"
+
+_VERSION = 1
+_TOKEN = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*")
+_HEADING = re.compile(r"^#+\s*(.+)$", re.MULTILINE)
+_TITLE = re.compile(r"""st\.title\((["'])(.+?)\1\)""")
+_MARKUP = re.compile(r"[#*`>|]+")
+
+
+def tokenize(text):
+    terms = []
+    for match in _TOKEN.finditer(text.lower()):
+        token = match.group()
+        terms.append(token)
+        if "." in token:
+            terms.extend(token.split("."))
+    return terms
+
+
+def page_file(page):
+    return ROOT / "home.py" if page == "home" else ROOT / "pages" / f"{page}.py"
+
+
+def _page_title(page):
+    match = _TITLE.search(page_file(page).read_text(encoding="utf-8"))
+    return match.group(2) if match else page
+
+
+def _section_title(section_id, blocks):
+    for block in blocks:
+        if block.kind == "markdown":
+            heading = _HEADING.search(block.text)
+            if heading:
+                return _MARKUP.sub("", heading.group(1)).strip()
+    return section_id.replace("-", " ").capitalize()
+
+
+def _snippet(blocks):
+    for block in blocks:
+        for line in block.text.splitlines():
+            line = _MARKUP.sub("", line).strip().lstrip("- ")
+            if line and not _HEADING.match(line) and not line.startswith(("🧪", "🔹")):
+                return line[:160]
+    return ""
+
+
+def index_page(page):
+    # The searchable documents of one page: one per section of its lesson
+    lesson_path = CONTENT_DIR / f"{page}.md"
+    lesson = parse_lesson(page, lesson_path.read_text(encoding="utf-8"))
+    title = _page_title(page)
+    documents = []
+    for section_id, blocks in lesson.sections.items():
+        terms = {}
+        for term in tokenize(" ".join(block.text for block in blocks)):
+            terms[term] = terms.get(term, 0) + 1
+        if terms:
+            documents.append({
+                "section": section_id,
+                "title": _section_title(section_id, blocks),
+                "snippet": _snippet(blocks),
+                "terms": terms,
+            })
+    return {"title": title, "documents": documents}
+
+
+class Hit:
+    __slots__ = ("page", "page_title", "section", "title", "snippet", "score")
+
+    def __init__(self, page, page_title, section, title, snippet, score):
+        self.page = page
+        self.page_title = page_title
+        self.section = section
+        self.title = title
+        self.snippet = snippet
+        self.score = score
+
+    @property
+    def path(self):
+        return str(page_file(self.page).relative_to(ROOT))
+
+
+class SearchIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH, content_dir=CONTENT_DIR, check_interval=1.0):
+        self.path = Path(path)
+        self.content_dir = Path(content_dir)
+        self.check_interval = check_interval
+        self._pages = {}  # page -> {"mtime": ..., "title": ..., "documents": [...]}
+        # ([(page, document), ...], {term: ((document number, weight), ...)}),
+        # replaced as a whole so a search never sees half of a rebuild
+        self._index = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._load()
+        self.refresh(force=True)
+
+    def __len__(self):
+        return len(self._index[0])
+
+    def search(self, query, limit=10):
+        self.refresh()
+        documents, postings = self._index
+        terms = set(tokenize(query))
+        scores = {}
+        matched = {}
+        for term in terms:
+            for number, weight in postings.get(term, ()):
+                scores[number] = scores.get(number, 0.0) + weight
+                matched[number] = matched.get(number, 0) + 1
+        # Sections matching more of the query come first, then by weight
+        ranked = sorted(scores, key=lambda number: (matched[number], scores[number]), reverse=True)[:limit]
+        hits = []
+        for number in ranked:
+            page, document = documents[number]
+            hits.append(Hit(
+                page, self._pages[page]["title"], document["section"], document["title"],
+                document["snippet"], scores[number],
+            ))
+        return hits
+
+    def refresh(self, force=False):
+        # Re-indexes the pages whose lesson or page file changed on disk
+        now = time.monotonic()
+        if not force and now - self._checked < self.check_interval:
+            return False
+        with self._lock:
+            self._checked = now
+            mtimes = {}
+            for lesson_path in self.content_dir.glob("*.md"):
+                page = lesson_path.stem
+                if page_file(page).exists():
+                    mtimes[page] = max(lesson_path.stat().st_mtime, page_file(page).stat().st_mtime)
+            changed = [page for page, mtime in mtimes.items() if self._pages.get(page, {}).get("mtime") != mtime]
+            removed = [page for page in self._pages if page not in mtimes]
+            if not changed and not removed and self._index:
+                return False
+            for page in removed:
+                del self._pages[page]
+            for page in changed:
+                self._pages[page] = {"mtime": mtimes[page], **index_page(page)}
+            self._build_postings()
+            if changed or removed:
+                self._save()
+            return True
+
+    def _build_postings(self):
+        documents = [(page, document) for page, entry in sorted(self._pages.items()) for document in entry["documents"]]
+        frequency = {}
+        for _, document in documents:
+            for term in document["terms"]:
+                frequency[term] = frequency.get(term, 0) + 1
+        postings = {}
+        for number, (_, document) in enumerate(documents):
+            length = sum(document["terms"].values())
+            for term, count in document["terms"].items():
+                weight = (count / length) ** 0.5 * math.log(1 + len(documents) / frequency[term])
+                postings.setdefault(term, []).append((number, weight))
+        self._index = (documents, {term: tuple(entries) for term, entries in postings.items()})
+
+    def _load(self):
+        try:
+            saved = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if saved.get("version") == _VERSION:
+            self._pages = saved["pages"]
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_text(json.dumps({"version": _VERSION, "pages": self._pages}), encoding="utf-8")
+        temporary.replace(self.path)
@@ -0,0 +1,134 @@
+"""
+Process-wide services shared by every page and every session.
+
+`st.cache_resource` makes sure each one is created once per server process.
+"""
+
+import streamlit as st
+
+from utils.big_numbers import FactorialService, FibonacciService
+from utils.comprehension_bench import BenchmarkService
+from utils.concurrency_lab import ConcurrencyLabService
+from utils.content import load_lessons
+from utils.directory import DirectoryCache
+from utils.event_loop import EventLoopService
+from utils.generators import GeneratorSessions
+from utils.progress import ProgressStore
+from utils.quiz import AnswerLog, load_question_bank
+from utils.regex_engine import RegexService
+from utils.search import SearchIndex
+from utils.session_store import SessionStore
+from utils.vfs import VirtualFSRegistry
+from utils.workers import WorkerPool
+
+
+@st.cache_resource
+def get_worker_pool():
+    return WorkerPool()
+
+
+@st.cache_resource
+def get_lab_worker_pool():
+    # A separate pool for long measurements, so they never hold up learners'
+    # code in the shared pool. Tracing 10^8 values takes minutes.
+    return WorkerPool(workers=2, max_queue=100, cpu_seconds=300, memory_mb=2048, timeout=600)
+
+
+@st.cache_resource
+def get_concurrency_lab_pool():
+    # The concurrency lab times its runs, so they get a single worker of their
+    # own: two runs at once, or a memory measurement alongside, would share
+    # the CPUs and skew every speedup
+    return WorkerPool(workers=1, max_queue=100, cpu_seconds=60, memory_mb=2048, timeout=120)
+
+
+@st.cache_resource
+def get_benchmark_service():
+    return BenchmarkService(get_lab_worker_pool())
+
+
+@st.cache_resource
+def get_concurrency_lab_service():
+    return ConcurrencyLabService(get_concurrency_lab_pool())
+
+
+@st.cache_resource
+def get_factorial_service():
+    # Factorials are capped to take seconds, like learners' code, so they
+    # share its pool instead of queueing behind minutes-long measurements
+    return FactorialService(get_worker_pool())
+
+
+@st.cache_resource
+def get_regex_service():
+    return RegexService(get_worker_pool())
+
+
+@st.cache_resource(show_spinner=False)
+def get_lessons():
+    return load_lessons()
+
+
+def get_lesson(page):
+    return get_lessons()[page]
+
+
+@st.cache_resource
+def get_session_store():
+    return SessionStore()
+
+
+def get_session_state():
+    # This session's view of the shared, size-limited session store
+    return get_session_store().session()
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_bank():
+    return load_question_bank()
+
+
+@st.cache_resource
+def get_answer_log():
+    return AnswerLog()
+
+
+@st.cache_resource
+def get_progress_store():
+    return ProgressStore()
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_index():
+    return SearchIndex()
+
+
+@st.cache_resource
+def get_directory_cache():
+    return DirectoryCache()
+
+
+@st.cache_resource
+def get_virtual_fs_registry():
+    return VirtualFSRegistry()
+
+
+def get_virtual_fs():
+    # This session's own in-memory files, for the file-writing examples
+    return get_virtual_fs_registry().for_session()
+
+
+@st.cache_resource
+def get_generator_sessions():
+    return GeneratorSessions()
+
+
+@st.cache_resource
+def get_fibonacci_service():
+    return FibonacciService()
+
+
+@st.cache_resource
+def get_event_loop_service():
+    # Coroutines from every session share one loop, in its own thread
+    return EventLoopService()
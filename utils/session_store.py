@@ -0,0 +1,202 @@
+"""
+Per-session state with a memory budget.
+
+Works like `st.session_state`, but every value's size is measured when it is
+stored, so the server knows how much memory each learner's session holds.
+A session that grows past its budget drops its least recently used keys,
+and when the whole server goes over budget the sessions idle the longest
+are evicted first. Sessions idle for longer than `idle_seconds` are dropped
+on the next sweep.
+
+Sizes are measured when a value is stored: after mutating a stored list or
+dict in place, assign it again so the new size is counted.
+"""
+
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+class SessionBudgetExceeded(ValueError):
+    pass
+
+
+def measure(value):
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        # Unpicklable objects (locks, open files, ...) are counted shallowly
+        return sys.getsizeof(value)
+
+
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "local"
+
+
+class _Session:
+    __slots__ = ("values", "size", "last_seen")
+
+    def __init__(self):
+        self.values = OrderedDict()  # key -> (value, size), least recently used first
+        self.size = 0
+        self.last_seen = time.monotonic()
+
+
+class SessionState:
+    # The view of one session's values that pages work with
+    def __init__(self, store, session_id):
+        self._store = store
+        self.session_id = session_id
+
+    def __contains__(self, key):
+        return self._store._get(self.session_id, key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key):
+        value = self._store._get(self.session_id, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._store._set(self.session_id, key, value)
+
+    def __delitem__(self, key):
+        self._store._delete(self.session_id, key)
+
+    def get(self, key, default=None):
+        return self._store._get(self.session_id, key, default)
+
+    def setdefault(self, key, default):
+        value = self._store._get(self.session_id, key, _MISSING)
+        if value is _MISSING:
+            self._store._set(self.session_id, key, default)
+            return default
+        return value
+
+    def size_of(self, key):
+        return self._store._size_of(self.session_id, key)
+
+    @property
+    def size(self):
+        return self._store._session_size(self.session_id)
+
+
+_MISSING = object()
+
+
+class SessionStore:
+    def __init__(self, session_budget=256 * 1024, server_budget=256 * 1024 * 1024, idle_seconds=30 * 60):
+        self.session_budget = session_budget
+        self.server_budget = server_budget
+        self.idle_seconds = idle_seconds
+        self._sessions = OrderedDict()  # session id -> _Session, least recently used first
+        self._total = 0
+        self._evicted_sessions = 0
+        self._evicted_keys = 0
+        self._lock = threading.Lock()
+
+    def session(self, session_id=None):
+        session_id = session_id or current_session_id()
+        with self._lock:
+            self._touch(session_id)
+            self._sweep_idle()
+        return SessionState(self, session_id)
+
+    def stats(self):
+        with self._lock:
+            sizes = [session.size for session in self._sessions.values()]
+            keys = sum(len(session.values) for session in self._sessions.values())
+            return {
+                "sessions": len(sizes),
+                "keys": keys,
+                "total_bytes": self._total,
+                "server_budget_bytes": self.server_budget,
+                "session_budget_bytes": self.session_budget,
+                "mean_session_bytes": round(self._total / len(sizes)) if sizes else 0,
+                "max_session_bytes": max(sizes, default=0),
+                "evicted_sessions": self._evicted_sessions,
+                "evicted_keys": self._evicted_keys,
+            }
+
+    def _touch(self, session_id):
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = _Session()
+        session.last_seen = time.monotonic()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def _get(self, session_id, key, default):
+        with self._lock:
+            session = self._touch(session_id)
+            if key not in session.values:
+                return default
+            session.values.move_to_end(key)
+            return session.values[key][0]
+
+    def _set(self, session_id, key, value):
+        size = measure(value)
+        if size > self.session_budget:
+            raise SessionBudgetExceeded(
+                f"{key!r} needs {size:,} bytes, more than the {self.session_budget:,} bytes a session may hold"
+            )
+        with self._lock:
+            session = self._touch(session_id)
+            self._remove(session, key)
+            session.values[key] = (value, size)
+            session.size += size
+            self._total += size
+            # Over the session budget: drop this session's least recently used keys
+            while session.size > self.session_budget:
+                oldest = next(iter(session.values))
+                self._remove(session, oldest)
+                self._evicted_keys += 1
+            # Over the server budget: drop whole sessions, idle the longest first
+            while self._total > self.server_budget and len(self._sessions) > 1:
+                oldest_id = next(iter(self._sessions))
+                if oldest_id == session_id:
+                    break
+                self._drop_session(oldest_id)
+
+    def _delete(self, session_id, key):
+        with self._lock:
+            session = self._touch(session_id)
+            if key not in session.values:
+                raise KeyError(key)
+            self._remove(session, key)
+
+    def _size_of(self, session_id, key):
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or key not in session.values:
+                return 0
+            return session.values[key][1]
+
+    def _session_size(self, session_id):
+        with self._lock:
+            session = self._sessions.get(session_id)
+            return session.size if session else 0
+
+    def _remove(self, session, key):
+        if key in session.values:
+            _, size = session.values.pop(key)
+            session.size -= size
+            self._total -= size
+
+    def _drop_session(self, session_id):
+        session = self._sessions.pop(session_id)
+        self._total -= session.size
+        self._evicted_sessions += 1
+
+    def _sweep_idle(self):
+        cutoff = time.monotonic() - self.idle_seconds
+        while self._sessions:
+            oldest_id, oldest = next(iter(self._sessions.items()))
+            if oldest.last_seen >= cutoff:
+                break
+            self._drop_session(oldest_id)
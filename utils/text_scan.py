@@ -0,0 +1,107 @@
+"""
+Summarizes a text file in one pass over its bytes, in constant memory.
+
+The file is read in chunks and decoded incrementally. Its size, line count,
+first and last lines and a bounded preview are collected on the way, so a
+200 MB upload is never held as one decoded string and never sent whole to
+the browser.
+"""
+
+import codecs
+from collections import deque
+
+CHUNK_SIZE = 1 << 20
+MAX_LINE_CHARS = 500
+
+
+class TextSummary:
+    __slots__ = ("size", "lines", "head", "tail", "preview", "truncated")
+
+    def __init__(self, size, lines, head, tail, preview, truncated):
+        self.size = size  # in bytes
+        self.lines = lines
+        self.head = head  # the first lines, each cut to MAX_LINE_CHARS
+        self.tail = tail  # the last lines, likewise
+        self.preview = preview  # the start of the text, at most preview_chars long
+        self.truncated = truncated  # whether the preview is only part of the text
+
+
+def scan_text(stream, head_lines=5, tail_lines=5, preview_chars=20_000, encoding="utf-8", chunk_size=CHUNK_SIZE):
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    size = 0
+    newlines = 0
+    head = []
+    tail = deque(maxlen=tail_lines)
+    preview = []
+    preview_left = preview_chars
+    chars = 0
+    # The line being read, cut to MAX_LINE_CHARS, and whether any text follows the last newline
+    partial = ""
+    pending = False
+
+    def finish(line):
+        line = line.removesuffix("\r")
+        if len(head) < head_lines:
+            head.append(line)
+        tail.append(line)
+
+    while True:
+        chunk = stream.read(chunk_size)
+        final = not chunk
+        size += len(chunk)
+        text = decoder.decode(chunk, final=final)
+
+        chars += len(text)
+        if preview_left > 0:
+            preview.append(text[:preview_left])
+            preview_left -= len(preview[-1])
+
+        if text:
+            count = text.count("\n")
+            newlines += count
+            if count:
+                wanted = head_lines - len(head) + tail_lines
+                if count <= wanted:
+                    ended = text.split("\n")[:-1]
+                    ended[0] = partial + ended[0]
+                else:
+                    # Only the first lines can reach the head and only the last ones the tail
+                    ended = _first_lines(text, head_lines - len(head))
+                    if ended:
+                        ended[0] = partial + ended[0]
+                    ended += _last_lines(text, tail_lines)
+                for line in ended:
+                    finish(line[:MAX_LINE_CHARS])
+                partial = ""
+            last = text[text.rfind("\n") + 1:]
+            if len(partial) < MAX_LINE_CHARS:
+                partial = (partial + last[:MAX_LINE_CHARS])[:MAX_LINE_CHARS]
+            pending = bool(last)
+        if final:
+            break
+
+    lines = newlines
+    if pending:
+        lines += 1
+        finish(partial)
+    return TextSummary(size, lines, head, list(tail), "".join(preview), chars > preview_chars)
+
+
+def _first_lines(text, count):
+    lines = []
+    start = 0
+    for _ in range(count):
+        end = text.find("\n", start)
+        lines.append(text[start:end])
+        start = end + 1
+    return lines
+
+
+def _last_lines(text, count):
+    lines = []
+    end = text.rfind("\n")
+    for _ in range(count):
+        start = text.rfind("\n", 0, end) + 1
+        lines.append(text[start:end])
+        end = start - 1
+    return lines[::-1]
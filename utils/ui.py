@@ -0,0 +1,239 @@
+"""
+Streamlit widgets shared by several pages.
+"""
+
+import functools
+import uuid
+
+import streamlit as st
+
+from utils.lazy import lazy_import
+from utils.profiling import profiled
+from utils.services import (
+    get_answer_log, get_generator_sessions, get_progress_store, get_question_bank, get_session_state,
+)
+
+pd = lazy_import("pandas")
+
+# "Stream next N" shows at most this many values, and "Advance by N" (like
+# the other buttons that skip or list values) stops after this many
+# seconds, so none of them can hold up the page for long
+STREAM_LIMIT = 5000
+ADVANCE_SECONDS = 1.0
+
+
+def poll_jobs(*jobs):
+    # Decorates a fragment that shows the results of `jobs` (anything with a
+    # done() method; None is skipped) and reruns it every 0.5 s while any is
+    # still running. run_every is fixed when the page runs, so once they are
+    # all done the whole page reruns once, which stops the polling.
+    pending = any(job is not None and not job.done() for job in jobs)
+
+    def decorator(show):
+        @st.fragment(run_every=0.5 if pending else None)
+        @functools.wraps(show)
+        def fragment():
+            show()
+            if pending and all(job is None or job.done() for job in jobs):
+                st.rerun()
+        return fragment
+    return decorator
+
+
+def current_learner():
+    # A learner is identified by a random id kept in the URL, so progress
+    # survives a refresh and a bookmarked link brings it back
+    learner = st.session_state.get("learner") or st.query_params.get("learner") or uuid.uuid4().hex
+    st.session_state["learner"] = learner
+    if st.query_params.get("learner") != learner:
+        st.query_params["learner"] = learner
+    return learner
+
+
+def show_try_it(lesson, section):
+    # Shows a "Try It" section with a checkbox the learner ticks once done
+    lesson.show(section)
+    progress = get_progress_store()
+    learner = current_learner()
+    item = f"try:{lesson.page}:{section}"
+    done = progress.get(learner, item, False)
+    if st.checkbox("Done ✅", value=done, key=item) != done:
+        with profiled(f"{lesson.page}:Done"):
+            progress.record(learner, item, not done)
+
+
+def show_quiz(topic, difficulty=None, selectbox=False):
+    # Shows one question from the topic's bank. The question drawn for this
+    # session is remembered until it is answered; then the next one is drawn.
+    bank = get_question_bank()
+    state = get_session_state()
+    question_key = f"quiz:{topic}"
+    feedback_key = f"quiz:{topic}:feedback"
+
+    question_id = state.get(question_key)
+    if question_id not in bank:
+        question_id = bank.draw(topic, difficulty).id
+        state[question_key] = question_id
+    question = bank[question_id]
+
+    if question.code:
+        st.code(question.code)
+    choose = st.selectbox if selectbox else st.radio
+    choice = choose(question.question, question.options, key=f"{question_key}:{question.id}")
+
+    if st.button("Submit Answer", key=f"{question_key}:submit"):
+        # Topics are named after their pages, like the other handlers
+        with profiled(f"{topic}:Submit Answer"):
+            correct = choice == question.answer
+            get_answer_log().record(question.id, correct)
+            get_progress_store().record(current_learner(), f"quiz:{question.id}", correct)
+            state[feedback_key] = (correct, question.correct if correct else question.incorrect)
+            next_question = bank.draw(topic, difficulty, exclude=question.id)
+            state[question_key] = next_question.id
+            if next_question.id != question.id:
+                st.rerun()
+
+    feedback = state.get(feedback_key)
+    if feedback:
+        correct, message = feedback
+        (st.success if correct else st.error)(message)
+
+
+def show_live_iterator(
+    name, factory, *inputs, next_label, value_label, exhausted_message, format_value=str, max_count=1_000_000,
+):
+    # Buttons that step through factory(*inputs). The live iterator is kept
+    # for the session between reruns, so each click continues where the last
+    # one stopped; changing the inputs starts a fresh one. `format_value`
+    # turns a value into text, e.g. big_numbers.preview for huge integers.
+    sessions = get_generator_sessions()
+    live = sessions.get(name, factory, *inputs)
+
+    # Handlers are profiled under the iterator's name, which is unique across pages
+    if st.button(next_label, key=f"{name}:next"):
+        with profiled(f"{name}:{next_label}"):
+            values = live.take(1)
+            if values:
+                st.write(f"{value_label}: `{format_value(values[0])}`")
+            else:
+                st.error(exhausted_message)
+
+    count_col, advance_col, stream_col, restart_col = st.columns([2, 1, 1, 1], vertical_alignment="bottom")
+    count = count_col.number_input("N:", min_value=1, max_value=max_count, value=10, key=f"{name}:count")
+    if advance_col.button("Advance by N", key=f"{name}:advance"):
+        with profiled(f"{name}:Advance by N"):
+            skipped, last = live.advance(count, seconds=ADVANCE_SECONDS)
+            if skipped == 0:
+                st.error(exhausted_message)
+            else:
+                st.write(f"Skipped {skipped:,} values; the last one was `{format_value(last)}`")
+                if skipped < count and not live.exhausted:
+                    st.caption(f"Stopped after {ADVANCE_SECONDS:g} s; click again to keep going.")
+    if stream_col.button("Stream next N", key=f"{name}:stream"):
+        with profiled(f"{name}:Stream next N"):
+            chunks = live.stream(min(count, STREAM_LIMIT))
+            st.write_stream(", ".join(map(format_value, chunk)) + ", " for chunk in chunks)
+            if live.exhausted:
+                st.error(exhausted_message)
+    if restart_col.button("Restart", key=f"{name}:restart"):
+        with profiled(f"{name}:Restart"):
+            sessions.reset(name)
+            live = sessions.get(name, factory, *inputs)
+    st.caption(f"Values taken so far: {live.position}" + (" (finished)" if live.exhausted else ""))
+
+
+def show_sequence_window(name, factory, *inputs, length=None, page_size=50):
+    # Shows one page of the values of factory(*inputs) at a time, taken from
+    # a live generator, so memory and the data sent stay the same for any n.
+    # Paging forward continues the generator; paging back starts it again
+    # and skips ahead without keeping the skipped values. A jump skips for
+    # at most ADVANCE_SECONDS and shows the page it got to.
+    sessions = get_generator_sessions()
+    state = get_session_state()
+    page_key = f"window:{name}:page"
+    page_count = None if length is None else max(1, -(-length // page_size))
+
+    page = state.get(page_key, 0)
+    if state.get(f"window:{name}:inputs") != inputs:
+        page = 0
+    previous_col, next_col, jump_col = st.columns([1, 1, 2], vertical_alignment="bottom")
+    if previous_col.button("◀ Previous", key=f"{name}:previous", disabled=page == 0):
+        page -= 1
+    if next_col.button("Next ▶", key=f"{name}:next-page", disabled=page_count is not None and page + 1 >= page_count):
+        page += 1
+    jump = jump_col.number_input(
+        "Jump to page:", min_value=1, max_value=page_count, value=page + 1, key=f"{name}:jump:{page}",
+    )
+    page = jump - 1
+
+    cached = state.get(f"window:{name}:values")
+    if cached and cached[0] == (inputs, page):
+        values = cached[1]
+    else:
+        # Runs when the page or the inputs change, which is what the buttons do
+        with profiled(f"{name}:Load page"):
+            live = sessions.get(name, factory, *inputs)
+            offset = page * page_size
+            if live.position > offset:
+                sessions.reset(name)
+                live = sessions.get(name, factory, *inputs)
+            if live.position < offset:
+                # Skipping a page at a time keeps the position on a page boundary
+                live.advance(offset - live.position, seconds=ADVANCE_SECONDS, chunk_size=page_size)
+                if live.position < offset and not live.exhausted:
+                    st.warning(
+                        f"Stopped at page {live.position // page_size + 1:,} after {ADVANCE_SECONDS:g} s;"
+                        " jump again to keep going."
+                    )
+                    page = live.position // page_size
+            values = live.take(page_size)
+            state[f"window:{name}:values"] = ((inputs, page), values)
+            state[f"window:{name}:inputs"] = inputs
+    state[page_key] = page
+
+    if values:
+        start = page * page_size
+        st.code("\n".join(f"[{start + number}] {value}" for number, value in enumerate(values)), language=None)
+        total = f" of {length:,}" if length is not None else ""
+        st.caption(f"Values {start + 1:,}-{start + len(values):,}{total}")
+    else:
+        st.info("No more values.")
+
+
+def show_line_chart(points, x, y, color, title, x_scale=None, y_scale=None):
+    # One line per `color` through `points`, a list of dicts, the way the labs
+    # chart their measurements. A scale is a Vega-Lite scale, e.g. {"type": "log"}.
+    encoding = {
+        "x": {"field": x, "type": "quantitative"},
+        "y": {"field": y, "type": "quantitative"},
+        "color": {"field": color, "type": "nominal"},
+    }
+    if x_scale:
+        encoding["x"]["scale"] = x_scale
+    if y_scale:
+        encoding["y"]["scale"] = y_scale
+    st.vega_lite_chart({
+        "title": title,
+        "data": {"values": points},
+        "mark": {"type": "line", "point": True},
+        "encoding": encoding,
+    }, width="stretch")
+
+
+def show_grid_window(name, table, height=50, width=20):
+    # Shows a height x width block of a MultiplicationTable, starting at the
+    # row and column picked, so only the cells on screen are ever computed.
+    rows, columns = table.shape
+    first_row_col, first_column_col = st.columns(2)
+    first_row = first_row_col.number_input(
+        "First row:", min_value=1, max_value=rows, value=1, step=height, key=f"{name}:first-row",
+    )
+    first_column = first_column_col.number_input(
+        "First column:", min_value=1, max_value=columns, value=1, step=width, key=f"{name}:first-column",
+    )
+    row_numbers, column_numbers, products = table.window(first_row, first_column, height, width)
+    st.dataframe(pd.DataFrame(products, index=row_numbers, columns=column_numbers), width="stretch")
+    st.caption(
+        f"Rows {row_numbers[0]:,}-{row_numbers[-1]:,} and columns {column_numbers[0]:,}-{column_numbers[-1]:,}"
+        f" of a {rows:,} x {columns:,} table"
+    )
@@ -0,0 +1,324 @@
+"""
+A small in-memory filesystem per session, for the file-writing examples.
+
+Learners' files never touch the server's working directory: each session
+gets its own flat set of files, kept in memory, with a quota on the total
+size and the number of files. `open()` behaves like the built-in for the
+modes the lessons teach ("r", "w", "a", "r+", and their binary forms), so
+the examples still read like ordinary file handling.
+
+Optionally, files larger than `spill_threshold` are copied to a tmpfs
+directory by a background thread and dropped from memory once written.
+Reads and writes of everything else make no system calls at all.
+"""
+
+import atexit
+import errno
+import io
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+
+from utils.session_store import current_session_id
+
+DEFAULT_SPILL_DIR = Path("/dev/shm") / "interactive-python-learning" if Path("/dev/shm").is_dir() else None
+
+VirtualStat = namedtuple("VirtualStat", ["st_size", "st_mtime"])
+
+
+class QuotaExceeded(OSError):
+    def __init__(self, message):
+        super().__init__(errno.EDQUOT, message)
+
+
+class _Node:
+    __slots__ = ("data", "size", "mtime", "spilled")
+
+    def __init__(self, data):
+        self.data = data  # None once the file lives only in the spill directory
+        self.size = len(data)
+        self.mtime = time.time()
+        self.spilled = None  # path of the copy in the spill directory
+
+
+class _Buffer:
+    # Mixed into io.StringIO / io.BytesIO: writes back to the filesystem on
+    # flush and close, and stops a single write from blowing the quota
+    def _setup(self, fs, name, writable):
+        self._fs = fs
+        self._name = name
+        self._writable = writable
+        self._known = (0, 0)  # (position, size in bytes of everything before it)
+
+    def write(self, data):
+        if not self._writable:
+            raise io.UnsupportedOperation("not writable")
+        # The quota is in bytes, and a character can take up to four of them
+        end = self._bytes_before(self.tell()) + self._size(data)
+        if end > self._fs.quota_bytes:
+            raise QuotaExceeded(f"{self._name}: file would exceed the {self._fs.quota_bytes:,} byte quota")
+        written = super().write(data)
+        self._known = (self.tell(), end)
+        return written
+
+    def _bytes_before(self, position):
+        # Only recounted after a seek; consecutive writes just add up
+        known_position, known_bytes = self._known
+        if position != known_position:
+            known_bytes = self._size(self.getvalue()[:position])
+            self._known = (position, known_bytes)
+        return known_bytes
+
+    def flush(self):
+        if self._writable and not self.closed:
+            self._fs._commit(self._name, self._contents())
+        super().flush()
+
+    def close(self):
+        if not self.closed:
+            self.flush()
+        super().close()
+
+
+class _TextFile(_Buffer, io.StringIO):
+    def _contents(self):
+        return self.getvalue().encode("utf-8")
+
+    @staticmethod
+    def _size(text):
+        return len(text.encode("utf-8"))
+
+
+class _BinaryFile(_Buffer, io.BytesIO):
+    def _contents(self):
+        return self.getvalue()
+
+    @staticmethod
+    def _size(data):
+        return len(data)
+
+
+class VirtualFS:
+    def __init__(self, quota_bytes=1024 * 1024, max_files=64, spill_dir=None, spill_threshold=64 * 1024, spiller=None):
+        self.quota_bytes = quota_bytes
+        self.max_files = max_files
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.spill_threshold = spill_threshold
+        self._spiller = spiller
+        self._files = {}  # name -> _Node
+        self._usage = 0
+        self._lock = threading.Lock()
+        self.last_used = time.monotonic()
+
+    def open(self, name, mode="r", encoding="utf-8"):
+        name = self._check_name(name)
+        binary = "b" in mode
+        kind = mode.replace("b", "").replace("t", "")
+        if kind not in ("r", "w", "a", "r+"):
+            raise ValueError(f"invalid mode: {mode!r}")
+        if kind in ("r", "r+") and name not in self._files:
+            raise FileNotFoundError(errno.ENOENT, "No such file", name)
+        if encoding != "utf-8" and not binary:
+            raise ValueError("only utf-8 text is supported")
+
+        data = b"" if kind == "w" else self._read(name) if name in self._files else b""
+        if binary:
+            handle = _BinaryFile(data)
+        else:
+            handle = _TextFile(data.decode("utf-8"))
+        handle._setup(self, name, writable=kind != "r")
+        if kind == "a":
+            handle.seek(0, io.SEEK_END)
+        if kind == "w":
+            # Like the built-in, "w" creates or truncates the file right away
+            self._commit(name, b"")
+        return handle
+
+    def read_text(self, name):
+        with self.open(name) as handle:
+            return handle.read()
+
+    def exists(self, name):
+        return self._check_name(name) in self._files
+
+    def stat(self, name):
+        node = self._files.get(self._check_name(name))
+        if node is None:
+            raise FileNotFoundError(errno.ENOENT, "No such file", name)
+        return VirtualStat(node.size, node.mtime)
+
+    def remove(self, name):
+        name = self._check_name(name)
+        with self._lock:
+            node = self._files.pop(name, None)
+            if node is None:
+                raise FileNotFoundError(errno.ENOENT, "No such file", name)
+            self._usage -= node.size
+        if node.spilled:
+            self._spiller.discard(node.spilled)
+
+    def listdir(self):
+        return sorted(self._files)
+
+    @property
+    def usage(self):
+        return self._usage
+
+    def _check_name(self, name):
+        name = os.path.normpath(str(name))
+        if os.path.isabs(name) or name.startswith("..") or name in ("", "."):
+            raise ValueError(f"{name!r}: only paths inside your own folder can be used")
+        return name
+
+    def _read(self, name):
+        node = self._files[name]
+        data = node.data
+        if data is None:
+            data = Path(node.spilled).read_bytes()
+        return data
+
+    def _commit(self, name, data):
+        self.last_used = time.monotonic()
+        with self._lock:
+            old = self._files.get(name)
+            if old is None and len(self._files) >= self.max_files:
+                raise QuotaExceeded(f"{name}: no more than {self.max_files} files per session")
+            usage = self._usage - (old.size if old else 0) + len(data)
+            if usage > self.quota_bytes:
+                raise QuotaExceeded(f"{name}: {usage:,} bytes would exceed the {self.quota_bytes:,} byte quota")
+            node = self._files[name] = _Node(data)
+            self._usage = usage
+        if old is not None and old.spilled:
+            self._spiller.discard(old.spilled)
+        if self.spill_dir and self._spiller and len(data) >= self.spill_threshold:
+            node.spilled = str(self.spill_dir / f"{uuid.uuid4().hex}.bin")
+            self._spiller.spill(self, name, node)
+
+    def _spilled(self, name, node):
+        # Called by the spiller once the copy is on tmpfs
+        with self._lock:
+            if self._files.get(name) is node:
+                node.data = None
+                return True
+        return False
+
+
+class _Spiller:
+    # One background thread per server that copies large files to tmpfs
+    def __init__(self):
+        self._queue = queue.Queue()
+        self.spilled = 0
+        thread = threading.Thread(target=self._run, name="vfs-spiller", daemon=True)
+        thread.start()
+
+    def spill(self, fs, name, node):
+        self._queue.put(("spill", fs, name, node))
+
+    def discard(self, path):
+        self._queue.put(("discard", None, None, path))
+
+    def _run(self):
+        while True:
+            action, fs, name, target = self._queue.get()
+            try:
+                if action == "discard":
+                    Path(target).unlink(missing_ok=True)
+                    continue
+                data = target.data
+                if data is None or fs._files.get(name) is not target:
+                    continue
+                path = Path(target.spilled)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+                if fs._spilled(name, target):
+                    self.spilled += 1
+                else:
+                    path.unlink(missing_ok=True)
+            except OSError:
+                # The file simply stays in memory
+                if action == "spill":
+                    target.spilled = None
+
+
+def _remove_stale_spill_dirs(parent):
+    try:
+        children = list(parent.iterdir())
+    except OSError:
+        return
+    for child in children:
+        pid = child.name.partition("-")[0]
+        if pid.isdigit() and _process_exists(int(pid)):
+            continue
+        shutil.rmtree(child, ignore_errors=True)
+
+
+def _process_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class VirtualFSRegistry:
+    def __init__(self, quota_bytes=1024 * 1024, max_files=64, spill_dir=DEFAULT_SPILL_DIR, idle_seconds=30 * 60):
+        self.quota_bytes = quota_bytes
+        self.max_files = max_files
+        self.idle_seconds = idle_seconds
+        self.spill_dir = None
+        if spill_dir:
+            # One directory per server process, named after its pid, so the
+            # leftovers of servers that died without cleaning up can be found
+            _remove_stale_spill_dirs(Path(spill_dir))
+            self.spill_dir = Path(spill_dir) / f"{os.getpid()}-{uuid.uuid4().hex}"
+            # tmpfs is RAM: don't leave the files behind when the server exits
+            atexit.register(self.close)
+        self._spiller = _Spiller() if self.spill_dir else None
+        self._filesystems = OrderedDict()  # session id -> VirtualFS, least recently used first
+        self._lock = threading.Lock()
+
+    def for_session(self, session_id=None):
+        session_id = session_id or current_session_id()
+        with self._lock:
+            fs = self._filesystems.get(session_id)
+            if fs is None:
+                fs = self._filesystems[session_id] = VirtualFS(
+                    self.quota_bytes, self.max_files, self.spill_dir, spiller=self._spiller,
+                )
+            self._filesystems.move_to_end(session_id)
+            fs.last_used = time.monotonic()
+            self._sweep_idle()
+        return fs
+
+    def stats(self):
+        with self._lock:
+            usage = [fs.usage for fs in self._filesystems.values()]
+            return {
+                "sessions": len(usage),
+                "files": sum(len(fs._files) for fs in self._filesystems.values()),
+                "total_bytes": sum(usage),
+                "quota_bytes": self.quota_bytes,
+                "spilled_files": self._spiller.spilled if self._spiller else 0,
+            }
+
+    def close(self):
+        if self.spill_dir:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def _sweep_idle(self):
+        cutoff = time.monotonic() - self.idle_seconds
+        while self._filesystems:
+            oldest_id, oldest = next(iter(self._filesystems.items()))
+            if oldest.last_used >= cutoff:
+                break
+            del self._filesystems[oldest_id]
+            for node in oldest._files.values():
+                if node.spilled:
+                    self._spiller.discard(node.spilled)
@@ -0,0 +1,420 @@
+"""
+A small pool of warm worker processes for running untrusted or slow code
+away from the Streamlit script thread.
+
+Every worker is started once and then reused. Each job gets its own CPU-time,
+memory and wall-clock limits; a worker that runs over is killed and replaced,
+so one bad job never takes the server (or the other jobs) down with it.
+"""
+
+import itertools
+import math
+import os
+import pickle
+import queue
+import signal
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+try:
+    import resource
+except ImportError:  # Windows has no rlimits; only the wall-clock limit applies there
+    resource = None
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class PoolBusy(RuntimeError):
+    pass
+
+
+class Job:
+    def __init__(self, job_id, fn, args, stream, cpu_seconds, memory_mb, timeout):
+        self.id = job_id
+        self.fn = fn
+        self.args = args
+        self.stream = stream
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.timeout = timeout
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.messages = []
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()  # between cancel() and the supervisor starting the job
+        self._worker = None
+        self._cancelled = False
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def cancel(self):
+        # A queued job is dropped; a running one has its worker killed.
+        # Returns False when the job had already finished.
+        with self._lock:
+            if self.done():
+                return False
+            self._cancelled = True
+            worker = self._worker
+            if worker is None:
+                self._finish("cancelled", error="Cancelled")
+                return True
+        worker.kill()
+        return True
+
+    @property
+    def ok(self):
+        return self.status == "done"
+
+    @property
+    def latency(self):
+        # Time from submission to completion, including the time spent queued
+        end = self.finished_at or time.monotonic()
+        return end - self.submitted_at
+
+    def _finish(self, status, result=None, error=None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = time.monotonic()
+        self._done.set()
+
+
+def _set_limits(cpu_seconds, memory_mb):
+    if resource is None:
+        return
+    if memory_mb:
+        limit = memory_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    if cpu_seconds:
+        # RLIMIT_CPU counts the whole life of the process, so move the limit
+        # forward by this job's allowance instead of setting it absolutely.
+        # The limit is in whole seconds; rounding up gives the job at least
+        # its full allowance instead of whatever is left of the last second
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = math.ceil(usage.ru_utime + usage.ru_stime)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        resource.setrlimit(resource.RLIMIT_CPU, (used + cpu_seconds, hard))
+
+
+def _cap_memory(memory_mb):
+    # The hard limit can only be lowered, so once it is set here a job can't
+    # raise its own limit; per-job limits then only go down from the cap
+    if resource is None or not memory_mb:
+        return
+    limit = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _clear_limits():
+    if resource is None:
+        return
+    for limit in (resource.RLIMIT_AS, resource.RLIMIT_CPU):
+        _, hard = resource.getrlimit(limit)
+        resource.setrlimit(limit, (hard, hard))
+
+
+class _Worker:
+    # One warm interpreter. It is started with `python -m utils.workers` rather
+    # than `multiprocessing`, because Streamlit swaps the page in as `__main__`
+    # and spawned children would re-run the page script. `memory_mb` is the
+    # most memory any of its jobs can ever have.
+    def __init__(self, memory_mb):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "utils.workers", str(memory_mb or 0)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=_ROOT,
+        )
+        self.replies = queue.Queue()
+        threading.Thread(target=self._read_replies, daemon=True).start()
+
+    def _read_replies(self):
+        try:
+            while True:
+                self.replies.put(pickle.load(self.process.stdout))
+        except (EOFError, OSError, pickle.UnpicklingError):
+            self.replies.put(None)
+
+    def send(self, task):
+        data = pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL)
+        self.process.stdin.write(data)
+        self.process.stdin.flush()
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+
+    def stop(self):
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+
+class WorkerPool:
+    def __init__(self, workers=None, max_queue=500, cpu_seconds=2, memory_mb=256, timeout=5.0):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.timeout = timeout
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._busy = 0
+        self._completed = 0
+        self._failed = 0
+        self._latencies = deque(maxlen=1000)
+        self._closed = False
+        self._threads = []
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._supervise, name=f"worker-pool-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, fn, *args, stream=False, cpu_seconds=None, memory_mb=None, timeout=None):
+        # `fn` must be a module-level function so it can be sent to a worker.
+        # With `stream=True` it is called as `fn(output, *args)`, and every
+        # `output.put(value)` shows up in `job.messages` while the job runs.
+        job = Job(
+            next(self._ids), fn, args, stream,
+            cpu_seconds if cpu_seconds is not None else self.cpu_seconds,
+            memory_mb if memory_mb is not None else self.memory_mb,
+            timeout if timeout is not None else self.timeout,
+        )
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            raise PoolBusy(f"Too many jobs waiting ({self._queue.qsize()}); try again in a moment.")
+        return job
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            busy, completed, failed = self._busy, self._completed, self._failed
+        stats = {
+            "workers": self.workers,
+            "busy": busy,
+            "queue_depth": self._queue.qsize(),
+            "completed": completed,
+            "failed": failed,
+            "latency_p50_ms": None,
+            "latency_p95_ms": None,
+        }
+        if latencies:
+            stats["latency_p50_ms"] = round(statistics.median(latencies) * 1000, 1)
+            stats["latency_p95_ms"] = round(latencies[math.ceil(len(latencies) * 0.95) - 1] * 1000, 1)
+        return stats
+
+    def close(self):
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+
+    def _supervise(self):
+        worker = _Worker(self.memory_mb)
+        while True:
+            job = self._queue.get()
+            if job is None or self._closed:
+                break
+            if not worker.is_alive():
+                worker = _Worker(self.memory_mb)
+            with job._lock:
+                if job.done():
+                    continue  # cancelled while it was queued
+                job._worker = worker
+                job.status = "running"
+                job.started_at = time.monotonic()
+            with self._lock:
+                self._busy += 1
+            try:
+                worker.send((job.fn, job.args, job.stream, job.cpu_seconds, job.memory_mb))
+            except Exception as e:
+                if job._cancelled:
+                    job._finish("cancelled", error="Cancelled")
+                else:
+                    job._finish("error", error=f"Could not start job: {e}")
+            else:
+                if not self._wait_for(job, worker):
+                    worker = _Worker(self.memory_mb)
+            with self._lock:
+                self._busy -= 1
+                self._completed += 1
+                if not job.ok:
+                    self._failed += 1
+                self._latencies.append(job.latency)
+        worker.stop()
+
+    def _wait_for(self, job, worker):
+        # Returns False when the worker had to be killed and must be replaced
+        deadline = job.started_at + job.timeout
+        while True:
+            try:
+                reply = worker.replies.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                worker.kill()
+                job._finish("timeout", error=f"Timed out after {job.timeout:g} seconds")
+                return False
+            if reply is None:
+                worker.process.wait()
+                if job._cancelled:
+                    job._finish("cancelled", error="Cancelled")
+                else:
+                    job._finish("killed", error=self._death_reason(worker.process.returncode))
+                return False
+            status, payload = reply
+            if status != "message":
+                break
+            job.messages.append(payload)
+        if status == "done":
+            job._finish("done", result=payload)
+        else:
+            job._finish("error", error=payload)
+        return True
+
+    @staticmethod
+    def _death_reason(returncode):
+        if returncode == -getattr(signal, "SIGXCPU", 0):
+            return "CPU time limit exceeded"
+        if returncode == -getattr(signal, "SIGKILL", 0):
+            return "Killed (most likely the memory limit)"
+        return f"Worker exited unexpectedly (exit code {returncode})"
+
+
+class JobCache:
+    # Jobs running `fn` in `pool`, kept by their arguments with the least
+    # recently used dropped first. `get()` returns the finished job for the
+    # same arguments, the one still running, or a new one (also when the
+    # last one failed). `limits` are passed on to `pool.submit()`.
+    def __init__(self, pool, fn, max_jobs=256, **limits):
+        self.pool = pool
+        self.fn = fn
+        self.max_jobs = max_jobs
+        self.limits = limits
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, *args):
+        # Raises PoolBusy when the pool's queue is full
+        with self._lock:
+            job = self._jobs.get(args)
+            if job is not None and not (job.done() and not job.ok):
+                self._jobs.move_to_end(args)
+                return job
+            job = self._jobs[args] = self.pool.submit(self.fn, *args, **self.limits)
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+            return job
+
+    def finished(self):
+        # How many results are cached
+        with self._lock:
+            return sum(job.done() and job.ok for job in self._jobs.values())
+
+
+class JobBatch:
+    # Runs `submit(*args)` for each of `calls` at most `max_running` at a
+    # time, so one session's batch can't fill a pool. `submit` returns a Job:
+    # `pool.submit` with the function bound, or a service method that caches
+    # jobs. `jobs` lines up with `calls` and holds None for calls not yet
+    # submitted; call `top_up()` while polling to submit the next ones.
+    def __init__(self, submit, calls, max_running=1):
+        self.submit = submit
+        self.calls = list(calls)
+        self.jobs = [None] * len(self.calls)
+        self.max_running = max_running
+        self._cancelled = False
+        self.top_up()
+
+    def top_up(self):
+        if self._cancelled:
+            return
+        running = sum(job is not None and not job.done() for job in self.jobs)
+        for index, job in enumerate(self.jobs):
+            if running >= self.max_running:
+                return
+            # A cached job shared with another session may have been cancelled
+            # by that session; asking again submits it anew
+            if job is None or job.status == "cancelled":
+                try:
+                    job = self.jobs[index] = self.submit(*self.calls[index])
+                except PoolBusy:
+                    return  # the queue is full; try again on the next call
+                running += not job.done()
+
+    def done(self):
+        if self._cancelled:
+            return all(job is None or job.done() for job in self.jobs)
+        return all(job is not None and job.done() and job.status != "cancelled" for job in self.jobs)
+
+    def cancel(self):
+        self._cancelled = True
+        for job in self.jobs:
+            if job is not None:
+                job.cancel()
+
+
+class _Output:
+    # Handed to streaming jobs; mirrors the `put` of a `multiprocessing.Queue`
+    def __init__(self, replies):
+        self._replies = replies
+
+    def put(self, value):
+        _reply(self._replies, ("message", value))
+
+
+def _reply(replies, message):
+    try:
+        data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # The value could not be pickled; send its text form instead
+        data = pickle.dumps((message[0], repr(message[1])))
+    replies.write(data)
+    replies.flush()
+
+
+def _serve(memory_mb):
+    _cap_memory(memory_mb)
+    # Replies go over the original stdout; anything the job prints is discarded
+    replies = os.fdopen(os.dup(1), "wb")
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    sys.stdout = open(os.devnull, "w")
+    tasks = sys.stdin.buffer
+    while True:
+        try:
+            fn, args, stream, cpu_seconds, memory_mb = pickle.load(tasks)
+        except EOFError:
+            return
+        _set_limits(cpu_seconds, memory_mb)
+        try:
+            if stream:
+                args = (_Output(replies),) + args
+            message = ("done", fn(*args))
+        except MemoryError:
+            message = ("error", "MemoryError: memory limit exceeded")
+        except BaseException as e:
+            message = ("error", f"{type(e).__name__}: {e}")
+        finally:
+            _clear_limits()
+        _reply(replies, message)
+
+
+if __name__ == "__main__":
+    _serve(int(sys.argv[1]) if len(sys.argv) > 1 else 0)